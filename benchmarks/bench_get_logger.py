@@ -0,0 +1,85 @@
+"""
+Benchmark of control construction cost related to logger setup, i.e.:
+    >> python -m benchmarks.bench_get_logger
+
+Compares the legacy get_logger() (new FileHandler on every call) with the shared, cached queue backend. Controls are
+constructed with a mocked WebDriver, so only the Python side of the construction is measured.
+
+Last results (Python 3.13, mean of 3 runs): 70.0 [us] with the legacy get_logger(), 15.9 [us] with the shared backend.
+"""
+
+import logging
+import os
+import tempfile
+import timeit
+from unittest.mock import Mock, patch
+
+from selenium.webdriver.common.by import By
+
+from utilities.control_objects.button import Button
+
+ITERATIONS = 5000
+
+
+def _legacy_get_logger(log_file_path: str):
+    """
+    Returns get_logger() function in its legacy form - new FileHandler on every call, old handlers are not closed.
+
+    :param log_file_path: path to log file
+    :return: legacy get_logger function
+    """
+
+    def get_logger(name: str | None = None) -> logging.Logger:
+        _logger = logging.getLogger(name or __name__)
+        formatter = logging.Formatter(
+            fmt="%(asctime)s :@: %(name)s :@: %(levelname)s :@: %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+        )
+        file_handler = logging.FileHandler(log_file_path, mode="a", encoding="utf-8")
+        file_handler.setFormatter(formatter)
+        file_handler.setLevel(logging.DEBUG)
+        _logger.handlers.clear()
+        _logger.addHandler(file_handler)
+        return _logger
+
+    return get_logger
+
+
+def _construct_controls(driver: Mock) -> float:
+    """
+    Measures time of Button construction.
+
+    :param driver: mocked WebDriver
+    :return: time per construction in [us]
+    """
+    locator = (By.ID, "dummy")
+    return timeit.timeit(lambda: Button(driver, locator), number=ITERATIONS) / ITERATIONS * 1e6
+
+
+def main() -> None:
+    """
+    Runs the benchmark and prints results.
+
+    :return: None
+    """
+    driver = Mock()
+    with tempfile.TemporaryDirectory() as tmp_dir:
+        legacy = _legacy_get_logger(os.path.join(tmp_dir, "legacy.log"))
+        with (
+            patch("utilities.control_objects.base_control.get_logger", legacy),
+            patch("utilities.control_objects.button.get_logger", legacy),
+        ):
+            before = _construct_controls(driver)
+        for _logger_name in ("utilities.control_objects.base_control", "utilities.control_objects.button"):
+            for handler in logging.getLogger(_logger_name).handlers:
+                handler.close()
+            logging.getLogger(_logger_name).handlers.clear()
+
+    after = _construct_controls(driver)
+    print(f"Button construction ({ITERATIONS} iterations, mocked WebDriver):")
+    print(f"  legacy get_logger (FileHandler per call): {before:8.2f} [us]")
+    print(f"  shared queue backend (cached lookup):     {after:8.2f} [us]")
+    print(f"  speedup: {before / after:.1f}x")
+
+
+if __name__ == "__main__":
+    main()
@@ -2,7 +2,6 @@
 Configuration file for pytest fixtures.
 """
 
-import os
 from logging import Logger
 from typing import Generator
 
@@ -12,7 +11,34 @@ from selenium.webdriver.remote.webdriver import WebDriver
 from selenium.webdriver.support import expected_conditions
 from selenium.webdriver.support.wait import WebDriverWait
 
-from utilities.logger import LOGGER_FILE_PATH, get_logger
+from utilities.browser_daemon import BROWSER_DAEMON
+from utilities.browsers import CHROME_PREFS, launch_chrome, launch_edge, launch_firefox
+from utilities.concurrent_tabs import CONCURRENT_TABS
+from utilities.logger import get_logger, reset_log_file
+from utilities.page_affinity import PAGE_AFFINITY
+from utilities.user_contexts import USER_CONTEXTS
+
+pytest_plugins = [
+    "utilities.plugins.browser_daemon",
+    "utilities.plugins.command_budget",
+    "utilities.plugins.datasets",
+    "utilities.plugins.driver_cache",
+    "utilities.plugins.durations",
+    "utilities.plugins.failure_logs",
+    "utilities.plugins.impact",
+    "utilities.plugins.memory_leaks",
+    "utilities.plugins.navigation_timing",
+    "utilities.plugins.page_affinity",
+    "utilities.plugins.profiling",
+    "utilities.plugins.step_chain",
+    "utilities.plugins.structured_logs",
+    "utilities.plugins.timeline",
+    "utilities.plugins.user_contexts",
+    "utilities.plugins.webdriver_tracer",
+    # depend on the plugins above, so they have to be registered after them
+    "utilities.plugins.concurrent_tabs",
+    "utilities.plugins.flaky",
+]
 
 
 def pytest_addoption(parser) -> None:
@@ -62,8 +88,7 @@ def logging_tool(test_tools) -> Generator[TestTools]:  # pylint: disable=redefin
     :param test_tools: TestTools()
     :return: TestTools()
     """
-    if os.path.exists(LOGGER_FILE_PATH):
-        os.remove(LOGGER_FILE_PATH)
+    reset_log_file()
     test_tools.logger = get_logger(__name__)
 
     test_tools.logger.info("Logging started.")
@@ -86,23 +111,27 @@ def browser_instance(request, logging_tool) -> Generator[TestTools]:  # pylint:
     browser_name = request.config.getoption("--browser-name")
     tools.logger.info(f"Browser name: {browser_name}.")
 
-    driver: WebDriver | None = None
-    if browser_name == "firefox":
-        driver = webdriver.Firefox()
+    driver: WebDriver | None = PAGE_AFFINITY.take()
+    if driver is not None:
+        tools.logger.info("WebDriver reused from the previous test class on the same page.")
+    elif BROWSER_DAEMON.url is not None:
+        driver = BROWSER_DAEMON.lease()
+        tools.logger.info(f"WebDriver attached to a session of the browser daemon ({BROWSER_DAEMON.url}).")
+    elif CONCURRENT_TABS.address is not None:
+        driver = CONCURRENT_TABS.open_tab(browser_name)
+        tools.logger.info(f"WebDriver attached to the shared browser ({CONCURRENT_TABS.address}) in a new tab.")
+    elif USER_CONTEXTS.enabled:
+        driver = USER_CONTEXTS.open(browser_name)
+        tools.logger.info("WebDriver switched to a new user context of the long-lived browser.")
+    elif browser_name == "firefox":
+        driver = launch_firefox()
     elif browser_name == "safari":
         driver = webdriver.Safari()
     elif browser_name == "edge":
-        driver = webdriver.Edge()
+        driver = launch_edge()
     else:  # default option is "chrome"
-        options = webdriver.ChromeOptions()
-        prefs = {
-            "profile.password_manager_leak_detection": False,
-            "excludeSwitches": ["enable-logging"],
-        }
-        tools.logger.info(f"Custom browser preferences: {prefs}.")
-        options.add_experimental_option("prefs", prefs)
-
-        driver = webdriver.Chrome(options=options)
+        tools.logger.info(f"Custom browser preferences: {CHROME_PREFS}.")
+        driver = launch_chrome()
 
     driver.maximize_window()
     driver.implicitly_wait(5)
@@ -110,8 +139,12 @@ def browser_instance(request, logging_tool) -> Generator[TestTools]:  # pylint:
     tools.driver = driver
     tools.logger.info(f"WebDriver created - instance: {driver.name}.")
     yield tools
-    tools.driver.quit()
-    tools.logger.info("WebDriver quitted.")
+    if USER_CONTEXTS.enabled:
+        USER_CONTEXTS.close()
+        tools.logger.info("User context removed.")
+    elif not PAGE_AFFINITY.park(driver):
+        tools.driver.quit()
+        tools.logger.info("WebDriver quitted.")
 
 
 @pytest.fixture(scope="class")
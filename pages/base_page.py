@@ -2,9 +2,76 @@
 Contains BasePage class as a creator class for Page Objects factory pattern
 """
 
+from typing import Iterator, List, NamedTuple, Tuple
+from urllib.parse import urldefrag
+
+from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
+from selenium.webdriver.support import expected_conditions
+from selenium.webdriver.support.wait import WebDriverWait
 
 from utilities.logger import get_logger
+from utilities.navigation_timing import NAVIGATION_TIMING
+from utilities.page_affinity import PAGE_AFFINITY
+
+# JS snippet returning page metrics, appended to every viewport script, so each call costs a single round trip.
+_PAGE_METRICS_JS = (
+    "return {"
+    "scroll_width: document.body.scrollWidth, "
+    "scroll_height: document.body.scrollHeight, "
+    "viewport_width: window.innerWidth, "
+    "viewport_height: window.innerHeight, "
+    "scroll_x: Math.round(window.scrollX), "
+    "scroll_y: Math.round(window.scrollY)"
+    "};"
+)
+
+# Scrolls by the given delta, then polls (in the browser) until elements matching the locator appear beyond the already
+# seen ones or the timeout expires. Returns the new elements together with page metrics.
+_SCROLL_AND_COLLECT_JS = (
+    """
+    const [isXPath, selector, seen, dx, dy, timeout, callback] = arguments;
+    const find = () => {
+        if (!isXPath) {
+            return Array.from(document.querySelectorAll(selector));
+        }
+        const snapshot = document.evaluate(selector, document, null, XPathResult.ORDERED_NODE_SNAPSHOT_TYPE, null);
+        return Array.from({length: snapshot.snapshotLength}, (_, i) => snapshot.snapshotItem(i));
+    };
+    const metrics = () => { %s };
+    window.scrollBy(dx, dy);
+    const deadline = Date.now() + timeout;
+    const poll = () => {
+        const elements = find();
+        if (elements.length > seen || Date.now() >= deadline) {
+            callback({elements: elements.slice(seen), metrics: metrics()});
+        } else {
+            setTimeout(poll, 50);
+        }
+    };
+    poll();
+"""
+    % _PAGE_METRICS_JS
+)
+
+
+class PageMetrics(NamedTuple):
+    """
+    Page and viewport dimensions with current scroll position, all in [px].
+    """
+
+    scroll_width: int
+    scroll_height: int
+    viewport_width: int
+    viewport_height: int
+    scroll_x: int
+    scroll_y: int
+
+    @property
+    def at_bottom(self) -> bool:
+        """Returns True if viewport reached the bottom of the page."""
+        return self.scroll_y + self.viewport_height >= self.scroll_height
 
 
 class BasePage:
@@ -13,6 +80,9 @@ class BasePage:
     """
 
     URL = ""
+    # Hash-routed single-page app views set it to True, so switching between them does not reload the document.
+    SPA_ROUTE = False
+    READY_TIMEOUT = 10
 
     def __init__(self, driver: WebDriver, url: str = URL) -> None:
         """
@@ -22,16 +92,62 @@ class BasePage:
         """
         self.driver = driver
         self.url = url
+        # Element that has to be present in DOM before the page is considered loaded (None - no readiness check).
+        self.ready_locator: Tuple[str, str] | None = None
         self.logger = get_logger(__name__)
 
     def go_to(self) -> None:
         """
-        Open webpage in the browser.
+        Open webpage in the browser. SPA routes are switched in-app (by changing ``location.hash``) when the browser
+        already displays the same base document, otherwise the whole document is loaded. Navigation is skipped if the
+        page has been left loaded by the previous read-only test class (see: utilities/plugins/page_affinity.py).
 
         :return: None
         """
-        self.logger.debug("Go to '%s'", self.url)
-        self.driver.get(self.url)
+        if PAGE_AFFINITY.visit(self):
+            self.logger.debug("'%s' already loaded by the previous test class", self.url)
+            return
+        route_start = self._switch_route() if self.SPA_ROUTE else None
+        if route_start is not None:
+            self.logger.debug("Switch SPA route to '%s'", self.url)
+        else:
+            self.logger.debug("Go to '%s'", self.url)
+            self.driver.get(self.url)
+        self.wait_until_ready()
+        NAVIGATION_TIMING.record(self.driver, type(self).__name__, route_start)
+
+    def _switch_route(self) -> float | None:
+        """
+        Changes ``location.hash`` if current document is the base document of the page (single round trip).
+
+        :return: performance.now() mark of route change if route has been switched in-app, None if full page load is
+            required.
+        """
+        document, fragment = urldefrag(self.url)
+        route_start = self.driver.execute_script(
+            "if (window.location.href.split('#')[0] !== arguments[0]) { return null; }"
+            "const routeStart = performance.now();"
+            "if (window.location.hash !== '#' + arguments[1]) { window.location.hash = arguments[1]; }"
+            "return routeStart;",
+            document,
+            fragment,
+        )
+        if isinstance(route_start, (int, float)):
+            return float(route_start)
+        return None
+
+    def wait_until_ready(self) -> None:
+        """
+        Waits for the page readiness condition - presence of ``ready_locator`` element.
+
+        :return: None
+        """
+        if self.ready_locator is None:
+            return
+        self.logger.debug("Wait until %s is ready", self)
+        WebDriverWait(self.driver, self.READY_TIMEOUT).until(
+            expected_conditions.presence_of_element_located(self.ready_locator)
+        )
 
     def get_title(self) -> str:
         """
@@ -66,31 +182,126 @@ class BasePage:
             return width
         raise TypeError(f"Received unexpected value type:\n TYPE: {type(width)}\n EXPECTED: <class 'int'>\n")
 
-    def scroll(self, x: int = 0, y: int = 0) -> None:
+    def get_metrics(self) -> PageMetrics:
+        """
+        Gets page size, viewport size and scroll position of current page in a single script call.
+
+        :return: PageMetrics
+        """
+        self.logger.debug("Get metrics for %s", self)
+        return self._execute_viewport_script(_PAGE_METRICS_JS)
+
+    def scroll(self, x: int = 0, y: int = 0) -> PageMetrics:
         """
         Scrolls current page. The origin of the coordinate system is in top-left corner of the page.
 
         :param x: horizontal value
         :param y: vertical value
-        :return: None
+        :return: page metrics after scrolling
         """
         self.logger.debug("Scroll to x:'%s', y:'%s' action for %s", x, y, self)
-        self.driver.execute_script(f"window.scrollTo({x}, {y});")
+        return self._execute_viewport_script("window.scrollTo(arguments[0], arguments[1]);" + _PAGE_METRICS_JS, x, y)
+
+    def scroll_by(self, dx: int = 0, dy: int = 0) -> PageMetrics:
+        """
+        Scrolls current page by given delta.
+
+        :param dx: horizontal delta
+        :param dy: vertical delta
+        :return: page metrics after scrolling
+        """
+        self.logger.debug("Scroll by dx:'%s', dy:'%s' action for %s", dx, dy, self)
+        return self._execute_viewport_script("window.scrollBy(arguments[0], arguments[1]);" + _PAGE_METRICS_JS, dx, dy)
+
+    def scroll_to_element(self, web_element: WebElement) -> PageMetrics:
+        """
+        Scrolls current page, so the element is in the center of the viewport.
+
+        :param web_element: element to scroll to
+        :return: page metrics after scrolling
+        """
+        self.logger.debug("Scroll to element action for %s", self)
+        return self._execute_viewport_script(
+            "arguments[0].scrollIntoView({block: 'center', inline: 'nearest'});" + _PAGE_METRICS_JS, web_element
+        )
 
-    def scroll_to_bottom(self) -> None:
+    def scroll_to_bottom(self) -> PageMetrics:
         """
         Scrolls to the bottom of the page.
 
-        :return: None
+        :return: page metrics after scrolling
         """
         self.logger.debug("Scroll to bottom action for %s", self)
-        self.scroll(y=self.get_height())
+        return self._execute_viewport_script("window.scrollTo(0, document.body.scrollHeight);" + _PAGE_METRICS_JS)
 
-    def scroll_to_top(self) -> None:
+    def scroll_to_top(self) -> PageMetrics:
         """
         Scrolls to the top of the page.
 
-        :return: None
+        :return: page metrics after scrolling
         """
         self.logger.debug("Scroll to top action for %s", self)
-        self.scroll()
+        return self.scroll()
+
+    def iter_scroll(
+        self, locator: Tuple[str, str], step: int | None = None, timeout_ms: int = 2000
+    ) -> Iterator[List[WebElement]]:
+        """
+        Scrolls the page down incrementally and yields elements loaded lazily after each scroll step. Elements
+        present before the first step are yielded first. Iteration stops at the bottom of the page (or once scrolling
+        no longer moves the viewport) when no new elements appear within the timeout. Each step costs a single (async)
+        script call.
+
+        :param locator: pair of By strategy and locator of list items, i.e.: (By.CSS_SELECTOR, ".product")
+        :param step: scroll step in [px] (default: viewport height)
+        :param timeout_ms: how long to wait for new elements after each scroll step
+        :return: generator of lists of newly loaded elements
+        """
+        self.logger.debug("Incremental scroll for %s on %s", locator, self)
+        is_xpath, selector = self._to_script_selector(locator)
+        seen = 0
+        dy = 0
+        scroll_y = None
+        while True:
+            result = self.driver.execute_async_script(
+                _SCROLL_AND_COLLECT_JS, is_xpath, selector, seen, 0, dy, timeout_ms
+            )
+            metrics = PageMetrics(**result["metrics"])
+            elements: List[WebElement] = result["elements"]
+            if elements:
+                seen += len(elements)
+                yield elements
+            elif dy and (metrics.at_bottom or metrics.scroll_y == scroll_y):
+                # bottom of the page or the page does not scroll (i.e. content is in a scrollable container)
+                return
+            scroll_y = metrics.scroll_y
+            dy = step or metrics.viewport_height
+
+    def _execute_viewport_script(self, script: str, *args) -> PageMetrics:
+        metrics = self.driver.execute_script(script, *args)
+        if isinstance(metrics, dict):
+            return PageMetrics(**metrics)
+        raise TypeError(f"Received unexpected value type:\n TYPE: {type(metrics)}\n EXPECTED: <class 'dict'>\n")
+
+    @staticmethod
+    def _to_script_selector(locator: Tuple[str, str]) -> Tuple[bool, str]:
+        """
+        Converts locator to a selector usable in JS, the same way WebDriver does for find_element().
+
+        :param locator: pair of By strategy and locator
+        :return: pair of XPath flag and selector
+        """
+        by, value = locator
+        if by == By.XPATH:
+            return True, value
+        if by == By.CSS_SELECTOR:
+            return False, value
+        if by == By.ID:
+            return False, f'[id="{value}"]'
+        if by == By.NAME:
+            return False, f'[name="{value}"]'
+        if by == By.CLASS_NAME:
+            return False, f".{value}"
+        if by == By.TAG_NAME:
+            return False, value
+        raise ValueError(f"Locator strategy '{by}' is not supported in scripts.")
@@ -9,10 +9,12 @@ from typing import List
 from selenium.webdriver import Keys
 from selenium.webdriver.common.by import By
 from selenium.webdriver.remote.webdriver import WebDriver
+from selenium.webdriver.remote.webelement import WebElement
 
 from pages.base_page import BasePage
 from pages.rsa_pages import PROTO_COMMERCE_SHOP_PAGE
 from utilities.base_product import BaseProduct
+from utilities.command_budget import command_budget
 from utilities.control_objects.button import Button
 from utilities.control_objects.checkbox_radiobutton import Checkbox
 from utilities.control_objects.dropdown import DropdownDynamic
@@ -27,6 +29,33 @@ class _AngularPracticeShopPage(BasePage):
 
     URL = PROTO_COMMERCE_SHOP_PAGE
 
+    # Milliseconds to wait for Angular stability - apps with polling timers never become stable.
+    STABLE_TIMEOUT_MS = 5000
+
+    # Resolves (through the async script callback) once every Angular application on the page is stable, i.e. there
+    # are no pending macrotasks (HTTP requests, timers) and change detection is done. Resolves with "unavailable" on
+    # non-Angular pages and with "timeout" when the apps do not become stable in time.
+    _WHEN_STABLE_SCRIPT = """
+        const [timeout, callback] = arguments;
+        if (typeof window.getAllAngularTestabilities !== 'function') {
+            callback('unavailable');
+            return;
+        }
+        const testabilities = window.getAllAngularTestabilities();
+        let pending = testabilities.length;
+        if (pending === 0) {
+            callback('stable');
+            return;
+        }
+        setTimeout(() => callback('timeout'), timeout);
+        testabilities.forEach((testability) => testability.whenStable(() => {
+            pending -= 1;
+            if (pending === 0) {
+                callback('stable');
+            }
+        }));
+    """
+
     def __init__(self, driver: WebDriver, url=URL) -> None:
         """
 
@@ -35,6 +64,29 @@ class _AngularPracticeShopPage(BasePage):
         """
         super().__init__(driver, url)
 
+    def wait_until_stable(self) -> bool:
+        """
+        Waits until Angular framework is idle, using Angular's testability API (single async script round trip). Called
+        once the page is ready and after actions changing the application state, not in getters.
+
+        :return: True if Angular reported stability, False if Angular testability API is not available on the page or
+            the application did not become stable within STABLE_TIMEOUT_MS.
+        """
+        self.logger.debug("Wait until Angular is stable for %s", self)
+        status = self.driver.execute_async_script(self._WHEN_STABLE_SCRIPT, self.STABLE_TIMEOUT_MS)
+        if status == "timeout":
+            self.logger.warning("Angular did not become stable within %s[ms] for %s", self.STABLE_TIMEOUT_MS, self)
+        return status == "stable"
+
+    def wait_until_ready(self) -> None:
+        """
+        Waits for the page readiness condition and then for Angular stability.
+
+        :return: None
+        """
+        super().wait_until_ready()
+        self.wait_until_stable()
+
 
 class AngularPracticeShopPage(_AngularPracticeShopPage):
     """
@@ -53,7 +105,7 @@ class AngularPracticeShopPage(_AngularPracticeShopPage):
     @property
     def checkout_button(self) -> Button:
         """Returns checkout button."""
-        return Button(self.driver, self._locators.CHECKOUT_BUTTON)
+        return Button(self.driver, self._locators.CHECKOUT_BUTTON, owner=self)
 
     @property
     def checkout_view(self) -> CheckoutViewPage:
@@ -85,8 +137,10 @@ class AngularPracticeShopPage(_AngularPracticeShopPage):
             name = product.find_element(By.XPATH, "div/h4/a").text
             if name == product_name:
                 product.find_element(By.XPATH, "div/button").click()
+                self.wait_until_stable()
                 break
 
+    @command_budget(2)
     def get_number_of_products_in_cart(self) -> int:
         """
         Extract number of products in the cart from text of the button element.
@@ -106,7 +160,9 @@ class AngularPracticeShopPage(_AngularPracticeShopPage):
         """
         self.logger.debug("Go to CheckoutViewPage")
         self.checkout_button.click()
-        return self.checkout_view
+        checkout_view = self.checkout_view
+        checkout_view.wait_until_stable()
+        return checkout_view
 
 
 class _CheckoutProduct(BaseProduct):
@@ -114,6 +170,15 @@ class _CheckoutProduct(BaseProduct):
     Represents product details from checkout view page table.
     """
 
+    def __init__(self, web_element: WebElement, view: CheckoutViewPage) -> None:
+        """
+
+        :param web_element: web element containing product details
+        :param view: checkout view containing the product - waits for Angular after product changes
+        """
+        super().__init__(web_element)
+        self.view = view
+
     @property
     def name(self) -> str:
         self.logger.debug("Get product name")
@@ -151,6 +216,7 @@ class _CheckoutProduct(BaseProduct):
         """
         self.logger.debug("Remove product")
         self.web_element.find_element(By.CSS_SELECTOR, "button[class='btn btn-danger']").click()
+        self.view.wait_until_stable()
 
     def set_quantity(self, quantity: float) -> None:
         """
@@ -164,6 +230,7 @@ class _CheckoutProduct(BaseProduct):
         elem.clear()
         elem.send_keys(str(quantity))
         elem.send_keys(Keys.RETURN)
+        self.view.wait_until_stable()
 
         if self.quantity != quantity:
             raise ValueError(f"Quantity did not change correctly. Got {self.quantity} instead of {quantity}.")
@@ -186,13 +253,14 @@ class CheckoutViewPage(_AngularPracticeShopPage):
     @property
     def checkout_button(self) -> Button:
         """Returns checkout button."""
-        return Button(self.driver, self._locators.CHECKOUT_BUTTON)
+        return Button(self.driver, self._locators.CHECKOUT_BUTTON, owner=self)
 
     @property
     def continue_shopping_button(self) -> Button:
         """Returns 'Continue Shopping' button."""
-        return Button(self.driver, self._locators.CONTINUE_SHOPPING_BUTTON)
+        return Button(self.driver, self._locators.CONTINUE_SHOPPING_BUTTON, owner=self)
 
+    @command_budget(1)
     def get_products(self) -> List[_CheckoutProduct]:
         """
         Returns list of the products from checkout view.
@@ -201,7 +269,7 @@ class CheckoutViewPage(_AngularPracticeShopPage):
         """
         self.logger.debug("Get list of _CheckoutProduct")
         elems = self.driver.find_elements(By.XPATH, "//input[@class='form-control']/parent::td/parent::tr")
-        return [_CheckoutProduct(elem) for elem in elems]
+        return [_CheckoutProduct(elem, self) for elem in elems]
 
     def go_to_delivery(self) -> DeliveryLocationViewPage:
         """
@@ -211,8 +279,11 @@ class CheckoutViewPage(_AngularPracticeShopPage):
         """
         self.logger.debug("Go to DeliveryLocationViewPage")
         self.checkout_button.click()
-        return DeliveryLocationViewPage(self.driver)
+        delivery_view = DeliveryLocationViewPage(self.driver)
+        delivery_view.wait_until_stable()
+        return delivery_view
 
+    @command_budget(2)
     def get_total_price(self) -> float:
         """
         Returns cart total_price price - should be equal to sum of total_price prices of each product.
@@ -244,27 +315,28 @@ class DeliveryLocationViewPage(_AngularPracticeShopPage):
             dropdown_locator=self._locators.DYNAMIC_DROPDOWN,
             dropdown_list_locator=self._locators.DROPDOWN_LIST,
             dropdown_list_item_locator=self._locators.DROPDOWN_LIST_ITEM,
+            owner=self,
         )
 
     @property
     def terms_and_conditions_checkbox(self) -> Checkbox:
         """Returns checkbox for terms and conditions."""
-        return Checkbox(self.driver, self._locators.TERMS_AND_CONDITIONS_CHECKBOX)
+        return Checkbox(self.driver, self._locators.TERMS_AND_CONDITIONS_CHECKBOX, owner=self)
 
     @property
     def purchase_button(self) -> Button:
         """Returns 'Purchase' button."""
-        return Button(self.driver, self._locators.PURCHASE_BUTTON)
+        return Button(self.driver, self._locators.PURCHASE_BUTTON, owner=self)
 
     @property
     def alert_message_label(self) -> Label:
         """Returns purchase message label."""
-        return Label(self.driver, self._locators.ALERT_MESSAGE)
+        return Label(self.driver, self._locators.ALERT_MESSAGE, owner=self)
 
     @property
     def alert_message_close_button(self) -> Button:
         """Returns purchase message close button."""
-        return Button(self.driver, self._locators.ALERT_BUTTON)
+        return Button(self.driver, self._locators.ALERT_BUTTON, owner=self)
 
 
 class _AngularPracticeShopPageLocators:
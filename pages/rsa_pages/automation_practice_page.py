@@ -41,17 +41,17 @@ class AutomationPracticePage(BasePage):
     @property
     def radiobutton_1(self) -> Radiobutton:
         """Returns 'Radio1' radiobutton."""
-        return Radiobutton(self.driver, self._locators.RADIOBUTTON_1)
+        return Radiobutton(self.driver, self._locators.RADIOBUTTON_1, owner=self)
 
     @property
     def radiobutton_2(self) -> Radiobutton:
         """Returns 'Radio2' radiobutton."""
-        return Radiobutton(self.driver, self._locators.RADIOBUTTON_2)
+        return Radiobutton(self.driver, self._locators.RADIOBUTTON_2, owner=self)
 
     @property
     def radiobutton_3(self) -> Radiobutton:
         """Returns 'Radio3' radiobutton."""
-        return Radiobutton(self.driver, self._locators.RADIOBUTTON_3)
+        return Radiobutton(self.driver, self._locators.RADIOBUTTON_3, owner=self)
 
     @property
     def dropdown_dynamic(self) -> DropdownDynamic:
@@ -61,97 +61,98 @@ class AutomationPracticePage(BasePage):
             dropdown_locator=self._locators.DYNAMIC_DROPDOWN,
             dropdown_list_locator=self._locators.DYNAMIC_DROPDOWN_LIST,
             dropdown_list_item_locator=self._locators.DYNAMIC_DROPDOWN_LIST_ITEM,
+            owner=self,
         )
 
     @property
     def dropdown_static(self) -> DropdownStatic:
         """Returns static dropdown."""
-        return DropdownStatic(self.driver, self._locators.STATIC_DROPDOWN)
+        return DropdownStatic(self.driver, self._locators.STATIC_DROPDOWN, owner=self)
 
     @property
     def checkbox_1(self) -> Checkbox:
         """Returns 'Option1' checkbox."""
-        return Checkbox(self.driver, self._locators.CHECKBOX_1)
+        return Checkbox(self.driver, self._locators.CHECKBOX_1, owner=self)
 
     @property
     def checkbox_2(self) -> Checkbox:
         """Returns 'Option2' checkbox."""
-        return Checkbox(self.driver, self._locators.CHECKBOX_2)
+        return Checkbox(self.driver, self._locators.CHECKBOX_2, owner=self)
 
     @property
     def checkbox_3(self) -> Checkbox:
         """Returns 'Option3' checkbox."""
-        return Checkbox(self.driver, self._locators.CHECKBOX_3)
+        return Checkbox(self.driver, self._locators.CHECKBOX_3, owner=self)
 
     @property
     def open_window_button(self) -> Button:
         """Returns 'Open Window' button."""
-        return Button(self.driver, self._locators.OPEN_WINDOW_BUTTON)
+        return Button(self.driver, self._locators.OPEN_WINDOW_BUTTON, owner=self)
 
     @property
     def open_tab_button(self) -> Button:
         """Returns 'Open Tab' button."""
-        return Button(self.driver, self._locators.OPEN_TAB_BUTTON)
+        return Button(self.driver, self._locators.OPEN_TAB_BUTTON, owner=self)
 
     @property
     def alert_textbox(self) -> Textbox:
         """Returns alert example textbox."""
-        return Textbox(self.driver, self._locators.ALERT_TEXTBOX)
+        return Textbox(self.driver, self._locators.ALERT_TEXTBOX, owner=self)
 
     @property
     def alert_button(self) -> Button:
         """Returns 'Alert' button."""
-        return Button(self.driver, self._locators.ALERT_BUTTON)
+        return Button(self.driver, self._locators.ALERT_BUTTON, owner=self)
 
     @property
     def popup_button(self) -> Button:
         """Returns 'Confirm' button."""
-        return Button(self.driver, self._locators.POPUP_BUTTON)
+        return Button(self.driver, self._locators.POPUP_BUTTON, owner=self)
 
     @property
     def table_static(self) -> Table:
         """Returns 'Web Table Example' table."""
-        return Table(self.driver, self._locators.WEB_TABLE_STATIC, HeadingsTableStrategy)
+        return Table(self.driver, self._locators.WEB_TABLE_STATIC, HeadingsTableStrategy, owner=self)
 
     @property
     def table_fixed_header(self) -> Table:
         """Returns 'Web Table Fixed header' table."""
-        return Table(self.driver, self._locators.WEB_TABLE_FIXED_HEADER, HeaderBodyTableStrategy)
+        return Table(self.driver, self._locators.WEB_TABLE_FIXED_HEADER, HeaderBodyTableStrategy, owner=self)
 
     @property
     def table_fixed_label(self) -> Label:
         """Returns 'Web Table Fixed header' footer label."""
-        return Label(self.driver, self._locators.WEB_TABLE_FIXED_HEADER_LABEL)
+        return Label(self.driver, self._locators.WEB_TABLE_FIXED_HEADER_LABEL, owner=self)
 
     @property
     def hide_button(self) -> Button:
         """Returns 'Hide' button."""
-        return Button(self.driver, self._locators.HIDE_BUTTON)
+        return Button(self.driver, self._locators.HIDE_BUTTON, owner=self)
 
     @property
     def show_button(self) -> Button:
         """Returns 'Show' button."""
-        return Button(self.driver, self._locators.SHOW_BUTTON)
+        return Button(self.driver, self._locators.SHOW_BUTTON, owner=self)
 
     @property
     def hide_show_textbox(self) -> Textbox:
         """Returns 'Hide/Show Example' textbox."""
-        return Textbox(self.driver, self._locators.HIDE_SHOW_TEXTBOX)
+        return Textbox(self.driver, self._locators.HIDE_SHOW_TEXTBOX, owner=self)
 
     @property
     def mouse_hover_button(self) -> Button:
         """Returns 'Mouse Hover' button."""
-        return Button(self.driver, self._locators.MOUSE_HOVER_BUTTON)
+        return Button(self.driver, self._locators.MOUSE_HOVER_BUTTON, owner=self)
 
     @property
     def mouse_hover_content_top(self) -> Label:
         """Returns 'Mouse Hover' list content label."""
-        return Label(self.driver, self._locators.MOUSE_HOVER_CONTENT_TOP)
+        return Label(self.driver, self._locators.MOUSE_HOVER_CONTENT_TOP, owner=self)
 
     @property
     def mouse_hover_content_reload(self) -> Label:
         """Returns 'Mouse Hover' list content label."""
-        return Label(self.driver, self._locators.MOUSE_HOVER_CONTENT_RELOAD)
+        return Label(self.driver, self._locators.MOUSE_HOVER_CONTENT_RELOAD, owner=self)
 
     @property
     def iframe(self) -> IFrame:
@@ -161,7 +162,7 @@ class AutomationPracticePage(BasePage):
     @property
     def blinking_text_link(self) -> Link:
         """Returns blinking text link."""
-        return Link(self.driver, self._locators.BLINKING_TEXT_LINK)
+        return Link(self.driver, self._locators.BLINKING_TEXT_LINK, owner=self)
 
 
 class _AutomationPracticePageLocators:
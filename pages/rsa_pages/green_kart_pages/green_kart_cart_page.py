@@ -25,6 +25,7 @@ class GreenKartCheckoutPage(BasePage):
     """
 
     URL = GREEN_KART_CART_PAGE
+    SPA_ROUTE = True
 
     def __init__(self, driver: WebDriver, url=URL) -> None:
         """
@@ -34,22 +35,23 @@ class GreenKartCheckoutPage(BasePage):
         """
         super().__init__(driver, url)
         self._locators = _GreenKartCheckoutPageLocators
+        self.ready_locator = self._locators.PRODUCTS_TABLE
         self.logger = get_logger(__name__)
 
     @property
     def dicount_code_textbox(self) -> Textbox:
         """Returns dicount code textbox."""
-        return Textbox(self.driver, self._locators.DISCOUNT_CODE_TEXTBOX)
+        return Textbox(self.driver, self._locators.DISCOUNT_CODE_TEXTBOX, owner=self)
 
     @property
     def discount_code_apply_button(self) -> Button:
         """Returns discount code apply button."""
-        return Button(self.driver, self._locators.DISCOUNT_CODE_APPLY_BUTTON)
+        return Button(self.driver, self._locators.DISCOUNT_CODE_APPLY_BUTTON, owner=self)
 
     @property
     def place_order_button(self) -> Button:
         """Returns 'Place Order' button."""
-        return Button(self.driver, self._locators.PLACE_ORDER_BUTTON)
+        return Button(self.driver, self._locators.PLACE_ORDER_BUTTON, owner=self)
 
     def get_number_of_items(self) -> float:
         """
@@ -68,7 +70,7 @@ class GreenKartCheckoutPage(BasePage):
 
         :return: total price of the cart
         """
-        value = Label(self.driver, self._locators.TOTAL_AMOUNT_LABEL).get_text()
+        value = Label(self.driver, self._locators.TOTAL_AMOUNT_LABEL, owner=self).get_text()
         return float(value)
 
     def get_discount_value(self) -> float:
@@ -77,7 +79,7 @@ class GreenKartCheckoutPage(BasePage):
 
         :return: percent value of the discount
         """
-        value = Label(self.driver, self._locators.DISCOUNT_LABEL).get_text().strip("%")
+        value = Label(self.driver, self._locators.DISCOUNT_LABEL, owner=self).get_text().strip("%")
         return float(value)
 
     def get_total_after_discount(self) -> float:
@@ -86,7 +88,7 @@ class GreenKartCheckoutPage(BasePage):
 
         :return: total price of the cart after discount
         """
-        value = Label(self.driver, self._locators.TOTAL_AFTER_DISCOUNT_LABEL).get_text()
+        value = Label(self.driver, self._locators.TOTAL_AFTER_DISCOUNT_LABEL, owner=self).get_text()
         return float(value)
 
     def get_products(self) -> Dict[str, _CheckoutProduct]:
@@ -23,6 +23,7 @@ class GreenKartDeliveryPage(BasePage):
     """
 
     URL = GREEN_KART_DELIVERY_PAGE
+    SPA_ROUTE = True
 
     def __init__(self, driver: WebDriver, url=URL) -> None:
         """
@@ -32,28 +33,29 @@ class GreenKartDeliveryPage(BasePage):
         """
         super().__init__(driver, url)
         self._locators = _GreenKartDeliveryPageLocators
+        self.ready_locator = self._locators.PROCEED_BUTTON
         self.confirmation_view = _ConfirmationViewPage(self.driver)
         self.logger = get_logger(__name__)
 
     @property
     def select_country_dropdown(self) -> DropdownStatic:
         """Returns 'Choose Country' dropdown."""
-        return DropdownStatic(self.driver, self._locators.CHOOSE_COUNTRY_DROPDOWN)
+        return DropdownStatic(self.driver, self._locators.CHOOSE_COUNTRY_DROPDOWN, owner=self)
 
     @property
     def terms_and_conditions_checkbox(self) -> Checkbox:
         """Returns 'Agree to the Terms and Conditions' checkbox."""
-        return Checkbox(self.driver, self._locators.TERMS_AND_CONDITIONS_CHECKBOX)
+        return Checkbox(self.driver, self._locators.TERMS_AND_CONDITIONS_CHECKBOX, owner=self)
 
     @property
     def terms_and_conditions_alert_label(self) -> Label:
         """Returns no consent to the Terms and Conditions alert label."""
-        return Label(self.driver, self._locators.TERMS_AND_CONDITIONS_ALERT_LABEL)
+        return Label(self.driver, self._locators.TERMS_AND_CONDITIONS_ALERT_LABEL, owner=self)
 
     @property
     def proceed_button(self) -> Button:
         """Returns 'Proceed' button."""
-        return Button(self.driver, self._locators.PROCEED_BUTTON)
+        return Button(self.driver, self._locators.PROCEED_BUTTON, owner=self)
 
     def proceed(self) -> None | _ConfirmationViewPage:
         """
@@ -84,12 +86,12 @@ class _ConfirmationViewPage(BasePage):
     @property
     def success_message_label(self) -> Label:
         """Returns success message label."""
-        return Label(self.driver, self._locators.SUCCESS_MSG_LABEL)
+        return Label(self.driver, self._locators.SUCCESS_MSG_LABEL, owner=self)
 
     @property
     def home_link(self) -> Link:
         """Returns home page link."""
-        return Link(self.driver, self._locators.HOME_LINK)
+        return Link(self.driver, self._locators.HOME_LINK, owner=self)
 
 
 class _GreenKartDeliveryPageLocators:
@@ -16,6 +16,7 @@ from pages.base_page import BasePage
 from pages.rsa_pages.green_kart_pages import GREEN_KART_MAIN_PAGE
 from pages.rsa_pages.green_kart_pages.green_kart_cart_page import GreenKartCheckoutPage
 from utilities.base_product import BaseProduct
+from utilities.command_budget import command_budget
 from utilities.control_objects.button import Button
 from utilities.control_objects.label import Label
 from utilities.control_objects.textbox import Textbox
@@ -28,6 +29,7 @@ class GreenKartMainPage(BasePage):
     """
 
     URL = GREEN_KART_MAIN_PAGE
+    SPA_ROUTE = True
 
     def __init__(self, driver: WebDriver, url=URL) -> None:
         """
@@ -37,26 +39,28 @@ class GreenKartMainPage(BasePage):
         """
         super().__init__(driver, url)
         self._locators = _GreenKartMainPageLocators
+        self.ready_locator = self._locators.PRODUCTS
         self.cart_preview_view = _CartPreviewView(self.driver)
         self.logger = get_logger(__name__)
 
     @property
     def search_form_textbox(self) -> Textbox:
         """Returns search form textbox."""
-        return Textbox(self.driver, self._locators.SEARCH_FORM_TEXTBOX)
+        return Textbox(self.driver, self._locators.SEARCH_FORM_TEXTBOX, owner=self)
 
     @property
     def search_form_button(self) -> Button:
         """Returns search button."""
-        return Button(self.driver, self._locators.SEARCH_FORM_BUTTON)
+        return Button(self.driver, self._locators.SEARCH_FORM_BUTTON, owner=self)
 
     @property
     def cart_preview_button(self) -> Button:
         """Returns cart preview button."""
-        return Button(self.driver, self._locators.CART_ICON)
+        return Button(self.driver, self._locators.CART_ICON, owner=self)
 
+    @command_budget(3)
     def _get_cart_info(self, locator: Tuple[str, str]) -> float:
-        label = Label(self.driver, locator)
+        label = Label(self.driver, locator, owner=self)
         return float(label.get_text())
 
     def get_cart_items_number(self) -> float:
@@ -214,7 +218,7 @@ class _CartPreviewView:
     @property
     def proceed_to_checkout_button(self) -> Button:
         """Returns 'PROCEED TO CHECKOUT' button."""
-        return Button(self.driver, self._locators.PROCEED_TO_CHECKOUT_BUTTON)
+        return Button(self.driver, self._locators.PROCEED_TO_CHECKOUT_BUTTON, owner=self)
 
     def get_products(self) -> Dict[str, _CartPreviewProduct]:
         """
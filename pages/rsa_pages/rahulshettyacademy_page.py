@@ -31,7 +31,7 @@ class RahulShettyAcademyPage(BasePage):
     @property
     def courses_link(self) -> Link:
         """Returns link to courses page."""
-        return Link(self.driver, self._locators.COURSES_LINK)
+        return Link(self.driver, self._locators.COURSES_LINK, owner=self)
 
 
 class _RahulShettyAcademyPageLocators:
@@ -2,18 +2,14 @@
 End-to-end tests of Angular Practice Shop page.
 """
 
-import json
 from typing import Any, Dict
 
 import pytest
 from selenium.common import NoSuchElementException
 
 from pages.rsa_pages.angular_practice_shop_page import AngularPracticeShopPage
-from utilities.data_class import DataClass
 
-TEST_DATA_PATH = "./test_data/test_angular_practice_shop_e2e.json"
-with open(file=TEST_DATA_PATH, encoding="utf-8") as json_file:
-    data = json.load(json_file)
+TEST_DATA_FILE = "test_angular_practice_shop_e2e.json"
 
 
 @pytest.fixture(scope="class")
@@ -27,8 +23,9 @@ def class_fixture(request, test_fixture):
 
 
 @pytest.mark.e2e
+@pytest.mark.step_chain
 @pytest.mark.usefixtures("class_fixture")
-@pytest.mark.parametrize("test_data_set", data.get("order_basic"), scope="class")
+@pytest.mark.dataset(TEST_DATA_FILE, "order_basic")
 class TestAngularPracticeShopOrderBasic:
     """
     Test basic order scenario.
@@ -36,19 +33,6 @@ class TestAngularPracticeShopOrderBasic:
 
     # pylint: disable=no-member
 
-    @pytest.fixture
-    def test_data(self, test_data_set):
-        """
-        Test data fixture.
-
-        :param test_data_set: dict
-        :return: DataClass()
-                        .product_name
-                        .delivery_country
-                        .type_len
-        """
-        return DataClass(test_data_set)
-
     def test_setup(self, test_data):
         """Start test."""
         self.tools.logger.info("Start basic order scenario test for Angular Practice Shop page.")
@@ -64,6 +48,7 @@ class TestAngularPracticeShopOrderBasic:
 
         assert self.page.get_number_of_products_in_cart() == test_data.product_quantity
 
+    @pytest.mark.max_webdriver_commands(20)
     def test_checkout_view(self, test_data):
         """Test if checkout view shows correct information."""
         self.tools.logger.info(
@@ -105,8 +90,9 @@ class TestAngularPracticeShopOrderBasic:
 
 
 @pytest.mark.e2e
+@pytest.mark.step_chain
 @pytest.mark.usefixtures("class_fixture")
-@pytest.mark.parametrize("test_data_set", data.get("order_with_changes"), scope="class")
+@pytest.mark.dataset(TEST_DATA_FILE, "order_with_changes")
 class TestAngularPracticeShopOrderWithChanges:
     """
     Test order with products quantities changes scenario.
@@ -114,19 +100,6 @@ class TestAngularPracticeShopOrderWithChanges:
 
     # pylint: disable=no-member
 
-    @pytest.fixture
-    def test_data(self, test_data_set):
-        """
-        Test data fixture.
-
-        :param test_data_set: dict
-        :return: DataClass()
-                        .product_name
-                        .delivery_country
-                        .type_len
-        """
-        return DataClass(test_data_set)
-
     def _verify_cart(self, expected_data: Dict[str, Any]):
         products = self.page.checkout_view.get_products()  # type: ignore[attr-defined]
         total = 0.0
@@ -161,6 +134,7 @@ class TestAngularPracticeShopOrderWithChanges:
 
         assert self.page.get_number_of_products_in_cart() == len(test_data.products.keys())
 
+    @pytest.mark.max_webdriver_commands(100)
     def test_checkout_view_initial(self, test_data):
         """Test if checkout view shows correct information."""
         self.tools.logger.info("Go to checkout page and verify if cart info is correct.")
@@ -169,30 +143,33 @@ class TestAngularPracticeShopOrderWithChanges:
         products = checkout_view.get_products()
         assert len(products) == len(test_data.products.keys())
 
-        expected_data = test_data.products
+        expected_data = dict(test_data.products)
         self._verify_cart(expected_data)
 
+    @pytest.mark.max_webdriver_commands(110)
     def test_checkout_view_add_product(self, test_data):
         """Test if the product quantity can be increased."""
         self.tools.logger.info("Increase product quantity and verify if cart info is updated correctly.")
         self._modify_quantity(test_data.product_more)
 
-        expected_data = test_data.products
+        expected_data = dict(test_data.products)
         expected_data.update(test_data.product_more)
 
         self._verify_cart(expected_data)
 
+    @pytest.mark.max_webdriver_commands(110)
     def test_checkout_view_zero_product(self, test_data):
         """Test if the product quantity can be equal to 0."""
         self.tools.logger.info("Decrease product quantity to 0 and verify if cart info is updated correctly.")
         self._modify_quantity(test_data.product_zero)
 
-        expected_data = test_data.products
+        expected_data = dict(test_data.products)
         expected_data.update(test_data.product_more)
         expected_data.update(test_data.product_zero)
 
         self._verify_cart(expected_data)
 
+    @pytest.mark.max_webdriver_commands(35)
     def test_checkout_view_fraction_product(self, test_data):
         """Test if the product quantity cannot be fractional."""
         self.tools.logger.info(
@@ -205,6 +182,7 @@ class TestAngularPracticeShopOrderWithChanges:
             if i.name in test_data.product_fraction.keys():
                 assert i.quantity.is_integer(), "Quantity of a product must be an integer."
 
+    @pytest.mark.max_webdriver_commands(35)
     def test_checkout_view_negative_product(self, test_data):
         """Test if the product quantity cannot be negative."""
         self.tools.logger.info(
@@ -217,6 +195,7 @@ class TestAngularPracticeShopOrderWithChanges:
             if i.name in test_data.product_minus.keys():
                 assert i.quantity >= 0, "Quantity of a product cannot be negative."
 
+    @pytest.mark.max_webdriver_commands(10)
     def test_checkout_view_continue_shopping(self, test_data):  # pylint: disable=unused-argument
         """Test if 'Continue Shopping' button navigates back to shop page with cart content intact."""
         self.tools.logger.info(
@@ -228,8 +207,9 @@ class TestAngularPracticeShopOrderWithChanges:
 
 
 @pytest.mark.e2e
+@pytest.mark.step_chain
 @pytest.mark.usefixtures("class_fixture")
-@pytest.mark.parametrize("test_data_set", data.get("order_with_removals"), scope="class")
+@pytest.mark.dataset(TEST_DATA_FILE, "order_with_removals")
 class TestAngularPracticeShopOrderWithRemovals:
     """
     Test order with products removal scenario.
@@ -237,19 +217,6 @@ class TestAngularPracticeShopOrderWithRemovals:
 
     # pylint: disable=no-member
 
-    @pytest.fixture
-    def test_data(self, test_data_set):
-        """
-        Test data fixture.
-
-        :param test_data_set: dict
-        :return: DataClass()
-                        .product_name
-                        .delivery_country
-                        .type_len
-        """
-        return DataClass(test_data_set)
-
     def test_setup(self, test_data):  # pylint: disable=unused-argument
         """Start test."""
         self.tools.logger.info("Start order with products removal scenario test for Angular Practice Shop page.")
@@ -265,6 +232,7 @@ class TestAngularPracticeShopOrderWithRemovals:
 
         assert self.page.get_number_of_products_in_cart() == len(test_data.products)
 
+    @pytest.mark.max_webdriver_commands(10)
     def test_checkout_view_initial(self, test_data):
         """Test if checkout view shows correct information."""
         self.tools.logger.info("Go to checkout page and verify if cart info is correct.")
@@ -273,6 +241,7 @@ class TestAngularPracticeShopOrderWithRemovals:
 
         assert len(products) == len(test_data.products)
 
+    @pytest.mark.max_webdriver_commands(20)
     def test_checkout_view_remove_products(self, test_data):
         """Test if the products can be removed from cart."""
         self.tools.logger.info("Remove products from cart and verify if cart info is updated correctly.")
@@ -282,6 +251,7 @@ class TestAngularPracticeShopOrderWithRemovals:
 
         assert self.page.checkout_view.get_total_price() == test_data.total_final
 
+    @pytest.mark.max_webdriver_commands(5)
     def test_checkout_view_proceed(self, test_data):  # pylint: disable=unused-argument
         """Test if user cannot proceed to delivery with empty cart."""
         self.tools.logger.info("Verify whether user can proceed to delivery with empty cart.")
@@ -0,0 +1,121 @@
+"""
+Framework test of AngularPracticeShop page objects.
+"""
+
+from typing import Any, Dict
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.locator_converter import LocatorConverter
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from pages.rsa_pages.angular_practice_shop_page import AngularPracticeShopPage, CheckoutViewPage
+from utilities.command_budget import COMMAND_BUDGET
+from utilities.webdriver_tracer import COMMAND_TRACER, CommandTracer
+
+_ELEMENT = {"element-6066-11e4-a52e-4f735466cecf": "element-1"}
+
+
+class _StubExecutor(RemoteConnection):
+    """
+    Command executor answering commands of ProtoCommerce pages without a browser.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    RESPONSES: Dict[str, Any] = {
+        "findElement": _ELEMENT,
+        "findElements": [_ELEMENT],
+        "getElementText": " Checkout ( 1 )\n",
+        "w3cExecuteScript": "$. 65000",
+    }
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        pass
+
+    def execute(self, command, params):  # pylint: disable=unused-argument
+        """Return canned value of the command."""
+        return {"status": 0, "value": self.RESPONSES.get(command)}
+
+
+class _StubDriver(WebDriver):  # pylint: disable=abstract-method
+    """
+    WebDriver with the stub executor - no session is started.
+    """
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        self.command_executor = _StubExecutor()
+        self.session_id = "session-1"
+        self.error_handler = ErrorHandler()
+        self.locator_converter = LocatorConverter()
+        self.caps = {}
+
+
+@pytest.mark.unit
+class TestAngularStability:
+    """
+    Test waiting for Angular stability.
+    """
+
+    @pytest.fixture
+    def page(self):
+        """Setup object-under-test."""
+        page = AngularPracticeShopPage(MagicMock())
+        page.logger = MagicMock()
+        return page
+
+    @pytest.mark.parametrize(
+        "status, stable",
+        [("stable", True), ("unavailable", False), ("timeout", False)],
+    )
+    def test_wait_until_stable(self, page, status, stable):
+        """Test that stability is awaited in a single bounded script call and only a timeout is reported."""
+        page.driver.execute_async_script.return_value = status
+        assert page.wait_until_stable() is stable
+        assert page.driver.execute_async_script.call_args.args[1:] == (page.STABLE_TIMEOUT_MS,)
+        assert page.logger.warning.called is (status == "timeout")
+
+    def test_getters_do_not_wait(self, page):
+        """Test that stability is awaited after navigation only, not on each control access."""
+        page.go_to_checkout().checkout_button.click()
+        page.checkout_view.get_products()
+        assert page.driver.execute_async_script.call_count == 1
+
+
+@pytest.mark.unit
+class TestCommandBudgets:
+    """
+    Test that page methods with declared budgets issue exactly the traced commands.
+    """
+
+    @pytest.fixture
+    def commands(self, monkeypatch):
+        """Setup object-under-test."""
+        monkeypatch.setattr(COMMAND_TRACER, "active", True)
+        events = []
+        tracer = CommandTracer()
+        tracer.activate(events.append)
+        tracer.listeners.append(COMMAND_BUDGET.on_command)
+        driver = tracer.instrument(_StubDriver())
+        yield driver, events
+        assert not COMMAND_BUDGET.pop_violations()
+
+    def test_get_number_of_products_in_cart(self, commands):
+        """Test commands of reading cart size from the checkout button."""
+        driver, events = commands
+        assert AngularPracticeShopPage(driver).get_number_of_products_in_cart() == 1
+        assert [event.command for event in events] == ["findElement", "getElementText"]
+
+    def test_get_products(self, commands):
+        """Test commands of listing checkout products."""
+        driver, events = commands
+        assert len(CheckoutViewPage(driver).get_products()) == 1
+        assert [event.command for event in events] == ["findElements"]
+
+    def test_get_total_price(self, commands):
+        """Test commands of reading total price."""
+        driver, events = commands
+        assert CheckoutViewPage(driver).get_total_price() == 65000.0
+        assert [event.command for event in events] == ["findElement", "w3cExecuteScript"]
@@ -20,6 +20,7 @@ def class_fixture(request, test_fixture):
 
 
 @pytest.mark.framework
+@pytest.mark.page(AutomationPracticePage, read_only=False)
 @pytest.mark.usefixtures("class_fixture")
 class TestAutomationPracticePage:
     """
@@ -163,18 +164,21 @@ class TestAutomationPracticePage:
         finally:
             self.driver.switch_to.alert.accept()
 
+    @pytest.mark.max_webdriver_commands(10)
     def test_web_table_get_headers(self):
         """Test reading headers from web table with headings."""
         self.tools.logger.info("Test if web table headers works correctly.")
         headers = self.page.table_static.get_headers()
         assert headers == ["Instructor", "Course", "Price"]
 
+    @pytest.mark.max_webdriver_commands(50)
     def test_web_table_get_body(self):
         """Test reading body from web table with headings."""
         self.tools.logger.info("Test if web table body works correctly.")
         body = self.page.table_static.get_body()
         assert body[2][1] == "Appium (Selenium) - Mobile Automation Testing from Scratch"
 
+    @pytest.mark.max_webdriver_commands(55)
     def test_web_table_get_table(self):
         """Test reading whole content from web table with headings."""
         self.tools.logger.info("Test if web table as a whole works correctly.")
@@ -182,18 +186,21 @@ class TestAutomationPracticePage:
         assert table[0][2] == "Price"
         assert table[3][1] == "Appium (Selenium) - Mobile Automation Testing from Scratch"
 
+    @pytest.mark.max_webdriver_commands(10)
     def test_web_table_fixed_get_headers(self):
         """Test reading headers from web table with <thead> and <tbody>."""
         self.tools.logger.info("Test if fixed headers web table headers works correctly.")
         headers = self.page.table_fixed_header.get_headers()
         assert headers == ["Name", "Position", "City", "Amount"]
 
+    @pytest.mark.max_webdriver_commands(55)
     def test_web_table_fixed_get_body(self):
         """Test reading body from web table with <thead> and <tbody>."""
         self.tools.logger.info("Test if fixed headers web table body works correctly.")
         body = self.page.table_fixed_header.get_body()
         assert body[4][1] == "Engineer"
 
+    @pytest.mark.max_webdriver_commands(65)
     def test_web_table_fixed_get_table(self):
         """Test reading whole content from web table with <thead> and <tbody>."""
         self.tools.logger.info("Test if fixed headers web table as a whole works correctly.")
@@ -201,6 +208,7 @@ class TestAutomationPracticePage:
         assert table[0][2] == "City"
         assert table[5][1] == "Engineer"
 
+    @pytest.mark.max_webdriver_commands(5)
     def test_web_table_label(self):
         """Test label."""
         self.tools.logger.info("Test if label works correctly.")
@@ -0,0 +1,142 @@
+"""
+Framework test of BasePage navigation and viewport operations.
+"""
+
+from unittest.mock import MagicMock
+
+import pytest
+from selenium.common import NoSuchElementException, TimeoutException
+from selenium.webdriver.common.by import By
+
+from pages.base_page import BasePage, PageMetrics
+from pages.rsa_pages.green_kart_pages import GREEN_KART_CART_PAGE
+from pages.rsa_pages.green_kart_pages.green_kart_cart_page import GreenKartCheckoutPage
+
+
+@pytest.mark.unit
+class TestGoTo:
+    """
+    Test BasePage.go_to() method.
+    """
+
+    @pytest.fixture
+    def page(self):
+        """Setup object-under-test."""
+        return GreenKartCheckoutPage(MagicMock())
+
+    def test_switch_route(self, page):
+        """Test that the route of the already loaded SPA document is switched in-app."""
+        page.driver.execute_script.return_value = 1234.5
+        page.go_to()
+        assert page.driver.execute_script.call_args.args[1:] == (
+            "https://rahulshettyacademy.com/seleniumPractise/",
+            "/cart",
+        )
+        page.driver.get.assert_not_called()
+
+    def test_other_document(self, page):
+        """Test that the whole document is loaded if the browser displays another one."""
+        page.driver.execute_script.return_value = None
+        page.go_to()
+        page.driver.get.assert_called_once_with(GREEN_KART_CART_PAGE)
+
+    def test_not_spa_route(self):
+        """Test that pages outside SPA are always loaded."""
+        page = BasePage(MagicMock(), "https://example.com/practice")
+        page.go_to()
+        page.driver.execute_script.assert_not_called()
+        page.driver.get.assert_called_once_with("https://example.com/practice")
+
+    def test_ready_locator(self, page):
+        """Test that navigation waits for the ready locator element."""
+        page.driver.execute_script.return_value = 1234.5
+        page.go_to()
+        page.driver.find_element.assert_called_once_with(*page.ready_locator)
+
+    def test_ready_timeout(self, page, monkeypatch):
+        """Test that navigation fails if the ready locator element does not appear."""
+        monkeypatch.setattr(page, "READY_TIMEOUT", 0)
+        page.driver.execute_script.return_value = 1234.5
+        page.driver.find_element.side_effect = NoSuchElementException()
+        with pytest.raises(TimeoutException):
+            page.go_to()
+
+
+def _metrics(scroll_y, scroll_height=3000):
+    return {
+        "scroll_width": 1200,
+        "scroll_height": scroll_height,
+        "viewport_width": 1200,
+        "viewport_height": 1000,
+        "scroll_x": 0,
+        "scroll_y": scroll_y,
+    }
+
+
+@pytest.mark.unit
+class TestViewport:
+    """
+    Test BasePage viewport operations.
+    """
+
+    @pytest.fixture
+    def page(self):
+        """Setup object-under-test."""
+        return BasePage(MagicMock(), "https://example.com/practice")
+
+    def test_metrics(self, page):
+        """Test that scroll operations return page metrics of the same script call."""
+        page.driver.execute_script.return_value = _metrics(2000)
+        metrics = page.scroll_by(dy=1000)
+        assert metrics == PageMetrics(1200, 3000, 1200, 1000, 0, 2000)
+        assert metrics.at_bottom
+        assert page.driver.execute_script.call_args.args[1:] == (0, 1000)
+        assert not page.get_metrics()._replace(scroll_y=1999).at_bottom
+        page.driver.execute_script.return_value = None
+        with pytest.raises(TypeError):
+            page.get_metrics()
+
+    def test_iter_scroll(self, page):
+        """Test that lazily loaded elements are yielded per step until no new elements appear at the bottom."""
+        page.driver.execute_async_script.side_effect = [
+            {"elements": ["a", "b"], "metrics": _metrics(0, 2000)},
+            {"elements": ["c"], "metrics": _metrics(1000, 3000)},
+            {"elements": [], "metrics": _metrics(2000, 3000)},
+        ]
+        assert list(page.iter_scroll((By.CSS_SELECTOR, ".product"))) == [["a", "b"], ["c"]]
+        assert [call.args[3:6] for call in page.driver.execute_async_script.call_args_list] == [
+            (0, 0, 0),
+            (2, 0, 1000),
+            (3, 0, 1000),
+        ]
+
+    def test_iter_scroll_page_not_growing(self, page):
+        """Test that iteration stops when scrolling does not move the viewport and nothing is loaded."""
+        page.driver.execute_async_script.side_effect = [
+            {"elements": ["a"], "metrics": _metrics(0)},
+            {"elements": [], "metrics": _metrics(0)},
+        ]
+        assert list(page.iter_scroll((By.CSS_SELECTOR, ".product"), step=500)) == [["a"]]
+        assert page.driver.execute_async_script.call_args.args[5] == 500
+
+    @pytest.mark.parametrize(
+        "locator, selector",
+        [
+            ((By.XPATH, "//div[@class='product']"), (True, "//div[@class='product']")),
+            ((By.CSS_SELECTOR, "div.product"), (False, "div.product")),
+            ((By.ID, "products"), (False, '[id="products"]')),
+            ((By.NAME, "product"), (False, '[name="product"]')),
+            ((By.CLASS_NAME, "product"), (False, ".product")),
+            ((By.TAG_NAME, "li"), (False, "li")),
+        ],
+    )
+    def test_iter_scroll_selector(self, page, locator, selector):
+        """Test that locators are converted to XPath or CSS selectors evaluated in the browser."""
+        page.driver.execute_async_script.return_value = {"elements": [], "metrics": _metrics(2000)}
+        assert not list(page.iter_scroll(locator))
+        assert page.driver.execute_async_script.call_args.args[1:3] == selector
+
+    def test_iter_scroll_unsupported_locator(self, page):
+        """Test that locator strategies without selector equivalent are rejected."""
+        with pytest.raises(ValueError, match="link text"):
+            next(page.iter_scroll((By.LINK_TEXT, "Products")))
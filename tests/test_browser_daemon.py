@@ -0,0 +1,144 @@
+"""
+Framework test of the browser daemon.
+"""
+
+import threading
+import time
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+
+from utilities.browser_daemon import (
+    BROWSER_DAEMON,
+    AttachedDriver,
+    BrowserDaemon,
+    DaemonClient,
+    _DaemonServer,
+    _request,
+)
+from utilities.plugins.browser_daemon import pytest_configure
+
+
+def _driver(session_id):
+    driver = MagicMock(session_id=session_id, caps={"browserName": "chrome"}, window_handles=["main", "popup"])
+    driver.service.service_url = "http://localhost:9515"
+    driver.execute_cdp_cmd.side_effect = lambda command, params: (
+        {"entries": [{"url": "about:blank"}, {"url": "https://example.com/cart"}]}
+        if command == "Page.getNavigationHistory"
+        else {}
+    )
+    return driver
+
+
+@pytest.mark.unit
+class TestBrowserDaemon:
+    """
+    Test BrowserDaemon object through its HTTP API.
+    """
+
+    # pylint: disable=protected-access
+
+    @pytest.fixture
+    def client(self, request):
+        """Setup object-under-test."""
+        drivers = [_driver("session-1"), _driver("session-2")]
+        with patch("utilities.browser_daemon._launch", side_effect=drivers):
+            daemon = BrowserDaemon("chrome", sessions=2, lease_ttl=getattr(request, "param", 60.0))
+            daemon.start()
+        server = _DaemonServer(("127.0.0.1", 0), daemon)
+        thread = threading.Thread(target=server.serve_forever)
+        thread.start()
+        client = DaemonClient()
+        client.url = f"http://127.0.0.1:{server.server_address[1]}"
+        leased = []
+
+        def lease():
+            leased.append(DaemonClient.lease(client))
+            return leased[-1]
+
+        with patch.object(client, "lease", side_effect=lease):
+            yield client, drivers
+        for driver in leased:
+            driver._released.set()  # stop heartbeats of drivers not quit by the test
+        server.shutdown()
+        server.server_close()
+        thread.join()
+
+    def test_lease_and_release(self, client):
+        """Test that a leased session is attached without a new session and reset when released."""
+        client, drivers = client
+        driver = client.lease()
+        assert isinstance(driver, AttachedDriver)
+        assert driver.session_id == "session-1"
+        assert driver.name == "chrome"
+        assert client.lease().session_id == "session-2"
+        with pytest.raises(RuntimeError, match="all sessions are leased"):
+            client.lease()
+        with patch("selenium.webdriver.remote.webdriver.WebDriver.get") as get:
+            driver.get("https://shop.example.com/checkout")
+        get.assert_called_once_with("https://shop.example.com/checkout")
+        driver.quit()
+        drivers[0].close.assert_called_once()
+        for origin in ("https://example.com", "https://shop.example.com"):
+            drivers[0].execute_cdp_cmd.assert_any_call(
+                "Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"}
+            )
+        assert client.status()["leased"] == ["session-2"]
+        assert client.lease().session_id == "session-1"
+
+    def test_release_not_leased(self, client):
+        """Test that only leased sessions can be released."""
+        client, _ = client
+        driver = client.lease()
+        driver.quit()
+        with pytest.raises(RuntimeError, match="not leased: session-1"):
+            driver.quit()
+
+    def test_expired_lease(self, client):
+        """Test that a session of an expired lease is reset and leased again, its former client cannot renew it."""
+        client, drivers = client
+        client.lease()._released.set()  # client killed - the lease is not renewed
+        client.lease()._released.set()
+        with patch("utilities.browser_daemon.time.monotonic", return_value=time.monotonic() + 61):
+            assert client.lease().session_id == "session-1"
+        drivers[0].execute_cdp_cmd.assert_any_call("Network.clearBrowserCookies", {})
+        drivers[1].execute_cdp_cmd.assert_any_call("Network.clearBrowserCookies", {})
+        assert client.status()["leased"] == ["session-1"]
+        with pytest.raises(RuntimeError, match="not leased: session-2"):
+            _request(client.url, "/renew/session-2")
+
+    @pytest.mark.parametrize("client", [0.6], indirect=True)
+    def test_heartbeat(self, client):
+        """Test that the attached driver renews its lease until quit()."""
+        client, drivers = client
+        driver = client.lease()
+        time.sleep(1.2)
+        assert client.lease().session_id == "session-2"
+        drivers[0].execute_cdp_cmd.assert_not_called()
+        driver.quit()
+        assert not driver._heartbeat.is_alive()
+        assert client.status()["leased"] == ["session-2"]
+
+
+@pytest.mark.unit
+class TestBrowserDaemonPlugin:
+    """
+    Test configuration of the browser daemon plugin.
+    """
+
+    @pytest.fixture
+    def config(self):
+        """Setup object-under-test."""
+        options = {"--browser-daemon": True, "--browser-daemon-url": "http://127.0.0.1:4446", "--browser-name": "edge"}
+        return SimpleNamespace(getoption=lambda name, default=None, skip=False: options.get(name, default))
+
+    def test_browser_name(self, config, monkeypatch):
+        """Test that a daemon running another browser than --browser-name is rejected."""
+        monkeypatch.setattr(BROWSER_DAEMON, "url", None)  # restored after the test - set by pytest_configure
+        status = {"browser_name": "chrome", "sessions": ["session-1"], "leased": []}
+        with patch("utilities.browser_daemon.DaemonClient.status", return_value=status):
+            with pytest.raises(pytest.UsageError, match="runs chrome, not edge"):
+                pytest_configure(config)
+            status["browser_name"] = "edge"
+            pytest_configure(config)
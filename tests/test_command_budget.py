@@ -0,0 +1,71 @@
+"""
+Framework test of WebDriver command budgets.
+"""
+
+import pytest
+
+from utilities.command_budget import CommandBudget, command_budget
+from utilities.webdriver_tracer import CommandEvent
+
+
+def _event(command, issuer):
+    return CommandEvent("t.py::TestShop::test_products", command, issuer, 0.0, 0.01)
+
+
+@pytest.mark.unit
+class TestCommandBudget:
+    """
+    Test CommandBudget object.
+    """
+
+    @pytest.fixture
+    def budget(self):
+        """Setup object-under-test."""
+        return CommandBudget()
+
+    def test_over_budget(self, budget):
+        """Test that exceeded scope is collected with breakdown of commands by type and issuing method."""
+        scope = budget.open("t.py::TestShop::test_products", 2)
+        for event in (_event("findElements", "ShopPage.get_products"), *[_event("findElement", "Label.__init__")] * 2):
+            budget.on_command(event)
+        budget.close(scope)
+        assert budget.pop_violations() == [scope]
+        assert not budget.pop_violations()
+        assert scope.breakdown().splitlines() == [
+            "WebDriver command budget exceeded for t.py::TestShop::test_products: 3 > 2 commands",
+            "  commands  command <- issuing method",
+            "         2  findElement <- Label.__init__",
+            "         1  findElements <- ShopPage.get_products",
+        ]
+
+    def test_nested_scopes(self, budget):
+        """Test that a command counts for every open scope and only exceeded scopes are collected."""
+        test_scope = budget.open("t.py::TestShop::test_products", 3)
+        method_scope = budget.open("ShopPage.get_products", 1)
+        budget.on_command(_event("findElements", "ShopPage.get_products"))
+        budget.on_command(_event("findElement", "ShopPage.get_products"))
+        budget.close(method_scope)
+        budget.on_command(_event("getTitle", "test_products"))
+        budget.close(test_scope)
+        assert budget.open_scopes == []
+        assert len(test_scope.events) == 3 and not test_scope.exceeded
+        assert budget.pop_violations() == [method_scope]
+
+    def test_decorator(self, budget, monkeypatch):
+        """Test that the decorator opens a scope only while commands are traced."""
+        monkeypatch.setattr("utilities.command_budget.COMMAND_BUDGET", budget)
+        monkeypatch.setattr("utilities.command_budget.COMMAND_TRACER.active", False)
+        opened = []
+
+        @command_budget(1)
+        def get_products():
+            opened.extend(scope.name for scope in budget.open_scopes)
+            budget.on_command(_event("findElements", "get_products"))
+            budget.on_command(_event("findElement", "get_products"))
+
+        get_products()
+        assert not opened and not budget.pop_violations()
+        monkeypatch.setattr("utilities.command_budget.COMMAND_TRACER.active", True)
+        get_products()
+        assert opened == [get_products.__qualname__]
+        assert [scope.name for scope in budget.pop_violations()] == [get_products.__qualname__]
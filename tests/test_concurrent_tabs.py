@@ -0,0 +1,114 @@
+"""
+Framework test of concurrent tabs.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common import WebDriverException
+
+from utilities.concurrent_tabs import ChromeTab, ConcurrentTabs
+from utilities.plugins.concurrent_tabs import _ConcurrentTabsHooks, pytest_collection_modifyitems
+from utilities.plugins.durations import ParameterSetScheduling, chain_scope
+
+
+@pytest.mark.unit
+class TestChainScope:
+    """
+    Test distribution of parameter sets to pytest-xdist workers.
+    """
+
+    def test_parameter_set(self):
+        """Test that each parameter set of a class is a separate unit of work."""
+        assert chain_scope("tests/test_shop.py::TestOrder::test_setup[order_basic-0]") == (
+            "tests/test_shop.py::TestOrder[order_basic-0]"
+        )
+        assert chain_scope("tests/test_shop.py::TestOrder::test_purchase[order_basic-0]") == (
+            "tests/test_shop.py::TestOrder[order_basic-0]"
+        )
+
+    def test_not_parametrized(self):
+        """Test that tests without parameters are grouped by class (or module)."""
+        assert chain_scope("tests/test_shop.py::TestOrder::test_setup") == "tests/test_shop.py::TestOrder"
+        assert chain_scope("tests/test_shop.py::test_setup") == "tests/test_shop.py"
+
+
+@pytest.mark.unit
+class TestConcurrentTabs:
+    """
+    Test ConcurrentTabs object.
+    """
+
+    @pytest.fixture
+    def tabs(self):
+        """Setup object-under-test."""
+        with patch("utilities.concurrent_tabs.launch_chrome") as launch_chrome:
+            tabs = ConcurrentTabs()
+            tabs.launch("chrome")
+            yield tabs
+        assert "--disable-renderer-backgrounding" in launch_chrome.call_args.args[0].arguments
+
+    def test_open_tab(self, tabs):
+        """Test that each class attaches a new session to the shared browser and drives its own tab."""
+        assert tabs.address.startswith("127.0.0.1:")
+        with patch("utilities.concurrent_tabs.DRIVER_CACHE.resolve", return_value=None):
+            with patch("utilities.concurrent_tabs.ChromeTab") as chrome_tab:
+                driver = tabs.open_tab("chrome")
+        assert chrome_tab.call_args.kwargs["options"].debugger_address == tabs.address
+        driver.switch_to.new_window.assert_called_once_with("tab")
+        tabs.shutdown()
+        assert tabs.address is None
+        with pytest.raises(RuntimeError):
+            tabs.open_tab("chrome")
+
+    def test_close_tab(self):
+        """Test that quit() of the tab closes only the tab and stops its driver service."""
+        driver = MagicMock()
+        driver.close.side_effect = WebDriverException("tab already closed")
+        with pytest.raises(WebDriverException):
+            ChromeTab.quit(driver)
+        driver.service.stop.assert_called_once()
+        driver.quit.assert_not_called()
+
+
+@pytest.mark.unit
+class TestConcurrentTabsHooks:
+    """
+    Test hooks of the concurrent tabs plugin.
+    """
+
+    # pylint: disable=protected-access
+
+    @pytest.fixture
+    def config(self):
+        """Setup object-under-test."""
+        options = {"--concurrent-tabs": True, "--longest-first": True}
+        return SimpleNamespace(
+            getvalue=lambda name: "load", getoption=options.get, option=SimpleNamespace(loadscopereorder=True)
+        )
+
+    def test_scheduler(self, config):
+        """Test that parameter sets are distributed as whole units in the order of collection."""
+        with patch("utilities.plugins.durations.LoadScopeScheduling.__init__", return_value=None) as scheduling:
+            scheduler = _ConcurrentTabsHooks("chrome").pytest_xdist_make_scheduler(config, None)
+        scheduling.assert_called_once_with(config, None)
+        assert isinstance(scheduler, ParameterSetScheduling)
+        assert scheduler._split_scope("tests/test_shop.py::TestOrder::test_setup[order_basic-0]") == (
+            "tests/test_shop.py::TestOrder[order_basic-0]"
+        )
+        assert not config.option.loadscopereorder
+        config.getvalue = lambda name: "each"
+        assert _ConcurrentTabsHooks("chrome").pytest_xdist_make_scheduler(config, None) is None
+
+    def test_reject_browser_storage(self, config):
+        """Test that test classes relying on their own cookies or storage are rejected."""
+        items = [
+            SimpleNamespace(
+                nodeid=f"t.py::{name}::test_login", get_closest_marker=lambda marker, name=name: name == "A"
+            )
+            for name in ("A", "B")
+        ]
+        with pytest.raises(pytest.UsageError, match="t.py::A$"):
+            pytest_collection_modifyitems(config, items)
+        pytest_collection_modifyitems(config, items[1:])
@@ -21,6 +21,7 @@ def class_fixture(request, test_fixture):
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=False)
 @pytest.mark.usefixtures("class_fixture")
 class TestBaseControl:
     """
@@ -60,6 +61,7 @@ class TestBaseControl:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=True)
 @pytest.mark.usefixtures("class_fixture")
 class TestButton:
     """
@@ -78,6 +80,7 @@ class TestButton:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=False)
 @pytest.mark.usefixtures("class_fixture")
 class TestSelectOptionControl:
     """
@@ -100,6 +103,7 @@ class TestSelectOptionControl:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=True)
 @pytest.mark.usefixtures("class_fixture")
 class TestRadiobutton:
     """
@@ -118,6 +122,7 @@ class TestRadiobutton:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=False)
 @pytest.mark.usefixtures("class_fixture")
 class TestCheckbox:
     """
@@ -137,6 +142,7 @@ class TestCheckbox:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=False)
 @pytest.mark.usefixtures("class_fixture")
 class TestStaticDropdown:
     """
@@ -159,6 +165,7 @@ class TestStaticDropdown:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=False)
 @pytest.mark.usefixtures("class_fixture")
 class TestDynamicDropdown:
     """
@@ -186,6 +193,7 @@ class TestDynamicDropdown:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=True)
 @pytest.mark.usefixtures("class_fixture")
 class TestLabel:
     """
@@ -203,6 +211,7 @@ class TestLabel:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=True)
 @pytest.mark.usefixtures("class_fixture")
 class TestLink:
     """
@@ -224,6 +233,7 @@ class TestLink:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=True)
 @pytest.mark.usefixtures("class_fixture")
 class TestIFrame:
     """
@@ -242,6 +252,7 @@ class TestIFrame:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=True)
 @pytest.mark.usefixtures("class_fixture")
 class TestTableSimple:
     """
@@ -270,6 +281,7 @@ class TestTableSimple:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=True)
 @pytest.mark.usefixtures("class_fixture")
 class TestTableWithHeadings:
     """
@@ -318,6 +330,7 @@ class TestTableWithHeadings:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=True)
 @pytest.mark.usefixtures("class_fixture")
 class TestTableWithHeaderAndBody:
     """
@@ -364,6 +377,7 @@ class TestTableWithHeaderAndBody:
 
 
 @pytest.mark.unit
+@pytest.mark.page(AutomationPracticePage, read_only=False)
 @pytest.mark.usefixtures("class_fixture")
 class TestTableMixed:
     """
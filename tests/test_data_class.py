@@ -0,0 +1,60 @@
+"""
+Framework test of test data records.
+"""
+
+import pytest
+
+from utilities.data_class import make_records, record_type
+
+
+@pytest.mark.unit
+class TestDataRecord:
+    """
+    Test make_records() function and generated records.
+    """
+
+    @pytest.fixture
+    def records(self):
+        """Setup object-under-test."""
+        return make_records(
+            "order_basic",
+            [
+                {"product_name": "Blackberry", "products": {"Nokia Edge": [1, 65000.0]}, "tags": ["a", "b"]},
+                {"tags": [], "product_name": "iphone X", "products": {}},
+            ],
+        )
+
+    def test_fields(self, records):
+        """Test field values, read-only nested values and the shared record class."""
+        assert type(records[0]) is type(records[1])
+        assert type(records[0]).__name__ == "OrderBasicRecord"
+        assert records[1].product_name == "iphone X"
+        assert records[0].products["Nokia Edge"] == (1, 65000.0)
+        assert records[0].tags == ("a", "b")
+        assert records[0].get_data()["product_name"] == "Blackberry"
+
+    def test_immutable(self, records):
+        """Test that records and their nested values cannot be modified."""
+        with pytest.raises(AttributeError):
+            records[0].product_name = "iphone X"
+        with pytest.raises(AttributeError):
+            del records[0].product_name
+        with pytest.raises(AttributeError):
+            records[0].new_field = 1
+        with pytest.raises(TypeError):
+            records[0].products["Nokia Edge"] = [2, 65000.0]
+
+    def test_schema_mismatch(self):
+        """Test validation of datasets against the schema of the first one."""
+        with pytest.raises(ValueError, match=r"\[1\] does not match schema"):
+            make_records("order_basic", [{"product_name": "Blackberry"}, {"product": "iphone X"}])
+
+    def test_invalid_field_name(self):
+        """Test validation of field names."""
+        with pytest.raises(ValueError, match="invalid field name"):
+            record_type("order_basic", ["product name"])
+
+    def test_record_type_cached(self):
+        """Test that a class is created once per schema."""
+        assert record_type("order_basic", ["a", "b"]) is record_type("order_basic", ["a", "b"])
+        assert record_type("order_basic", ["a", "b"]) is not record_type("order_basic", ["a"])
@@ -0,0 +1,96 @@
+"""
+Framework test of test data registry.
+"""
+
+import json
+
+import pytest
+
+from utilities.data_registry import DataRegistry
+
+
+@pytest.mark.unit
+class TestDataRegistryJson:
+    """
+    Test DataRegistry object with JSON file.
+    """
+
+    @pytest.fixture
+    def registry(self, tmp_path):
+        """Setup object-under-test."""
+        data = {
+            "order_basic": [{"product_name": "Blackberry"}, {"product_name": "iphone X"}],
+            "order_pairwise": {
+                "fixed": {"product_quantity": 1.0},
+                "dimensions": {"product_name": ["Blackberry", "iphone X"], "type_len": [2, 3, -1]},
+            },
+        }
+        (tmp_path / "orders.json").write_text(json.dumps(data), encoding="utf-8")
+        return DataRegistry(str(tmp_path))
+
+    def test_refs(self, registry):
+        """Test refs() method."""
+        refs = registry.refs("orders.json", "order_basic")
+        assert [ref.id for ref in refs] == ["order_basic-0", "order_basic-1"]
+
+    def test_resolve_cached(self, registry):
+        """Test that resolved records are shared."""
+        ref = registry.refs("orders.json", "order_basic")[1]
+        assert registry.resolve(ref).product_name == "iphone X"
+        assert registry.resolve(ref) is registry.resolve(ref)
+
+    def test_changed_file(self, registry, tmp_path):
+        """Test that changed file is loaded again."""
+        ref = registry.refs("orders.json", "order_basic")[0]
+        assert registry.resolve(ref).product_name == "Blackberry"
+        data = {"order_basic": [{"product_name": "Nokia Edge"}]}
+        (tmp_path / "orders.json").write_text(json.dumps(data), encoding="utf-8")
+        assert registry.resolve(ref).product_name == "Nokia Edge"
+
+    def test_pairwise_dataset(self, registry):
+        """Test dataset declared with dimensions."""
+        refs = registry.refs("orders.json", "order_pairwise")
+        assert len(refs) == 6
+        assert registry.resolve(refs[0]).product_quantity == 1.0
+
+    def test_missing_dataset(self, registry):
+        """Test refs() method with unknown dataset name."""
+        with pytest.raises(KeyError):
+            registry.refs("orders.json", "order_with_changes")
+
+
+@pytest.mark.unit
+class TestDataRegistryJsonLines:
+    """
+    Test DataRegistry object with JSON Lines file.
+    """
+
+    @pytest.fixture
+    def registry(self, tmp_path):
+        """Setup object-under-test."""
+        rows = [{"product_name": f"product {i}", "quantity": i} for i in range(5)]
+        lines = [json.dumps(row) for row in rows]
+        (tmp_path / "orders.jsonl").write_text("\n".join(lines[:2] + [""] + lines[2:]) + "\n", encoding="utf-8")
+        (tmp_path / "broken.jsonl").write_text(lines[0] + '\n{"product_name": "x"}\n', encoding="utf-8")
+        return DataRegistry(str(tmp_path))
+
+    def test_refs(self, registry):
+        """Test refs() method - empty lines are skipped."""
+        refs = registry.refs("orders.jsonl")
+        assert len(refs) == 5
+        assert refs[4].id == "orders-4"
+
+    def test_resolve(self, registry):
+        """Test resolve() method reads only the referenced row."""
+        record = registry.resolve(registry.refs("orders.jsonl")[3])
+        assert record.product_name == "product 3"
+        assert record.quantity == 3
+
+    def test_records(self, registry):
+        """Test records() method streams all rows."""
+        assert [record.quantity for record in registry.records("orders.jsonl")] == [0, 1, 2, 3, 4]
+
+    def test_schema_mismatch(self, registry):
+        """Test row validation against the schema of the first row."""
+        with pytest.raises(ValueError, match=r"\[1\] does not match schema"):
+            registry.resolve(registry.refs("broken.jsonl")[1])
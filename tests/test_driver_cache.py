@@ -0,0 +1,62 @@
+"""
+Framework test of the driver cache.
+"""
+
+import os
+from unittest.mock import patch
+
+import pytest
+from selenium import webdriver
+
+from utilities.driver_cache import DriverCache
+
+
+@pytest.mark.unit
+class TestDriverCache:
+    """
+    Test DriverCache object.
+    """
+
+    @pytest.fixture
+    def binaries(self, tmp_path):
+        """Setup object-under-test."""
+        paths = {"driver_path": str(tmp_path / "chromedriver"), "browser_path": str(tmp_path / "chrome")}
+        for path in paths.values():
+            with open(path, "w", encoding="utf-8") as file:
+                file.write("binary")
+        with patch("utilities.driver_cache.SeleniumManager") as manager:
+            manager.return_value.binary_paths.return_value = paths
+            yield DriverCache(str(tmp_path / "cache" / "drivers.json")), manager.return_value.binary_paths, paths
+
+    def test_resolved_once(self, binaries):
+        """Test that Selenium Manager runs only until the browser changes."""
+        cache, binary_paths, paths = binaries
+        options = webdriver.ChromeOptions()
+        assert cache.resolve("chrome", options) == paths["driver_path"]
+        assert options.binary_location == paths["browser_path"]
+        assert DriverCache(cache.path).resolve("chrome", webdriver.ChromeOptions()) == paths["driver_path"]
+        binary_paths.assert_called_once_with(["--browser", "chrome"])
+        with open(paths["browser_path"], "a", encoding="utf-8") as file:
+            file.write(" updated")
+        cache.resolve("chrome", webdriver.ChromeOptions())
+        assert binary_paths.call_count == 2
+
+    def test_offline(self, binaries):
+        """Test that cached driver is used when Selenium Manager fails, only if its binaries exist."""
+        cache, binary_paths, paths = binaries
+        cache.resolve("chrome", webdriver.ChromeOptions())
+        binary_paths.side_effect = RuntimeError("offline")
+        with open(paths["browser_path"], "a", encoding="utf-8") as file:
+            file.write(" updated")
+        assert cache.resolve("chrome", webdriver.ChromeOptions()) == paths["driver_path"]
+        os.remove(paths["driver_path"])
+        with pytest.raises(RuntimeError, match="offline"):
+            cache.resolve("chrome", webdriver.ChromeOptions())
+
+    def test_not_cached(self, binaries):
+        """Test that disabled cache and Safari leave driver resolution to Selenium."""
+        cache, binary_paths, _ = binaries
+        assert cache.resolve("safari", webdriver.ChromeOptions()) is None
+        cache.enabled = False
+        assert cache.resolve("chrome", webdriver.ChromeOptions()) is None
+        binary_paths.assert_not_called()
@@ -0,0 +1,45 @@
+"""
+Framework test of durations database and longest-first ordering.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from utilities.plugins.durations import DurationsDB, longest_first
+
+
+@pytest.mark.unit
+class TestDurations:
+    """
+    Test DurationsDB object and longest_first() function.
+    """
+
+    @pytest.fixture
+    def database(self, tmp_path):
+        """Setup object-under-test."""
+        database = DurationsDB(str(tmp_path / "durations.sqlite"))
+        yield database
+        database.close()
+
+    def test_estimates(self, database):
+        """Test that estimates are averages of test totals of the last runs."""
+        database.save_run(0, [("t.py::A::a", "setup", 1.0, "passed"), ("t.py::A::a", "call", 2.0, "passed")])
+        database.save_run(0, [("t.py::A::a", "setup", 1.0, "passed"), ("t.py::A::a", "call", 4.0, "passed")])
+        database.save_run(0, [("t.py::A::a", "call", 10.0, "passed")])
+        assert database.estimates() == {"t.py::A::a": pytest.approx((3.0 + 5.0 + 10.0) / 3)}
+        assert database.estimates(last_runs=1) == {"t.py::A::a": pytest.approx(10.0)}
+
+    def test_class_durations(self, database):
+        """Test class_durations view."""
+        run_id = database.save_run(2, [("t.py::A::a", "call", 1.0, "passed"), ("t.py::A::b", "call", 2.0, "failed")])
+        rows = database.connection.execute("SELECT run_id, scope, total, tests FROM class_durations").fetchall()
+        assert rows == [(run_id, "t.py::A", 3.0, 2)]
+
+    def test_longest_first(self):
+        """Test that scopes are ordered by expected duration and tests of a scope keep their order."""
+        nodeids = ["t.py::A::a", "t.py::A::b", "t.py::B::a", "t.py::test_c", "t.py::C::a"]
+        items = [SimpleNamespace(nodeid=nodeid) for nodeid in nodeids]
+        estimates = {"t.py::A::a": 1.0, "t.py::A::b": 1.0, "t.py::B::a": 5.0, "t.py::test_c": 0.5}
+        ordered = [item.nodeid for item in longest_first(items, estimates)]  # C::a - median of known tests (1.0)
+        assert ordered == ["t.py::B::a", "t.py::A::a", "t.py::A::b", "t.py::C::a", "t.py::test_c"]
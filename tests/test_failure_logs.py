@@ -0,0 +1,49 @@
+"""
+Framework test of DEBUG logs written only for failed tests.
+"""
+
+import os
+
+import pytest
+
+pytest_plugins = ("pytester",)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+LOGGING_TESTS = """
+from utilities.logger import get_logger
+
+LOGGER = get_logger("showcase")
+
+
+def test_pass():
+    LOGGER.debug("debug of passing test")
+    LOGGER.info("info of passing test")
+
+
+def test_fail():
+    LOGGER.debug("debug of failing test")
+    assert False
+"""
+
+
+@pytest.mark.unit
+class TestFailureLogs:
+    """
+    Test ring buffer of DEBUG logs (run in a subprocess - the plugin switches the process-wide log backend).
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def test_logs_on_failure(self, pytester, monkeypatch):
+        """Test that buffered DEBUG records are written for the failed test and dropped for the passed one."""
+        monkeypatch.setenv("PYTHONPATH", ROOT)
+        pytester.mkdir("reports")
+        pytester.makepyfile(test_logging=LOGGING_TESTS)
+        result = pytester.runpytest_subprocess("-p", "utilities.plugins.failure_logs", "--debug-logs-on-failure")
+        result.assert_outcomes(passed=1, failed=1)
+        log = (pytester.path / "reports" / "logger-logs.log").read_text(encoding="utf-8")
+        assert "info of passing test" in log
+        assert "debug of passing test" not in log
+        assert "DEBUG records (1) of: test_logging.py::test_fail (call)" in log
+        assert "debug of failing test" in log
@@ -0,0 +1,161 @@
+"""
+Framework test of flaky test quarantine.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from utilities.plugins.flaky import flake_rate, quarantine_reason
+from utilities.plugins.step_chain import StepChains
+
+pytest_plugins = ("pytester",)
+
+NODEID = "tests/test_shop.py::TestOrder::test_checkout_page"
+
+# Class scoped fixture stands for the browser - a test fails only on the first browser of its parameter set
+RETRIED_TESTS = """
+import pathlib
+
+import pytest
+
+EVENTS = pathlib.Path("events.txt")
+
+
+def _log(event):
+    with EVENTS.open("a", encoding="utf-8") as file:
+        file.write(event + "\\n")
+
+
+@pytest.fixture(scope="class")
+def browser(row):
+    launches = EVENTS.read_text(encoding="utf-8").count(f"launch {row}") if EVENTS.exists() else 0
+    _log(f"launch {row}")
+    yield launches
+    _log(f"quit {row}")
+
+
+@pytest.mark.parametrize("row", ["a", "b"], scope="class")
+class TestOrder:
+    def test_cart(self, browser, row):
+        _log(f"cart {row}")
+
+    def test_checkout(self, browser, row):
+        _log(f"checkout {row}")
+        assert row == "a" or browser > 0
+"""
+
+# Hook wrapper of another plugin recording the test it wraps
+PROTOCOL_WRAPPER = """
+import pathlib
+
+import pytest
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item):
+    with pathlib.Path("protocol.txt").open("a", encoding="utf-8") as file:
+        file.write(f"start {item.name}\\n")
+    yield
+    with pathlib.Path("protocol.txt").open("a", encoding="utf-8") as file:
+        file.write(f"end {item.name}\\n")
+"""
+
+QUARANTINED_TESTS = """
+import pytest
+
+
+class TestBroken:
+    def test_cart(self):
+        pass
+
+    @pytest.mark.quarantine("JIRA-123 timing issue")
+    def test_checkout(self):
+        assert False
+
+
+class TestStable:
+    def test_cart(self):
+        pass
+"""
+
+
+def _test(marker=None):
+    return SimpleNamespace(nodeid=NODEID, name="test_checkout_page", get_closest_marker=lambda name: marker)
+
+
+@pytest.mark.unit
+class TestQuarantine:
+    """
+    Test quarantine of flaky tests.
+    """
+
+    def test_flake_rate(self):
+        """Test ratio of runs passed only after retry."""
+        assert flake_rate({"runs": 10, "flaky": 2, "failed": 1}) == 0.2
+        assert flake_rate({}) == 0.0
+
+    def test_quarantine_reason(self):
+        """Test that a test is quarantined by the marker or by flake rate above threshold after enough runs."""
+        marker = SimpleNamespace(args=("JIRA-123 timing issue",))
+        assert quarantine_reason(_test(marker), {}, 0.2) == "quarantined: JIRA-123 timing issue"
+        assert quarantine_reason(_test(), {NODEID: {"runs": 5, "flaky": 2}}, 0.2) == (
+            "quarantined: test_checkout_page flake rate 40% in 5 runs"
+        )
+        assert quarantine_reason(_test(), {NODEID: {"runs": 4, "flaky": 4}}, 0.2) is None
+        assert quarantine_reason(_test(), {NODEID: {"runs": 10, "flaky": 2}}, 0.2) is None
+
+    def test_reset_step_chain(self):
+        """Test that a retried parameter set starts with unbroken step chain."""
+        chains = StepChains()
+        chains.record(SimpleNamespace(nodeid=NODEID, name="test_checkout_page"))
+        chains.record(SimpleNamespace(nodeid="tests/test_shop.py::TestCart::test_cart", name="test_cart"))
+        chains.reset(SimpleNamespace(nodeid="tests/test_shop.py::TestOrder::test_cart"))
+        assert list(chains.failed) == [("tests/test_shop.py::TestCart", ())]
+
+    def test_retry(self, pytester):
+        """Test that only the failed parameter set is run again on a new browser and only its last attempt is logged."""
+        pytester.makepyfile(test_order=RETRIED_TESTS)
+        result = pytester.runpytest("-p", "utilities.plugins.flaky", "--retry-classes=1")
+        result.assert_outcomes(passed=4)
+        result.stdout.fnmatch_lines(["*passed after retry: test_order.py::TestOrder::test_checkout[[]b[]]"])
+        assert (pytester.path / "events.txt").read_text(encoding="utf-8").split("\n")[:-1] == [
+            "launch a",
+            "cart a",
+            "checkout a",
+            "quit a",
+            "launch b",
+            "cart b",
+            "checkout b",
+            "quit b",
+            "launch b",
+            "cart b",
+            "checkout b",
+            "quit b",
+        ]
+
+    def test_retry_protocol(self, pytester):
+        """Test that each retried test runs through its own protocol call, so hook wrappers of other plugins see it."""
+        pytester.makeconftest(PROTOCOL_WRAPPER)
+        pytester.makepyfile(test_order=RETRIED_TESTS)
+        pytester.runpytest("-p", "utilities.plugins.flaky", "--retry-classes=1").assert_outcomes(passed=4)
+        protocol = (pytester.path / "protocol.txt").read_text(encoding="utf-8").split("\n")[:-1]
+        assert protocol[4:] == [
+            "start test_cart[b]",
+            "end test_cart[b]",
+            "start test_checkout[b]",
+            "end test_checkout[b]",
+            "start test_cart[b]",
+            "end test_cart[b]",
+            "start test_checkout[b]",
+            "end test_checkout[b]",
+        ]
+
+    def test_quarantine_lane(self, pytester):
+        """Test that the whole class of a quarantined test is run only in the lane and its failures are xfailed."""
+        pytester.makepyfile(test_order=QUARANTINED_TESTS)
+        result = pytester.runpytest("-p", "utilities.plugins.flaky", "--quarantine-lane")
+        result.assert_outcomes(passed=1, xfailed=1, deselected=1)
+        result = pytester.runpytest("-p", "utilities.plugins.flaky", "--retry-classes=1")
+        result.assert_outcomes(passed=1, deselected=2)
+        result.stdout.fnmatch_lines(["*deselected (quarantined: JIRA-123 timing issue): test_order.py::TestBroken"])
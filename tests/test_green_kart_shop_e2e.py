@@ -2,19 +2,14 @@
 End-to-end tests of GreenKart Shop page.
 """
 
-import json
-
 import pytest
 
 from pages.rsa_pages.green_kart_pages.green_kart_cart_page import GreenKartCheckoutPage
 from pages.rsa_pages.green_kart_pages.green_kart_delivery_page import GreenKartDeliveryPage
 from pages.rsa_pages.green_kart_pages.green_kart_main_page import GreenKartMainPage
 from utilities.base_product import EmptyProductPlaceholder
-from utilities.data_class import DataClass
 
-TEST_DATA_PATH = "./test_data/test_green_kart_shop_e2e.json"
-with open(file=TEST_DATA_PATH, encoding="utf-8") as json_file:
-    data = json.load(json_file)
+TEST_DATA_FILE = "test_green_kart_shop_e2e.json"
 
 
 @pytest.fixture(scope="class")
@@ -28,8 +23,9 @@ def class_fixture(request, test_fixture):
 
 
 @pytest.mark.e2e
+@pytest.mark.step_chain
 @pytest.mark.usefixtures("class_fixture")
-@pytest.mark.parametrize("test_data_set", data.get("order_basic"), scope="class")
+@pytest.mark.dataset(TEST_DATA_FILE, "order_basic")
 class TestGreenKartShopOrderBasic:
     """
     Test basic order scenario.
@@ -37,19 +33,7 @@ class TestGreenKartShopOrderBasic:
 
     # pylint: disable=no-member
 
-    @pytest.fixture
-    def test_data(self, test_data_set):
-        """
-        Test data fixture.
-
-        :param test_data_set: dict
-        :return: DataClass()
-                        .product_name
-                        .delivery_country
-                        .type_len
-        """
-        return DataClass(test_data_set)
-
+    @pytest.mark.max_webdriver_commands(10)
     def test_go_to_page(self, test_data):
         """Start test."""
         self.tools.logger.info("Start basic order scenario test for GreenKart Shop page.")
@@ -58,6 +42,7 @@ class TestGreenKartShopOrderBasic:
 
         assert self.page.get_title() == test_data.page_title
 
+    @pytest.mark.max_webdriver_commands(30)
     def test_add_product_to_cart(self, test_data):
         """Test if product is added to cart."""
         self.tools.logger.info("Add product to cart and verify if cart info is correct.")
@@ -66,6 +51,7 @@ class TestGreenKartShopOrderBasic:
         assert self.page.get_cart_items_number() == test_data.product_quantity
         assert self.page.get_cart_total_price() == test_data.product_price
 
+    @pytest.mark.max_webdriver_commands(25)
     def test_cart_preview(self, test_data):
         """Test if cart preview works correctly."""
         self.tools.logger.info("Verify if cart preview shows correct data.")
@@ -84,6 +70,7 @@ class TestGreenKartShopOrderBasic:
         assert product.price == test_data.product_price
         assert product.total_price == test_data.product_price
 
+    @pytest.mark.max_webdriver_commands(20)
     def test_checkout_page(self, test_data):
         """Test if checkout page works correctly."""
         self.tools.logger.info("Verify if checkout page shows correct data.")
@@ -152,28 +139,16 @@ class TestGreenKartShopOrderBasic:
 
 
 @pytest.mark.e2e
+@pytest.mark.step_chain
 @pytest.mark.usefixtures("class_fixture")
-@pytest.mark.parametrize("test_data_set", data.get("page_search_box"), scope="class")
+@pytest.mark.dataset(TEST_DATA_FILE, "page_search_box")
 @pytest.mark.skip(reason="to be implemented")
 class TestGreenKartShopSearchBox:
     """
     Test search box scenario.
     """
 
-    # pylint: disable=no-member
-
-    @pytest.fixture
-    def test_data(self, test_data_set):
-        """
-        Test data fixture.
-
-        :param test_data_set: dict
-        :return: DataClass()
-                        .product_name
-                        .delivery_country
-                        .type_len
-        """
-        return DataClass(test_data_set)
+    # pylint: disable=no-member,too-few-public-methods
 
     def test_go_to_page(self, test_data):
         """Start test."""
@@ -184,28 +159,16 @@ class TestGreenKartShopSearchBox:
 
 
 @pytest.mark.e2e
+@pytest.mark.step_chain
 @pytest.mark.usefixtures("class_fixture")
-@pytest.mark.parametrize("test_data_set", data.get("products_removal"), scope="class")
+@pytest.mark.dataset(TEST_DATA_FILE, "products_removal")
 @pytest.mark.skip(reason="to be implemented")
 class TestGreenKartShopOrderWithRemovals:
     """
     Test order with products removal scenario.
     """
 
-    # pylint: disable=no-member
-
-    @pytest.fixture
-    def test_data(self, test_data_set):
-        """
-        Test data fixture.
-
-        :param test_data_set: dict
-        :return: DataClass()
-                        .product_name
-                        .delivery_country
-                        .type_len
-        """
-        return DataClass(test_data_set)
+    # pylint: disable=no-member,too-few-public-methods
 
     def test_go_to_page(self, test_data):
         """Start test."""
@@ -216,28 +179,16 @@ class TestGreenKartShopOrderWithRemovals:
 
 
 @pytest.mark.e2e
+@pytest.mark.step_chain
 @pytest.mark.usefixtures("class_fixture")
-@pytest.mark.parametrize("test_data_set", data.get("discount_code"), scope="class")
+@pytest.mark.dataset(TEST_DATA_FILE, "discount_code")
 @pytest.mark.skip(reason="to be implemented")
 class TestGreenKartShopOrderWithDiscountCode:
     """
     Test order with discount code application scenario.
     """
 
-    # pylint: disable=no-member
-
-    @pytest.fixture
-    def test_data(self, test_data_set):
-        """
-        Test data fixture.
-
-        :param test_data_set: dict
-        :return: DataClass()
-                        .product_name
-                        .delivery_country
-                        .type_len
-        """
-        return DataClass(test_data_set)
+    # pylint: disable=no-member,too-few-public-methods
 
     def test_go_to_page(self, test_data):
         """Start test."""
@@ -0,0 +1,117 @@
+"""
+Framework test of test impact analysis.
+"""
+
+import os
+import sys
+
+import pytest
+
+from pages.base_page import BasePage
+from utilities.plugins.impact import ImpactRecorder, affected, framework_module
+
+IMPACT_MAP = {
+    "tests/test_shop.py::TestCart": ["pages/cart_page.py", "utilities/control_objects/button.py"],
+    "tests/test_shop.py::TestMain": ["pages/main_page.py"],
+    "tests/test_page.py::TestPage": ["pages/practice_page.py"],
+    "tests/test_order.py::TestOrder[order_basic-0]": ["pages/main_page.py"],
+    "tests/test_order.py::TestOrder[order_basic-1]": ["pages/main_page.py", "pages/cart_page.py"],
+}
+
+
+class _Item:
+    # pylint: disable=too-few-public-methods
+    def __init__(self, nodeid):
+        self.nodeid = nodeid
+
+    def iter_markers(self, name):  # pylint: disable=unused-argument
+        """No markers."""
+        return iter(())
+
+
+@pytest.mark.unit
+class TestImpact:
+    """
+    Test affected() and framework_module() functions.
+    """
+
+    @pytest.fixture
+    def items(self):
+        """Setup test items (the last one without record in the impact map)."""
+        nodeids = [
+            "tests/test_shop.py::TestCart::test_preview",
+            "tests/test_shop.py::TestMain::test_search",
+            "tests/test_page.py::TestPage::test_title",
+            "tests/test_order.py::TestOrder::test_go_to_page[order_basic-0]",
+            "tests/test_order.py::TestOrder::test_checkout[order_basic-0]",
+            "tests/test_order.py::TestOrder::test_go_to_page[order_basic-1]",
+            "tests/test_order.py::TestOrder::test_checkout[order_basic-1]",
+            "tests/test_new.py::TestNew::test_new",
+        ]
+        return [_Item(nodeid) for nodeid in nodeids]
+
+    def test_changed_module(self, items):
+        """Test selection by executed framework module and by new tests."""
+        selected = affected(items, {"utilities/control_objects/button.py", "README.md"}, IMPACT_MAP)
+        assert [item.nodeid for item in selected] == [
+            "tests/test_shop.py::TestCart::test_preview",
+            "tests/test_new.py::TestNew::test_new",
+        ]
+
+    def test_whole_scenario(self, items):
+        """Test that all steps of the affected parameter set are selected (and only of that one)."""
+        selected = affected(items, {"pages/cart_page.py"}, IMPACT_MAP)
+        assert [item.nodeid for item in selected] == [
+            "tests/test_shop.py::TestCart::test_preview",
+            "tests/test_order.py::TestOrder::test_go_to_page[order_basic-1]",
+            "tests/test_order.py::TestOrder::test_checkout[order_basic-1]",
+            "tests/test_new.py::TestNew::test_new",
+        ]
+
+    def test_changed_test_module(self, items):
+        """Test selection by test module."""
+        assert len(affected(items, {"tests/test_shop.py"}, IMPACT_MAP)) == 3
+
+    def test_changed_plugin(self, items):
+        """Test that changed plugin selects all tests."""
+        assert len(affected(items, {"utilities/plugins/timeline.py"}, IMPACT_MAP)) == 8
+
+    def test_framework_module(self):
+        """Test framework_module() function."""
+        root = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+        assert framework_module(os.path.join(root, "pages", "base_page.py")) == "pages/base_page.py"
+        assert framework_module(os.path.join(root, "utilities", "plugins", "impact.py")) is None
+        assert framework_module(os.path.join(root, "tests", "test_impact.py")) is None
+        assert framework_module(pytest.__file__) is None
+
+
+@pytest.mark.unit
+class TestImpactRecorder:
+    """
+    Test ImpactRecorder object.
+    """
+
+    # pylint: disable=protected-access,no-member
+
+    def test_first_call_per_test(self):
+        """Test that framework code is recorded in each test without re-enabling events of other code."""
+        recorder = ImpactRecorder()
+        code = BasePage.go_to.__code__
+        assert recorder._on_start(code, 0) is None
+        assert recorder._on_start(code, 0) is None
+        assert recorder._on_start(pytest.main.__code__, 0) is sys.monitoring.DISABLE
+        assert recorder.reset() == {"pages/base_page.py"}
+        assert recorder.reset() == set()
+        recorder._on_start(code, 0)
+        assert recorder.reset() == {"pages/base_page.py"}
+
+    def test_start_stop(self):
+        """Test that the recorder frees its sys.monitoring tool id."""
+        recorder = ImpactRecorder()
+        recorder.start()
+        tool_id = recorder._tool_id
+        try:
+            assert sys.monitoring.get_tool(tool_id) == "impact"
+        finally:
+            recorder.stop()
+        assert sys.monitoring.get_tool(tool_id) is None
@@ -0,0 +1,82 @@
+"""
+Framework test of structured log analyzer.
+"""
+
+import io
+import json
+
+import pytest
+
+from utilities.log_analyzer import LatencyHistogram, LogAnalyzer
+
+
+@pytest.mark.unit
+class TestLatencyHistogram:
+    """
+    Test LatencyHistogram object.
+    """
+
+    @pytest.fixture
+    def histogram(self):
+        """Setup object-under-test."""
+        histogram = LatencyHistogram()
+        for duration_ms in range(1, 101):
+            histogram.add(float(duration_ms))
+        return histogram
+
+    def test_aggregates(self, histogram):
+        """Test count, mean and max values."""
+        assert histogram.count == 100
+        assert histogram.mean == pytest.approx(50.5)
+        assert histogram.max == 100.0
+
+    @pytest.mark.parametrize("percent, expected", [(50.0, 50.0), (90.0, 90.0), (99.0, 99.0)])
+    def test_percentile(self, histogram, percent, expected):
+        """Test percentile() method precision."""
+        assert histogram.percentile(percent) == pytest.approx(expected, rel=0.05)
+
+    def test_percentile_empty(self):
+        """Test percentile() method of empty histogram."""
+        assert LatencyHistogram().percentile(95.0) == 0.0
+
+
+@pytest.mark.unit
+class TestLogAnalyzer:
+    """
+    Test LogAnalyzer object.
+    """
+
+    @pytest.fixture
+    def analyzer(self):
+        """Setup object-under-test."""
+        lines = [
+            json.dumps({"message": "no duration"}),
+            "not a JSON line",
+            json.dumps({"action": "click", "locator": "('id', 'a')", "page": "APage", "duration_ms": 10.0}),
+            json.dumps({"action": "click", "locator": "('id', 'b')", "page": "APage", "duration_ms": 300.0}),
+            json.dumps({"action": "set_text", "locator": "('id', 'c')", "page": "BPage", "duration_ms": 20.0}),
+        ]
+        analyzer = LogAnalyzer()
+        analyzer.feed(lines)
+        return analyzer
+
+    def test_feed(self, analyzer):
+        """Test feed() method."""
+        assert analyzer.records == 5
+        assert analyzer.skipped == 2
+        assert analyzer.actions["click"].count == 2
+        assert analyzer.actions["set_text"].count == 1
+
+    def test_slowest_locators(self, analyzer):
+        """Test slowest_locators() method."""
+        assert [key for key, _ in analyzer.slowest_locators(2)] == [
+            ("APage", "('id', 'b')", "click"),
+            ("BPage", "('id', 'c')", "set_text"),
+        ]
+
+    def test_report(self, analyzer):
+        """Test report() method."""
+        output = io.StringIO()
+        analyzer.report(output, top=1)
+        assert "click" in output.getvalue()
+        assert "APage click ('id', 'b')" in output.getvalue()
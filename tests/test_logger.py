@@ -0,0 +1,65 @@
+"""
+Framework test of the shared log backend.
+"""
+
+import os
+
+import pytest
+
+pytest_plugins = ("pytester",)
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+BACKEND_TESTS = """
+import logging
+import os
+from logging.handlers import QueueHandler
+
+from utilities.logger import LOGGER_FILE_PATH, flush, get_logger, reset_log_file
+
+
+def _read_log():
+    with open(LOGGER_FILE_PATH, encoding="utf-8") as file:
+        return file.read()
+
+
+def test_single_handler():
+    assert get_logger("showcase") is get_logger("showcase")
+    get_logger.cache_clear()
+    get_logger("showcase")
+    assert sum(isinstance(handler, QueueHandler) for handler in logging.getLogger("showcase").handlers) == 1
+
+
+def test_flush():
+    get_logger("showcase").warning("queued record")
+    flush()
+    assert "queued record" in _read_log()
+
+
+def test_reset_log_file():
+    get_logger("showcase").warning("record before reset")
+    reset_log_file()
+    assert not os.path.exists(LOGGER_FILE_PATH)
+    get_logger("showcase").warning("record after reset")
+    flush()
+    log = _read_log()
+    assert "record after reset" in log
+    assert "record before reset" not in log
+"""
+
+
+@pytest.mark.unit
+class TestLogBackend:
+    """
+    Test shared queue backend of loggers (run in a subprocess - the backend is process-wide).
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def test_backend(self, pytester, monkeypatch):
+        """Test that loggers get one queue handler, flush() drains the queue and the log file is reopened on reset."""
+        monkeypatch.setenv("PYTHONPATH", ROOT)
+        pytester.mkdir("reports")
+        pytester.makepyfile(test_backend=BACKEND_TESTS)
+        result = pytester.runpytest_subprocess()
+        result.assert_outcomes(passed=3)
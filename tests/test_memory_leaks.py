@@ -0,0 +1,98 @@
+"""
+Framework test of memory growth detection.
+"""
+
+import tracemalloc
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+from selenium import webdriver
+from selenium.common import WebDriverException
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+
+from utilities.plugins.memory_leaks import MIB, _MemoryLeakHooks, browser_metrics
+
+
+def _item(driver):
+    return SimpleNamespace(funcargs={"browser_instance": SimpleNamespace(driver=driver)})
+
+
+def _chromium(js_heap):
+    driver = MagicMock(spec=ChromiumDriver)
+    driver.execute_cdp_cmd.return_value = {
+        "metrics": [{"name": "JSHeapUsedSize", "value": js_heap}, {"name": "LayoutCount", "value": 3}]
+    }
+    return driver
+
+
+@pytest.mark.unit
+class TestBrowserMetrics:
+    """
+    Test reading of browser memory metrics.
+    """
+
+    def test_chromium(self):
+        """Test that only memory metrics are read from Chromium browsers."""
+        driver = _chromium(1000.0)
+        assert browser_metrics(_item(driver)) == {"JSHeapUsedSize": 1000.0}
+        driver.execute_cdp_cmd.side_effect = WebDriverException("target closed")
+        assert browser_metrics(_item(driver)) == {}
+
+    def test_other_browsers(self):
+        """Test that other browsers are not asked for DevTools metrics (remote WebDriver has execute_cdp_cmd too)."""
+        driver = MagicMock(spec=webdriver.Firefox)
+        assert browser_metrics(_item(driver)) == {}
+        driver.execute_cdp_cmd.assert_not_called()
+        assert browser_metrics(SimpleNamespace(funcargs={})) == {}
+
+
+@pytest.mark.unit
+class TestMemoryLeakHooks:
+    """
+    Test comparison of memory snapshots of a test class.
+    """
+
+    # pylint: disable=protected-access
+
+    @pytest.fixture
+    def hooks(self):
+        """Setup object-under-test."""
+        tracing = tracemalloc.is_tracing()
+        if not tracing:
+            tracemalloc.start()
+        hooks = _MemoryLeakHooks(threshold_mib=1.0)
+        hooks.group = "t.py::TestShop"
+        hooks.snapshot = tracemalloc.take_snapshot()
+        yield hooks
+        if not tracing:
+            tracemalloc.stop()
+
+    def test_growth(self, hooks):
+        """Test that Python memory and browser JS heap growth of the class are compared with the threshold."""
+        leaked = [bytearray(1024) for _ in range(2048)]
+        hooks.browser_before = browser_metrics(_item(_chromium(1000.0)))
+        hooks.browser_after = browser_metrics(_item(_chromium(1500.0)))
+        result = hooks._compare()
+        assert result.nodeid == "t.py::TestShop"
+        assert result.python_growth >= 2 * MIB
+        assert result.top_sites[0].traceback[0].filename == __file__
+        assert result.browser_growth == {"JSHeapUsedSize": 500.0}
+        assert hooks._exceeded(result)
+        assert not hooks._exceeded(result._replace(python_growth=0))
+        assert hooks._exceeded(result._replace(python_growth=0, browser_growth={"JSHeapUsedSize": 2 * MIB}))
+        assert len(leaked) == 2048
+
+    def test_teardown_fails(self, hooks):
+        """Test that passed teardown of the last test of the class fails when memory grew above the threshold."""
+        leaked = [bytearray(1024) for _ in range(2048)]
+        hooks.last_in_group = True
+        report = SimpleNamespace(passed=True, outcome="passed", longrepr=None)
+        makereport = hooks.pytest_runtest_makereport(_item(None), SimpleNamespace(when="teardown"))
+        next(makereport)
+        with pytest.raises(StopIteration):
+            makereport.send(SimpleNamespace(get_result=lambda: report))
+        assert report.outcome == "failed"
+        assert report.longrepr.startswith("t.py::TestShop: Python memory grew by")
+        assert [result.nodeid for result in hooks.results] == ["t.py::TestShop"]
+        assert len(leaked) == 2048
@@ -0,0 +1,66 @@
+"""
+Framework test of navigation timing recorder.
+"""
+
+import os
+import subprocess
+import sys
+from unittest.mock import MagicMock
+
+import pytest
+
+from utilities.navigation_timing import TOP_RESOURCES, NavigationTimingRecorder
+
+ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+
+@pytest.mark.unit
+class TestNavigationTimingRecorder:
+    """
+    Test NavigationTimingRecorder object.
+    """
+
+    @pytest.fixture
+    def recorder(self):
+        """Setup object-under-test."""
+        recorder = NavigationTimingRecorder()
+        recorder.enabled = True
+        recorder.user_properties = []
+        return recorder
+
+    def test_record(self, recorder):
+        """Test that timings of document loads and route changes are attached to the test and summarized."""
+        driver = MagicMock()
+        driver.execute_script.side_effect = [
+            {"ttfb": 100, "load": 900},
+            {"ttfb": 300, "load": 500},
+            {"route_change": 50},
+        ]
+        recorder.record(driver, "ShopPage")
+        recorder.record(driver, "ShopPage")
+        recorder.record(driver, "CartPage", route_start=1234.5)
+        assert driver.execute_script.call_args.args[1:] == (TOP_RESOURCES, 1234.5)
+        assert [timing["page"] for _, timing in recorder.user_properties] == ["ShopPage", "ShopPage", "CartPage"]
+        assert recorder.summary() == {
+            "CartPage": {"navigations": 1, "route_change": 50},
+            "ShopPage": {"navigations": 2, "ttfb": 200, "load": 700},
+        }
+
+    def test_no_navigation_entry(self, recorder):
+        """Test that a navigation without timing data (script returns null) is skipped."""
+        recorder.record(MagicMock(**{"execute_script.return_value": None}), "ShopPage")
+        assert not recorder.timings
+        assert not recorder.user_properties
+
+    def test_disabled(self, recorder):
+        """Test that no script is run when recording is disabled."""
+        recorder.enabled = False
+        driver = MagicMock()
+        recorder.record(driver, "ShopPage")
+        driver.execute_script.assert_not_called()
+        assert not recorder.timings
+
+    def test_pages_without_pytest(self):
+        """Test that page objects (importing the recorder) do not import pytest."""
+        script = "import sys, pages.base_page; sys.exit('pytest' in sys.modules or '_pytest' in sys.modules)"
+        assert subprocess.run([sys.executable, "-c", script], cwd=ROOT, check=False).returncode == 0
@@ -0,0 +1,56 @@
+"""
+Framework test of page affinity (driver handover between test classes).
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from utilities.page_affinity import PageAffinity
+
+
+@pytest.mark.unit
+class TestPageAffinity:
+    """
+    Test PageAffinity object.
+    """
+
+    @pytest.fixture
+    def affinity(self):
+        """Setup object-under-test."""
+        affinity = PageAffinity()
+        affinity.enabled = True
+        return affinity
+
+    def test_handover(self, affinity):
+        """Test that driver of read-only class is taken by the next class with the loaded page."""
+        driver = MagicMock(current_url="https://example.com/practice")
+        page = SimpleNamespace(url="https://example.com/practice")
+        affinity.start("t.py::A", successor="t.py::B")
+        assert affinity.take() is None
+        assert not affinity.visit(page)
+        assert affinity.park(driver)
+        affinity.start("t.py::B")
+        assert affinity.take() is driver
+        assert affinity.visit(page)
+        assert not affinity.visit(page)
+        assert not affinity.park(driver)
+        driver.quit.assert_not_called()
+        assert affinity.visited == {"t.py::A": "SimpleNamespace", "t.py::B": "SimpleNamespace"}
+
+    def test_release_not_taken(self, affinity):
+        """Test that parked driver is quitted if another class runs."""
+        driver = MagicMock(current_url="https://example.com/practice")
+        affinity.start("t.py::A", successor="t.py::B")
+        assert affinity.park(driver)
+        affinity.start("t.py::C")
+        driver.quit.assert_called_once()
+        assert affinity.take() is None
+        assert not affinity.visit(SimpleNamespace(url="https://example.com/practice"))
+
+    def test_disabled(self):
+        """Test that drivers are not parked without --page-affinity."""
+        affinity = PageAffinity()
+        affinity.start("t.py::A", successor="t.py::B")
+        assert not affinity.park(MagicMock())
@@ -0,0 +1,85 @@
+"""
+Framework test of pairwise expansion of test data.
+"""
+
+import itertools
+
+import pytest
+
+from utilities.pairwise import covering_array, expand_dataset
+
+DIMENSIONS = {
+    "product_name": ["Blackberry", "iphone X", "Samsung Note 8", "Nokia Edge"],
+    "delivery_country": ["Poland", "India", "United States of America"],
+    "type_len": [2, 3, -1],
+    "product_quantity": [1.0, 3.0],
+}
+
+
+def _combinations(rows, fields, strength):
+    return {
+        (names, tuple(row[name] for name in names))
+        for row in rows
+        for names in itertools.combinations(fields, strength)
+    }
+
+
+@pytest.mark.unit
+class TestCoveringArray:
+    """
+    Test covering_array() function.
+    """
+
+    @pytest.mark.parametrize("strength", [1, 2, 3])
+    def test_coverage(self, strength):
+        """Test that every combination of values is covered with fewer rows than the full cartesian product."""
+        rows = covering_array(DIMENSIONS, strength)
+        full = [dict(zip(DIMENSIONS, values)) for values in itertools.product(*DIMENSIONS.values())]
+        assert _combinations(rows, list(DIMENSIONS), strength) == _combinations(full, list(DIMENSIONS), strength)
+        assert len(rows) < len(full)
+
+    def test_forbidden(self):
+        """Test that forbidden combinations do not occur and the rest is covered."""
+        forbidden = [{"type_len": 2, "delivery_country": "India"}, {"product_name": "Nokia Edge", "type_len": -1}]
+        rows = covering_array(DIMENSIONS, forbidden=forbidden)
+        for combination in forbidden:
+            assert not any(all(row[name] == value for name, value in combination.items()) for row in rows)
+        assert {(row["delivery_country"], row["type_len"]) for row in rows} == {
+            (country, type_len)
+            for country, type_len in itertools.product(DIMENSIONS["delivery_country"], DIMENSIONS["type_len"])
+            if (country, type_len) != ("India", 2)
+        }
+
+    def test_forbidden_dead_end(self):
+        """Test that a combination is covered although the greedy choice of an earlier dimension forbids it."""
+        dimensions = {"A": ["a1", "a2"], "B": ["b1", "b2"], "C": ["c1", "c2"], "D": ["d1", "d2"]}
+        forbidden = [{"A": "a1", "C": "c1"}, {"B": "b1", "C": "c2"}]
+        rows = covering_array(dimensions, forbidden=forbidden)
+        valid = [
+            row
+            for row in (dict(zip(dimensions, values)) for values in itertools.product(*dimensions.values()))
+            if not any(all(row[name] == value for name, value in combination.items()) for combination in forbidden)
+        ]
+        assert any(row["A"] == "a1" and row["D"] == "d2" for row in rows)
+        assert _combinations(rows, list(dimensions), 2) == _combinations(valid, list(dimensions), 2)
+        assert all(row in valid for row in rows)
+
+    def test_dict_values(self):
+        """Test that items of dict values are merged into rows."""
+        products = [{"product_name": "Blackberry", "product_price": 50000.0}, {"product_name": "iphone X"}]
+        rows = covering_array({"product": products, "type_len": [2, 3]})
+        assert len(rows) == 4
+        assert {"product_name": "Blackberry", "product_price": 50000.0, "type_len": 3} in rows
+        assert all("product" not in row for row in rows)
+
+    def test_invalid_strength(self):
+        """Test validation of strength."""
+        with pytest.raises(ValueError, match="Strength"):
+            covering_array(DIMENSIONS, 5)
+
+    def test_expand_dataset(self):
+        """Test expand_dataset() function."""
+        rows = expand_dataset({"fixed": {"product_quantity": 1.0}, "dimensions": {"type_len": [2, 3]}, "strength": 1})
+        assert rows == [{"product_quantity": 1.0, "type_len": 2}, {"product_quantity": 1.0, "type_len": 3}]
+        with pytest.raises(TypeError):
+            expand_dataset({"dimensions": [2, 3]})
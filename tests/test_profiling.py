@@ -0,0 +1,49 @@
+"""
+Framework test of per-test profiling.
+"""
+
+import pstats
+
+import pytest
+
+from utilities.plugins.profiling import PROFILES_DIR, SESSION_PROFILE
+
+pytest_plugins = ("pytester",)
+
+PROFILED_TESTS = """
+from utilities.pairwise import expand_dataset
+
+
+def test_pairwise():
+    assert len(expand_dataset({"dimensions": {"a": [1, 2], "b": [3, 4]}})) == 4
+
+
+def test_plain():
+    assert sum(range(10)) == 45
+"""
+
+
+@pytest.mark.unit
+class TestProfiling:
+    """
+    Test profiling plugin.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def test_profiles(self, pytester):
+        """Test that each test is saved as a separate profile and all profiles are merged into the session one."""
+        profiles = pytester.mkdir("reports").joinpath("profiles")
+        profiles.mkdir()
+        (profiles / "test_previous_session.pstats").write_text("", encoding="utf-8")
+        pytester.makepyfile(test_profiled=PROFILED_TESTS)
+        result = pytester.runpytest("-p", "utilities.plugins.profiling", "--profile-tests")
+        result.assert_outcomes(passed=2)
+        result.stdout.fnmatch_lines(["*framework functions by cumulative time (2 tests)*", "*utilities/pairwise.py:*"])
+        paths = sorted(path.name for path in (pytester.path / PROFILES_DIR).iterdir())
+        assert len(paths) == 3
+        assert paths[0] == SESSION_PROFILE
+        assert paths[1].startswith("test_profiled.py_test_pairwise-")
+        assert paths[2].startswith("test_profiled.py_test_plain-")
+        functions = {name for _, _, name in pstats.Stats(str(pytester.path / PROFILES_DIR / SESSION_PROFILE)).stats}
+        assert {"test_pairwise", "test_plain", "expand_dataset"} <= functions
@@ -0,0 +1,39 @@
+"""
+Framework test of step chains.
+"""
+
+from types import SimpleNamespace
+
+import pytest
+
+from utilities.plugins.step_chain import StepChains
+
+
+def _step(name, row):
+    return SimpleNamespace(
+        nodeid=f"tests/test_shop.py::TestOrder::{name}[order_basic-{row}]",
+        name=f"{name}[order_basic-{row}]",
+        callspec=SimpleNamespace(indices={"test_data": row}),
+    )
+
+
+@pytest.mark.unit
+class TestStepChains:
+    """
+    Test StepChains object.
+    """
+
+    def test_failed_step(self):
+        """Test that only the chain of the failed step (the same parameter set) is broken by its first failure."""
+        chains = StepChains()
+        chains.record(_step("test_add_product_to_cart", 1))
+        chains.record(_step("test_cart_preview", 1))
+        assert chains.failed_step(_step("test_checkout_page", 1)) == "test_add_product_to_cart[order_basic-1]"
+        assert chains.failed_step(_step("test_checkout_page", 0)) is None
+
+    def test_not_parametrized(self):
+        """Test chain of a class without parameters."""
+        chains = StepChains()
+        chains.record(SimpleNamespace(nodeid="tests/test_shop.py::TestOrder::test_go_to_page", name="test_go_to_page"))
+        step = SimpleNamespace(nodeid="tests/test_shop.py::TestOrder::test_cart_preview", name="test_cart_preview")
+        assert chains.failed_step(step) == "test_go_to_page"
@@ -0,0 +1,72 @@
+"""
+Framework test of structured log fields.
+"""
+
+from types import SimpleNamespace
+from unittest.mock import MagicMock
+
+import pytest
+
+from pages.base_page import BasePage
+from utilities.control_objects.button import Button
+from utilities.logger import LOG_CONTEXT
+from utilities.plugins.structured_logs import pytest_runtest_protocol
+
+
+class _CartView(BasePage):
+    @property
+    def checkout_button(self) -> Button:
+        """Control created by the sub-view."""
+        return Button(self.driver, ("id", "checkout"), owner=self)
+
+
+class _ShopPage(BasePage):
+    @property
+    def cart_view(self) -> _CartView:
+        """Sub-view created by the page."""
+        return _CartView(self.driver)
+
+    @property
+    def cart_button(self) -> Button:
+        """Control created by the page."""
+        return Button(self.driver, ("id", "cart"), owner=self)
+
+
+@pytest.mark.unit
+class TestStructuredLogs:
+    """
+    Test structured fields of framework log records.
+    """
+
+    @pytest.fixture
+    def shop_page(self):
+        """Setup object-under-test."""
+        return _ShopPage(MagicMock())
+
+    def test_action_page(self, shop_page):
+        """Test that control action is logged with the page object owning the control (also for a sub-view)."""
+        cart_button = shop_page.cart_button
+        checkout_button = shop_page.cart_view.checkout_button
+        for button in (cart_button, checkout_button):
+            button.logger = MagicMock()
+            with button.timed_action("click"):
+                pass
+        assert cart_button.logger.debug.call_args.kwargs["extra"]["page"] == "_ShopPage"
+        assert checkout_button.logger.debug.call_args.kwargs["extra"]["page"] == "_CartView"
+
+    def test_control_outside_page(self):
+        """Test that a control created outside page objects has no page."""
+        assert Button(MagicMock(), ("id", "cart")).page is None
+
+    def test_context_cleared(self):
+        """Test that log context is set only for the run of the test in structured mode."""
+        item = SimpleNamespace(nodeid="t.py::TestShop::test_cart", config=SimpleNamespace(getoption=lambda name: True))
+        protocol = pytest_runtest_protocol(item)
+        next(protocol)
+        assert LOG_CONTEXT == {"nodeid": "t.py::TestShop::test_cart"}
+        next(protocol, None)
+        assert not LOG_CONTEXT
+        item.config.getoption = lambda name: False
+        protocol = pytest_runtest_protocol(item)
+        next(protocol)
+        assert not LOG_CONTEXT
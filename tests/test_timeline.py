@@ -0,0 +1,98 @@
+"""
+Framework test of session timeline recorder.
+"""
+
+import threading
+
+import pytest
+from selenium.webdriver.support.wait import WebDriverWait
+
+from pages.base_page import BasePage
+from utilities.control_objects.base_control import _BaseControl
+from utilities.logger import get_logger
+from utilities.pairwise import expand_dataset
+from utilities.plugins.timeline import TimelineRecorder, _categorize, pytest_configure
+
+
+@pytest.mark.unit
+class TestCategorize:
+    """
+    Test filtering of recorded calls.
+    """
+
+    def test_recorded(self):
+        """Test that page, control, framework and wait calls are recorded with their categories."""
+        assert _categorize(BasePage.get_title.__code__) == "page"
+        assert _categorize(BasePage.__init__.__code__) == "page"
+        assert _categorize(_BaseControl.is_displayed.__code__) == "control"
+        assert _categorize(expand_dataset.__code__) == "framework"
+        assert _categorize(WebDriverWait.until.__code__) == "wait"
+
+    def test_skipped(self):
+        """Test that generators, local functions, lambdas, dunders, plugins and other code are skipped."""
+        generator = _BaseControl.timed_action.__wrapped__  # pylint: disable=no-member
+        assert _categorize(generator.__code__) is None
+        assert _categorize(_BaseControl.click.__code__) is None  # wrapper of pre_action
+        assert _categorize(_BaseControl.__str__.__code__) is None
+        assert _categorize((lambda: None).__code__) is None
+        assert _categorize(get_logger.__wrapped__.__code__) is None  # logger is excluded
+        assert _categorize(pytest_configure.__code__) is None  # plugins are excluded
+        assert _categorize(WebDriverWait.__init__.__code__) is None
+        assert _categorize(TestCategorize.test_skipped.__code__) is None
+
+
+@pytest.mark.unit
+class TestTimelineRecorder:
+    """
+    Test pairing of call starts and returns into spans.
+    """
+
+    # pylint: disable=protected-access
+
+    @pytest.fixture
+    def recorder(self):
+        """Setup object-under-test."""
+        return TimelineRecorder()
+
+    def test_nested_calls(self, recorder):
+        """Test that nested calls are closed innermost first."""
+        page, control = BasePage.get_title.__code__, _BaseControl.is_displayed.__code__
+        recorder._on_start(page, 0)
+        recorder._on_start(control, 0)
+        recorder._on_return(control, 0, None)
+        recorder._on_return(page, 0, None)
+        assert [(event["name"], event["cat"]) for event in recorder.events] == [
+            ("_BaseControl.is_displayed", "control"),
+            ("BasePage.get_title", "page"),
+        ]
+        assert recorder.events[0]["ts"] >= recorder.events[1]["ts"]
+        assert not recorder._stack
+
+    def test_unclosed_calls(self, recorder):
+        """Test that calls left open (i.e.: unwound by an exception) are dropped when their caller returns."""
+        page, control = BasePage.get_title.__code__, _BaseControl.is_displayed.__code__
+        recorder._on_start(page, 0)
+        recorder._on_start(control, 0)
+        recorder._close(page, "page")
+        assert [event["name"] for event in recorder.events] == ["BasePage.get_title"]
+        recorder._on_start(page, 0)
+        recorder._close(control, "control")
+        assert len(recorder.events) == 1
+        assert not recorder._stack
+
+    def test_other_thread(self, recorder):
+        """Test that calls in other threads neither create spans nor close spans of the test thread."""
+        page, control = BasePage.get_title.__code__, _BaseControl.is_displayed.__code__
+        recorder._on_start(page, 0)
+
+        def other_thread():
+            recorder._on_start(control, 0)
+            recorder._on_return(page, 0, None)
+            recorder._on_return(control, 0, None)
+
+        thread = threading.Thread(target=other_thread)
+        thread.start()
+        thread.join()
+        assert not recorder.events
+        recorder._on_return(page, 0, None)
+        assert [event["name"] for event in recorder.events] == ["BasePage.get_title"]
@@ -0,0 +1,81 @@
+"""
+Framework test of user contexts (per-class isolation in one browser).
+"""
+
+from unittest.mock import MagicMock, patch
+
+import pytest
+from selenium.common import WebDriverException
+
+from utilities.user_contexts import UserContexts
+
+
+@pytest.mark.unit
+class TestUserContexts:
+    """
+    Test UserContexts object.
+    """
+
+    @pytest.fixture
+    def driver(self):
+        """Setup object-under-test."""
+        driver = MagicMock(current_window_handle="home")
+        driver.browser.create_user_context.side_effect = ["context-1", "context-2"]
+        driver.browsing_context.create.side_effect = ["tab-1", "tab-2"]
+        with patch("utilities.user_contexts._launch", return_value=driver) as launch:
+            yield driver
+        launch.assert_called_once_with("chrome")
+
+    def test_context_per_class(self, driver):
+        """Test that each class gets a new user context of the same browser and its context is removed after it."""
+        contexts = UserContexts()
+        assert contexts.open("chrome") is driver
+        driver.browsing_context.create.assert_called_with(type="tab", user_context="context-1")
+        driver.switch_to.window.assert_called_with("tab-1")
+        contexts.close()
+        driver.browser.remove_user_context.assert_called_once_with("context-1")
+        driver.switch_to.window.assert_called_with("home")
+        assert contexts.open("chrome") is driver
+        driver.switch_to.window.assert_called_with("tab-2")
+        contexts.shutdown()
+        driver.quit.assert_called_once()
+
+    def test_close_without_context(self, driver):
+        """Test that close does nothing if no context is open."""
+        contexts = UserContexts()
+        contexts.close()
+        contexts.open("chrome")
+        contexts.close()
+        contexts.close()
+        driver.browser.remove_user_context.assert_called_once_with("context-1")
+
+    def test_close_failed(self, driver):
+        """Test that the driver is switched back to the default context even if removal of the context fails."""
+        contexts = UserContexts()
+        contexts.open("chrome")
+        driver.browser.remove_user_context.side_effect = WebDriverException("no such user context")
+        with pytest.raises(WebDriverException):
+            contexts.close()
+        driver.switch_to.window.assert_called_with("home")
+        contexts.close()
+        driver.browser.remove_user_context.assert_called_once_with("context-1")
+
+    def test_relaunch(self):
+        """Test that a browser not responding (i.e.: crashed) is quitted and a new one is launched."""
+        crashed = MagicMock(current_window_handle="home")
+        crashed.browser.create_user_context.side_effect = ["context-1", WebDriverException("browser crashed")]
+        crashed.browsing_context.create.return_value = "tab-1"
+        crashed.quit.side_effect = WebDriverException("browser crashed")
+        relaunched = MagicMock(current_window_handle="home-2")
+        relaunched.browser.create_user_context.return_value = "context-2"
+        relaunched.browsing_context.create.return_value = "tab-2"
+        with patch("utilities.user_contexts._launch", side_effect=[crashed, relaunched]):
+            contexts = UserContexts()
+            contexts.open("chrome")
+            contexts.close()
+            assert contexts.open("chrome") is relaunched
+        crashed.quit.assert_called_once()
+        relaunched.switch_to.window.assert_called_with("tab-2")
+        contexts.close()
+        relaunched.browser.remove_user_context.assert_called_once_with("context-2")
+        relaunched.switch_to.window.assert_called_with("home-2")
@@ -0,0 +1,94 @@
+"""
+Framework test of WebDriver command tracing.
+"""
+
+from typing import List
+
+import pytest
+from selenium.webdriver.remote.errorhandler import ErrorHandler
+from selenium.webdriver.remote.remote_connection import RemoteConnection
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utilities.webdriver_tracer import SESSION_NODEID, CommandTracer
+
+
+class _StubExecutor(RemoteConnection):
+    """
+    Command executor answering every command without a browser.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        self.commands: List[str] = []
+
+    def execute(self, command, params):  # pylint: disable=unused-argument
+        """Record the command and return an empty response."""
+        self.commands.append(command)
+        return {"status": 0, "value": None}
+
+
+class _StubDriver(WebDriver):  # pylint: disable=abstract-method
+    """
+    WebDriver with the stub executor - no session is started.
+    """
+
+    def __init__(self) -> None:  # pylint: disable=super-init-not-called
+        self.command_executor = _StubExecutor()
+        self.session_id = "session-1"
+        self.error_handler = ErrorHandler()
+        self.caps = {}
+
+
+class _ShopPage:
+    """
+    Page object issuing WebDriver commands.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, driver) -> None:
+        self.driver = driver
+
+    def get_title(self):
+        """Issue a command from a page object method."""
+        return self.driver.title
+
+
+@pytest.mark.unit
+class TestCommandTracer:
+    """
+    Test CommandTracer object.
+    """
+
+    @pytest.fixture
+    def tracer(self):
+        """Setup object-under-test."""
+        tracer = CommandTracer()
+        tracer.activate()
+        return tracer
+
+    def test_instrument(self, tracer):
+        """Test that commands of the instrumented driver are executed and recorded per test, command and issuer."""
+        events = []
+        tracer.listeners.append(events.append)
+        driver = _StubDriver()
+        assert tracer.instrument(driver) is driver
+        execute = driver.execute
+        assert tracer.instrument(driver).execute is execute
+        tracer.nodeid = "t.py::TestShop::test_title"
+        _ShopPage(driver).get_title()
+        assert driver.command_executor.commands == ["getTitle"]
+        assert [(event.nodeid, event.command, event.issuer) for event in events] == [
+            ("t.py::TestShop::test_title", "getTitle", "_ShopPage.get_title")
+        ]
+        assert tracer.per_test["t.py::TestShop::test_title"].count == 1
+        assert tracer.per_command["getTitle"].count == 1
+        assert tracer.per_issuer["_ShopPage.get_title"].count == 1
+        assert SESSION_NODEID not in tracer.per_test
+
+    def test_inactive(self):
+        """Test that drivers are not instrumented when tracing is off."""
+        driver = _StubDriver()
+        CommandTracer().instrument(driver)
+        assert "execute" not in vars(driver)
@@ -0,0 +1,449 @@
+"""
+Local daemon keeping browser sessions alive between pytest runs, i.e.:
+    >> python -m utilities.browser_daemon --sessions 2       # in a separate terminal, once
+    >> pytest --browser-daemon -k TestLabel                  # attaches to a session instead of launching a browser
+
+The daemon launches browsers (Chrome or Edge) and leases their WebDriver sessions through a small HTTP API (JSON):
+    GET  /status                  browser name, session ids and leased session ids
+    POST /lease                   {"session_id", "executor_url", "capabilities", "lease_ttl"}, 503 if all sessions are
+                                  leased
+    POST /renew/<session id>      extends the lease by its TTL, 404 if the session is not leased (i.e.: expired)
+    POST /release/<session id>    {"origins"} opened by the client - browser state is reset, the session can be leased
+    POST /shutdown                quits the browsers and stops the daemon
+
+The ``browser_instance`` fixture attaches AttachedDriver to a leased session (no new session is created), its quit()
+hands the session back with origins it has opened. On release, extra windows are closed, cookies and cache are
+cleared and so is storage of every visited origin (opened by the client or found in navigation history of the
+windows), so the next test class starts like in a fresh browser.
+
+A lease expires after ``lease_ttl`` seconds unless renewed - AttachedDriver renews it in a heartbeat thread until
+quit(). Sessions of expired leases (i.e.: of a killed pytest run) are reset and reclaimed on the next lease.
+"""
+
+from __future__ import annotations
+
+import argparse
+import json
+import threading
+import time
+import urllib.error
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from typing import Any, Dict, Iterable, List, Set, Tuple
+from urllib.parse import urlsplit
+
+from selenium import webdriver
+from selenium.common import WebDriverException
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utilities.browsers import launch_chrome, launch_edge
+from utilities.logger import get_logger
+
+DEFAULT_URL = "http://127.0.0.1:4446"
+DEFAULT_LEASE_TTL = 60.0
+SUPPORTED_BROWSERS = ("chrome", "edge")
+
+
+def _launch(browser_name: str) -> ChromiumDriver:
+    """
+    Launches a browser kept by the daemon.
+
+    :param browser_name: "chrome" or "edge"
+    :return: WebDriver
+    """
+    if browser_name == "edge":
+        return launch_edge()
+    return launch_chrome()
+
+
+def origin_of(url: str) -> str | None:
+    """
+    Returns origin of the URL.
+
+    :param url: page URL, i.e.: "https://example.com/cart"
+    :return: origin, i.e.: "https://example.com", None for other than http(s) URLs
+    """
+    parts = urlsplit(url)
+    return f"{parts.scheme}://{parts.netloc}" if parts.scheme in ("http", "https") else None
+
+
+def reset_state(driver: ChromiumDriver, visited: Iterable[str] = ()) -> None:
+    """
+    Resets the browser after a test run - closes extra windows, clears cookies, cache and storage of visited origins.
+
+    :param driver: WebDriver of the daemon
+    :param visited: origins opened by the client (i.e.: in windows closed before the release)
+    :return: None
+    """
+    handles = driver.window_handles
+    origins: Set[str] = set(visited)
+    for handle in reversed(handles):
+        driver.switch_to.window(handle)
+        history = driver.execute_cdp_cmd("Page.getNavigationHistory", {})["entries"]
+        origins.update(origin for origin in (origin_of(entry["url"]) for entry in history) if origin is not None)
+        if handle != handles[0]:
+            driver.close()
+    driver.switch_to.window(handles[0])
+    driver.get("about:blank")
+    driver.execute_cdp_cmd("Network.clearBrowserCookies", {})
+    driver.execute_cdp_cmd("Network.clearBrowserCache", {})
+    for origin in sorted(origins):
+        driver.execute_cdp_cmd("Storage.clearDataForOrigin", {"origin": origin, "storageTypes": "all"})
+
+
+class BrowserDaemon:
+    """
+    Browsers with WebDriver sessions leased to pytest runs.
+    """
+
+    def __init__(self, browser_name: str, sessions: int, lease_ttl: float = DEFAULT_LEASE_TTL) -> None:
+        """
+
+        :param browser_name: "chrome" or "edge"
+        :param sessions: number of browsers (one per pytest-xdist worker)
+        :param lease_ttl: seconds after which a lease expires unless renewed
+        """
+        self.browser_name = browser_name
+        self.sessions = sessions
+        self.lease_ttl = lease_ttl
+        self.drivers: Dict[str, ChromiumDriver] = {}
+        self.leased: Dict[str, float] = {}  # dict['session id'] = time.monotonic() deadline of the lease
+        self.logger = get_logger(__name__)
+        self._lock = threading.Lock()
+
+    def start(self) -> None:
+        """
+        Launches the browsers.
+
+        :return: None
+        """
+        for _ in range(self.sessions):
+            self._add(_launch(self.browser_name))
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Returns status of the daemon.
+
+        :return: dict with browser name, session ids and leased session ids
+        """
+        with self._lock:
+            return {"browser_name": self.browser_name, "sessions": list(self.drivers), "leased": sorted(self.leased)}
+
+    def lease(self) -> Dict[str, Any] | None:
+        """
+        Leases a free session, sessions of expired leases are reset and reclaimed first.
+
+        :return: dict with session id, URL of its driver service, capabilities and lease TTL, None if all sessions are
+            leased
+        """
+        self._reclaim_expired()
+        with self._lock:
+            free = [session_id for session_id in self.drivers if session_id not in self.leased]
+            if not free:
+                return None
+            self.leased[free[0]] = time.monotonic() + self.lease_ttl
+            driver = self.drivers[free[0]]
+        self.logger.info("Session %s leased.", free[0])
+        return {
+            "session_id": free[0],
+            "executor_url": driver.service.service_url,
+            "capabilities": driver.caps,
+            "lease_ttl": self.lease_ttl,
+        }
+
+    def renew(self, session_id: str) -> bool:
+        """
+        Extends the lease by its TTL.
+
+        :param session_id: leased session id
+        :return: False if the session is not leased (i.e.: the lease expired and the session has been reclaimed)
+        """
+        with self._lock:
+            if session_id not in self.leased:
+                return False
+            self.leased[session_id] = max(self.leased[session_id], time.monotonic() + self.lease_ttl)
+        return True
+
+    def release(self, session_id: str, origins: Iterable[str] = ()) -> bool:
+        """
+        Resets the browser and makes the session free (a browser that cannot be reset is replaced by a new one).
+
+        :param session_id: leased session id
+        :param origins: origins visited by the client
+        :return: False if the session is not leased
+        """
+        with self._lock:
+            if session_id not in self.leased:
+                return False
+            self.leased[session_id] = float("inf")  # does not expire while the browser is reset
+            driver = self.drivers[session_id]
+        try:
+            reset_state(driver, origins)
+        except WebDriverException:
+            self.logger.warning("Session %s cannot be reset - browser replaced.", session_id, exc_info=True)
+            with self._lock:
+                del self.drivers[session_id]
+            driver.service.stop()
+            self._add(_launch(self.browser_name))
+        with self._lock:
+            self.leased.pop(session_id, None)
+        self.logger.info("Session %s released.", session_id)
+        return True
+
+    def _reclaim_expired(self) -> None:
+        """
+        Resets and frees sessions of expired leases (their clients stopped renewing them, i.e.: were killed).
+
+        :return: None
+        """
+        now = time.monotonic()
+        with self._lock:
+            expired = [session_id for session_id, deadline in self.leased.items() if deadline <= now]
+        for session_id in expired:
+            self.logger.warning("Lease of session %s expired - session reclaimed.", session_id)
+            self.release(session_id)
+
+    def stop(self) -> None:
+        """
+        Quits the browsers.
+
+        :return: None
+        """
+        with self._lock:
+            drivers, self.drivers = list(self.drivers.values()), {}
+            self.leased.clear()
+        for driver in drivers:
+            driver.quit()
+
+    def _add(self, driver: ChromiumDriver) -> None:
+        with self._lock:
+            self.drivers[str(driver.session_id)] = driver
+        self.logger.info("Browser launched - session %s.", driver.session_id)
+
+
+class _DaemonServer(ThreadingHTTPServer):
+    """
+    HTTP server of the daemon.
+    """
+
+    def __init__(self, address: Tuple[str, int], browser_daemon: BrowserDaemon) -> None:
+        """
+
+        :param address: (host, port)
+        :param browser_daemon: BrowserDaemon()
+        """
+        super().__init__(address, _Handler)
+        self.browser_daemon = browser_daemon
+
+
+class _Handler(BaseHTTPRequestHandler):
+    """
+    Request handler of the daemon HTTP API.
+    """
+
+    server: _DaemonServer
+
+    def do_GET(self) -> None:  # pylint: disable=invalid-name
+        """
+        Handle GET request.
+
+        :return: None
+        """
+        if self.path == "/status":
+            self._reply(200, self.server.browser_daemon.status())
+        else:
+            self._reply(404, {"error": f"unknown path: {self.path}"})
+
+    def do_POST(self) -> None:  # pylint: disable=invalid-name
+        """
+        Handle POST request.
+
+        :return: None
+        """
+        daemon = self.server.browser_daemon
+        if self.path == "/lease":
+            lease = daemon.lease()
+            if lease is None:
+                self._reply(503, {"error": "all sessions are leased"})
+            else:
+                self._reply(200, lease)
+        elif self.path.startswith("/release/"):
+            session_id = self.path.removeprefix("/release/")
+            body = json.loads(self.rfile.read(int(self.headers.get("Content-Length", 0))) or "{}")
+            if daemon.release(session_id, body.get("origins", [])):
+                self._reply(200, {})
+            else:
+                self._reply(404, {"error": f"not leased: {session_id}"})
+        elif self.path.startswith("/renew/"):
+            session_id = self.path.removeprefix("/renew/")
+            if daemon.renew(session_id):
+                self._reply(200, {})
+            else:
+                self._reply(404, {"error": f"not leased: {session_id}"})
+        elif self.path == "/shutdown":
+            self._reply(200, {})
+            threading.Thread(target=self.server.shutdown).start()
+        else:
+            self._reply(404, {"error": f"unknown path: {self.path}"})
+
+    def log_message(self, format: str, *args: Any) -> None:  # pylint: disable=redefined-builtin
+        self.server.browser_daemon.logger.debug(format, *args)
+
+    def _reply(self, status: int, body: Dict[str, Any]) -> None:
+        data = json.dumps(body).encode("utf-8")
+        self.send_response(status)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(data)))
+        self.end_headers()
+        self.wfile.write(data)
+
+
+class AttachedDriver(webdriver.Remote):  # pylint: disable=abstract-method
+    """
+    WebDriver attached to a session leased from the daemon - no new session is created, quit() releases the lease
+    (with origins opened by get(), so their storage is cleared even if their windows have been closed). The lease is
+    renewed in a heartbeat thread until quit().
+    """
+
+    def __init__(self, lease: Dict[str, Any], daemon_url: str) -> None:
+        """
+
+        :param lease: response of the daemon to POST /lease
+        :param daemon_url: URL of the daemon, i.e.: "http://127.0.0.1:4446"
+        """
+        self.lease = lease
+        self.daemon_url = daemon_url
+        self.origins: Set[str] = set()
+        super().__init__(command_executor=lease["executor_url"], options=webdriver.ChromeOptions())
+        self._released = threading.Event()
+        self._heartbeat = threading.Thread(target=self._renew, name="browser-daemon-heartbeat", daemon=True)
+        self._heartbeat.start()
+
+    def start_session(self, capabilities: dict) -> None:
+        """
+        Attaches to the leased session instead of creating a new one.
+
+        :param capabilities: ignored - capabilities of the leased session are used
+        :return: None
+        """
+        self.session_id = self.lease["session_id"]
+        self.caps = self.lease["capabilities"]
+
+    def get(self, url: str) -> None:
+        """
+        Opens the page and records its origin.
+
+        :param url: page URL
+        :return: None
+        """
+        origin = origin_of(url)
+        if origin is not None:
+            self.origins.add(origin)
+        super().get(url)
+
+    def quit(self) -> None:
+        """
+        Hands the session back to the daemon (the browser keeps running).
+
+        :return: None
+        """
+        self._released.set()
+        self._heartbeat.join()
+        _request(self.daemon_url, f"/release/{self.session_id}", body={"origins": sorted(self.origins)})
+
+    def _renew(self) -> None:
+        """
+        Renews the lease three times per its TTL until quit() (or until the lease is lost).
+
+        :return: None
+        """
+        while not self._released.wait(self.lease["lease_ttl"] / 3):
+            try:
+                _request(self.daemon_url, f"/renew/{self.session_id}")
+            except (RuntimeError, OSError):
+                get_logger(__name__).warning("Lease of session %s cannot be renewed.", self.session_id, exc_info=True)
+                return
+
+
+def _request(daemon_url: str, path: str, method: str = "POST", body: Dict[str, Any] | None = None) -> Dict[str, Any]:
+    """
+    Sends request to the daemon.
+
+    :param daemon_url: URL of the daemon
+    :param path: API path, i.e.: "/lease"
+    :param method: HTTP method
+    :param body: JSON body of the request
+    :return: JSON response
+    """
+    data = None if body is None else json.dumps(body).encode("utf-8")
+    request = urllib.request.Request(daemon_url + path, data=data, method=method)
+    try:
+        with urllib.request.urlopen(request, timeout=60) as response:
+            return json.loads(response.read())
+    except urllib.error.HTTPError as error:
+        raise RuntimeError(f"Browser daemon {daemon_url}{path} failed: {error.read().decode()}") from error
+
+
+class DaemonClient:
+    """
+    Leases browser sessions from the daemon, i.e.:
+        >> driver = BROWSER_DAEMON.lease()  # in browser_instance fixture setup
+        >> driver.quit()                    # in browser_instance fixture teardown - releases the session
+    """
+
+    def __init__(self) -> None:
+        self.url: str | None = None  # URL of the daemon, None - not used
+
+    def status(self) -> Dict[str, Any]:
+        """
+        Returns status of the daemon.
+
+        :return: dict with browser name, session ids and leased session ids
+        """
+        return _request(str(self.url), "/status", method="GET")
+
+    def lease(self) -> WebDriver:
+        """
+        Leases a session and attaches a driver to it.
+
+        :return: AttachedDriver
+        """
+        return AttachedDriver(_request(str(self.url), "/lease"), str(self.url))
+
+
+BROWSER_DAEMON = DaemonClient()
+
+
+def main(argv: List[str] | None = None) -> None:
+    """
+    Command line entry point.
+
+    :param argv: command line arguments (default: sys.argv)
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Keep browser sessions alive between pytest runs.")
+    parser.add_argument("--browser-name", choices=SUPPORTED_BROWSERS, default="chrome", help="browser selection")
+    parser.add_argument("--sessions", type=int, default=1, help="number of browsers (one per pytest-xdist worker)")
+    parser.add_argument(
+        "--lease-ttl", type=float, default=DEFAULT_LEASE_TTL, help="seconds after which an unrenewed lease expires"
+    )
+    parser.add_argument("--url", default=DEFAULT_URL, help="address the daemon listens on (see: --browser-daemon-url)")
+    args = parser.parse_args(argv)
+
+    browser_daemon = BrowserDaemon(args.browser_name, args.sessions, args.lease_ttl)
+    url = urlsplit(args.url)
+    server = _DaemonServer((url.hostname or "127.0.0.1", url.port or 80), browser_daemon)
+    try:
+        browser_daemon.start()
+        print(f"Browser daemon listening on {args.url} ({args.sessions} x {args.browser_name}), Ctrl+C to stop.")
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        browser_daemon.stop()
+        server.server_close()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,63 @@
+"""
+Contains browser options and launchers shared by the browser_instance fixture and browsers launched by plugins.
+
+Launchers pass driver resolved through DRIVER_CACHE to the Service, so Selenium Manager is not run on each launch
+(see: utilities/driver_cache.py).
+"""
+
+from typing import Any, Dict
+
+from selenium import webdriver
+
+from utilities.driver_cache import DRIVER_CACHE
+
+CHROME_PREFS: Dict[str, Any] = {
+    "profile.password_manager_leak_detection": False,
+    "excludeSwitches": ["enable-logging"],
+}
+
+
+def chrome_options() -> webdriver.ChromeOptions:
+    """
+    Returns Chrome options with custom browser preferences (CHROME_PREFS).
+
+    :return: ChromeOptions()
+    """
+    options = webdriver.ChromeOptions()
+    options.add_experimental_option("prefs", CHROME_PREFS)
+    return options
+
+
+def launch_chrome(options: webdriver.ChromeOptions | None = None) -> webdriver.Chrome:
+    """
+    Launches Chrome.
+
+    :param options: ChromeOptions (default: chrome_options())
+    :return: webdriver.Chrome()
+    """
+    options = options or chrome_options()
+    return webdriver.Chrome(options=options, service=webdriver.ChromeService(DRIVER_CACHE.resolve("chrome", options)))
+
+
+def launch_edge(options: webdriver.EdgeOptions | None = None) -> webdriver.Edge:
+    """
+    Launches Edge.
+
+    :param options: EdgeOptions (default: EdgeOptions())
+    :return: webdriver.Edge()
+    """
+    options = options or webdriver.EdgeOptions()
+    return webdriver.Edge(options=options, service=webdriver.EdgeService(DRIVER_CACHE.resolve("edge", options)))
+
+
+def launch_firefox(options: webdriver.FirefoxOptions | None = None) -> webdriver.Firefox:
+    """
+    Launches Firefox.
+
+    :param options: FirefoxOptions (default: FirefoxOptions())
+    :return: webdriver.Firefox()
+    """
+    options = options or webdriver.FirefoxOptions()
+    return webdriver.Firefox(
+        options=options, service=webdriver.FirefoxService(DRIVER_CACHE.resolve("firefox", options))
+    )
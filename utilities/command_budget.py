@@ -0,0 +1,128 @@
+"""
+Contains CommandBudget class and command_budget() decorator - WebDriver command budgets of tests and page object
+methods (see: utilities/plugins/command_budget.py).
+"""
+
+from __future__ import annotations
+
+import functools
+from collections import Counter
+from typing import Any, Callable, List, TypeVar
+
+from utilities.webdriver_tracer import COMMAND_TRACER, CommandEvent
+
+_F = TypeVar("_F", bound=Callable[..., Any])
+
+
+class _BudgetScope:
+    """
+    Commands executed within a test or a page object method with declared budget.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, name: str, limit: int) -> None:
+        """
+
+        :param name: name of the test or the page object method
+        :param limit: maximum number of WebDriver commands
+        """
+        self.name = name
+        self.limit = limit
+        self.events: List[CommandEvent] = []
+
+    @property
+    def exceeded(self) -> bool:
+        """Returns True if more commands were executed than the budget allows."""
+        return len(self.events) > self.limit
+
+    def breakdown(self) -> str:
+        """
+        Describes executed commands grouped by command type and issuing method.
+
+        :return: multi-line message
+        """
+        lines = [f"WebDriver command budget exceeded for {self.name}: {len(self.events)} > {self.limit} commands"]
+        lines.append(f"{'commands':>10}  command <- issuing method")
+        for (command, issuer), count in Counter((e.command, e.issuer) for e in self.events).most_common():
+            lines.append(f"{count:>10}  {command} <- {issuer}")
+        return "\n".join(lines)
+
+
+class CommandBudget:
+    """
+    Counts traced WebDriver commands for open budget scopes and collects exceeded ones.
+    """
+
+    def __init__(self) -> None:
+        self.open_scopes: List[_BudgetScope] = []
+        self.violations: List[_BudgetScope] = []
+
+    def on_command(self, event: CommandEvent) -> None:
+        """
+        Listener of CommandTracer - attributes the command to every open scope.
+
+        :param event: recorded WebDriver command
+        :return: None
+        """
+        for scope in self.open_scopes:
+            scope.events.append(event)
+
+    def open(self, name: str, limit: int) -> _BudgetScope:
+        """
+        Starts counting commands for a new scope.
+
+        :param name: name of the test or the page object method
+        :param limit: maximum number of WebDriver commands
+        :return: opened scope
+        """
+        scope = _BudgetScope(name, limit)
+        self.open_scopes.append(scope)
+        return scope
+
+    def close(self, scope: _BudgetScope) -> None:
+        """
+        Stops counting commands for the scope and stores it if the budget was exceeded.
+
+        :param scope: scope returned by open()
+        :return: None
+        """
+        self.open_scopes.remove(scope)
+        if scope.exceeded:
+            self.violations.append(scope)
+
+    def pop_violations(self) -> List[_BudgetScope]:
+        """
+        Returns and forgets collected violations.
+
+        :return: list of exceeded scopes
+        """
+        violations, self.violations = self.violations, []
+        return violations
+
+
+COMMAND_BUDGET = CommandBudget()
+
+
+def command_budget(limit: int) -> Callable[[_F], _F]:
+    """
+    Declares maximum number of WebDriver commands executed by the page object method (checked only when tracing).
+
+    :param limit: maximum number of WebDriver commands
+    :return: decorator
+    """
+
+    def decorator(func: _F) -> _F:
+        @functools.wraps(func)
+        def wrapper(*args, **kwargs):
+            if not COMMAND_TRACER.active:
+                return func(*args, **kwargs)
+            scope = COMMAND_BUDGET.open(func.__qualname__, limit)
+            try:
+                return func(*args, **kwargs)
+            finally:
+                COMMAND_BUDGET.close(scope)
+
+        return wrapper  # type: ignore[return-value]
+
+    return decorator
@@ -0,0 +1,154 @@
+"""
+Contains ConcurrentTabs class - one browser shared by pytest-xdist workers, each test class drives its own tab
+(see: utilities/plugins/concurrent_tabs.py).
+"""
+
+from __future__ import annotations
+
+import socket
+from typing import TypeVar
+
+from selenium import webdriver
+from selenium.webdriver.chromium.options import ChromiumOptions
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+
+from utilities.browsers import chrome_options, launch_chrome, launch_edge
+from utilities.driver_cache import DRIVER_CACHE
+from utilities.logger import get_logger
+
+# Tabs in background are driven as well - they must not be throttled like tabs the user does not look at
+_NO_THROTTLING = (
+    "--disable-background-timer-throttling",
+    "--disable-backgrounding-occluded-windows",
+    "--disable-renderer-backgrounding",
+)
+
+_Options = TypeVar("_Options", bound=ChromiumOptions)
+
+
+def _remote_debugging(options: _Options, port: int) -> _Options:
+    """
+    Adds arguments of the shared browser to the options.
+
+    :param options: ChromeOptions() or EdgeOptions()
+    :param port: remote debugging port
+    :return: the same options
+    """
+    for argument in (f"--remote-debugging-port={port}", *_NO_THROTTLING):
+        options.add_argument(argument)
+    return options
+
+
+def _attached(options: _Options, address: str) -> _Options:
+    """
+    Sets debugger address of the shared browser in the options, so the session is attached to it.
+
+    :param options: ChromeOptions() or EdgeOptions()
+    :param address: debugger address
+    :return: the same options
+    """
+    options.debugger_address = address
+    return options
+
+
+def _close_tab(driver: ChromiumDriver) -> None:
+    """
+    Closes the tab of the session and stops its driver service - the shared browser keeps running.
+
+    :param driver: WebDriver attached to the shared browser
+    :return: None
+    """
+    try:
+        driver.close()
+    finally:
+        driver.service.stop()
+
+
+class ChromeTab(webdriver.Chrome):  # pylint: disable=abstract-method
+    """
+    Chrome session attached to the shared browser - quit() closes only its tab.
+    """
+
+    def quit(self) -> None:
+        _close_tab(self)
+
+
+class EdgeTab(webdriver.Edge):  # pylint: disable=abstract-method
+    """
+    Edge session attached to the shared browser - quit() closes only its tab.
+    """
+
+    def quit(self) -> None:
+        _close_tab(self)
+
+
+class ConcurrentTabs:
+    """
+    Launches one browser with remote debugging (in pytest-xdist controller) and attaches sessions of test classes
+    (in workers) to it, each in a new tab, i.e.:
+        >> CONCURRENT_TABS.launch("chrome")                 # once per run
+        >> driver = CONCURRENT_TABS.open_tab("chrome")      # in browser_instance fixture setup
+        >> driver.quit()                                    # closes only the tab
+    """
+
+    SUPPORTED_BROWSERS = ("chrome", "edge")
+
+    def __init__(self) -> None:
+        self.address: str | None = None  # debugger address of the shared browser, None - mode disabled
+        self.logger = get_logger(__name__)
+        self._host: ChromiumDriver | None = None
+
+    def launch(self, browser_name: str) -> str:
+        """
+        Launches the shared browser.
+
+        :param browser_name: "chrome" or "edge"
+        :return: debugger address, i.e.: "127.0.0.1:50123"
+        """
+        with socket.socket() as sock:
+            sock.bind(("127.0.0.1", 0))
+            port = sock.getsockname()[1]
+        if browser_name == "edge":
+            self._host = launch_edge(_remote_debugging(webdriver.EdgeOptions(), port))
+        else:
+            self._host = launch_chrome(_remote_debugging(chrome_options(), port))
+        self.address = f"127.0.0.1:{port}"
+        self.logger.info("Shared browser launched: %s.", self.address)
+        return self.address
+
+    def open_tab(self, browser_name: str) -> ChromiumDriver:
+        """
+        Attaches a new session to the shared browser and switches it to a new tab.
+
+        :param browser_name: "chrome" or "edge"
+        :return: ChromeTab or EdgeTab
+        """
+        if self.address is None:
+            raise RuntimeError("Shared browser is not launched (see: --concurrent-tabs)")
+        driver: ChromiumDriver
+        if browser_name == "edge":
+            edge_options = _attached(webdriver.EdgeOptions(), self.address)
+            driver = EdgeTab(
+                options=edge_options, service=webdriver.EdgeService(DRIVER_CACHE.resolve("edge", edge_options))
+            )
+        else:
+            options = _attached(webdriver.ChromeOptions(), self.address)
+            driver = ChromeTab(
+                options=options, service=webdriver.ChromeService(DRIVER_CACHE.resolve("chrome", options))
+            )
+        driver.switch_to.new_window("tab")
+        return driver
+
+    def shutdown(self) -> None:
+        """
+        Quits the shared browser.
+
+        :return: None
+        """
+        if self._host is not None:
+            self._host.quit()
+            self.logger.info("Shared browser quitted: %s.", self.address)
+        self._host, self.address = None, None
+
+
+CONCURRENT_TABS = ConcurrentTabs()
@@ -2,8 +2,10 @@
 Contains _BaseControl class as a creator class for Base Controls factory pattern
 """
 
+import time
 from abc import ABC
-from typing import Tuple
+from contextlib import contextmanager
+from typing import Generator, Tuple
 
 from selenium.webdriver import ActionChains
 from selenium.webdriver.remote.webdriver import WebDriver
@@ -19,14 +21,16 @@ class _BaseControl(ABC):
     _BaseControl class as a parent (factory) for all controls in the framework.
     """
 
-    def __init__(self, driver: WebDriver, locator: Tuple[str, str]) -> None:
+    def __init__(self, driver: WebDriver, locator: Tuple[str, str], *, owner: object | None = None) -> None:
         """
 
         :param driver: WebDriver for current browser, i.e.: webdriver.Chrome()
         :param locator: pair of By strategy and locator, i.e.: (By.CSS_SELECTOR, "input[value='admin']")
+        :param owner: page object creating the control, logged with its actions (None - outside page objects)
         """
         self.driver = driver
         self.locator = locator
+        self.page = type(owner).__name__ if owner is not None else None
         self.web_element: WebElement = self.driver.find_element(*self.locator)
         self.wait = WebDriverWait(self.driver, 5)
         self.logger = get_logger(__name__)
@@ -73,14 +77,42 @@ class _BaseControl(ABC):
             """
             Wait for the element to be present in order to perform actions.
             """
-            self.logger.debug(f"Pre-action for {self}")
-            if self.is_present():
-                self.logger.debug("Pre-action: SUCCESS")
-                return func(self, *args, **kwargs)
-            raise AttributeError(f"{self} is not present")
+            with self.timed_action(func.__name__):
+                self.logger.debug(f"Pre-action for {self}")
+                if self.is_present():
+                    self.logger.debug("Pre-action: SUCCESS")
+                    return func(self, *args, **kwargs)
+                raise AttributeError(f"{self} is not present")
 
         return wrapper
 
+    @contextmanager
+    def timed_action(self, action: str) -> Generator[None]:
+        """
+        Logs duration of the action (including pre-action) with structured fields: action, locator, duration and the
+        page object owning the control.
+
+        :param action: action name, i.e.: "click"
+        :return: None
+        """
+        start = time.perf_counter()
+        try:
+            yield
+        finally:
+            duration_ms = (time.perf_counter() - start) * 1000
+            self.logger.debug(
+                "Action '%s' took %.1f[ms] for %s",
+                action,
+                duration_ms,
+                self,
+                extra={
+                    "action": action,
+                    "locator": str(self.locator),
+                    "duration_ms": round(duration_ms, 3),
+                    "page": self.page,
+                },
+            )
+
     @pre_action
     def click(self) -> None:
         """
@@ -15,11 +15,12 @@ class Button(_BaseControl):
     Represents button elements.
     """
 
-    def __init__(self, driver: WebDriver, locator: Tuple[str, str]) -> None:
+    def __init__(self, driver: WebDriver, locator: Tuple[str, str], *, owner: object | None = None) -> None:
         """
 
         :param driver: WebDriver for current browser, i.e.: webdriver.Chrome()
         :param locator: pair of By strategy and locator, i.e.: (By.CSS_SELECTOR, "input[value='admin']")
+        :param owner: page object creating the control, logged with its actions (None - outside page objects)
         """
-        super().__init__(driver, locator)
+        super().__init__(driver, locator, owner=owner)
         self.logger = get_logger(__name__)
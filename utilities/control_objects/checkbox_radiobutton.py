@@ -26,12 +26,13 @@ class _SelectOptionControl(_BaseControl):
             """
             Wait for the element to be present in order to perform actions.
             """
-            self.logger.debug(f"Pre-action for {self}")
-            self.logger.debug(f"Check '.element_to_be_clickable()' for {self}")
-            if self.wait.until(expected_conditions.element_to_be_clickable(self.locator)):
-                self.logger.debug("Pre-action: SUCCESS")
-                return func(self, *args, **kwargs)
-            raise AttributeError(f"{self} is not present")
+            with self.timed_action(func.__name__):
+                self.logger.debug(f"Pre-action for {self}")
+                self.logger.debug(f"Check '.element_to_be_clickable()' for {self}")
+                if self.wait.until(expected_conditions.element_to_be_clickable(self.locator)):
+                    self.logger.debug("Pre-action: SUCCESS")
+                    return func(self, *args, **kwargs)
+                raise AttributeError(f"{self} is not present")
 
         return wrapper
 
@@ -61,13 +62,14 @@ class Radiobutton(_SelectOptionControl):
     Represents radiobutton - element that allows to select only one option from a set.
     """
 
-    def __init__(self, driver: WebDriver, locator: Tuple[str, str]) -> None:
+    def __init__(self, driver: WebDriver, locator: Tuple[str, str], *, owner: object | None = None) -> None:
         """
 
         :param driver: WebDriver for current browser, i.e.: webdriver.Chrome()
         :param locator: pair of By strategy and locator, i.e.: (By.CSS_SELECTOR, "input[value='admin']")
+        :param owner: page object creating the control, logged with its actions (None - outside page objects)
         """
-        super().__init__(driver, locator)
+        super().__init__(driver, locator, owner=owner)
         self.logger = get_logger(__name__)
 
 
@@ -76,13 +78,14 @@ class Checkbox(_SelectOptionControl):
     Represents checkbox - element that allows to select multiple options from a set.
     """
 
-    def __init__(self, driver: WebDriver, locator: Tuple[str, str]) -> None:
+    def __init__(self, driver: WebDriver, locator: Tuple[str, str], *, owner: object | None = None) -> None:
         """
 
         :param driver: WebDriver for current browser, i.e.: webdriver.Chrome()
         :param locator: pair of By strategy and locator, i.e.: (By.CSS_SELECTOR, "input[value='admin']")
+        :param owner: page object creating the control, logged with its actions (None - outside page objects)
         """
-        super().__init__(driver, locator)
+        super().__init__(driver, locator, owner=owner)
         self.logger = get_logger(__name__)
 
     @_SelectOptionControl.pre_action
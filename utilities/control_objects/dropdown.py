@@ -24,13 +24,14 @@ class DropdownStatic(_Dropdown):
     Represents static dropdown elements - list of values is fixed and predetermined.
     """
 
-    def __init__(self, driver: WebDriver, locator: Tuple[str, str]) -> None:
+    def __init__(self, driver: WebDriver, locator: Tuple[str, str], *, owner: object | None = None) -> None:
         """
 
         :param driver: WebDriver for current browser, i.e.: webdriver.Chrome()
         :param locator: pair of By strategy and locator, i.e.: (By.CSS_SELECTOR, "input[value='admin']")
+        :param owner: page object creating the control, logged with its actions (None - outside page objects)
         """
-        super().__init__(driver, locator)
+        super().__init__(driver, locator, owner=owner)
         self.logger = get_logger(__name__)
 
     @_BaseControl.pre_action
@@ -60,12 +61,14 @@ class DropdownDynamic(_Dropdown):
     Represents dynamic dropdown elements - list of values can change, expand or be auto-suggestive.
     """
 
-    def __init__(
+    def __init__(  # pylint: disable=too-many-arguments
         self,
         driver: WebDriver,
         dropdown_locator: Tuple[str, str],
         dropdown_list_locator: Tuple[str, str],
         dropdown_list_item_locator: Tuple[str, str],
+        *,
+        owner: object | None = None,
     ) -> None:
         """
 
@@ -76,8 +79,9 @@ class DropdownDynamic(_Dropdown):
                                         (By.CSS_SELECTOR, "input[value='admin']")
         :param dropdown_list_item_locator: pair of By strategy and locator, i.e.:
                                             (By.CSS_SELECTOR, "input[value='admin']")
+        :param owner: page object creating the control, logged with its actions (None - outside page objects)
         """
-        super().__init__(driver, dropdown_locator)
+        super().__init__(driver, dropdown_locator, owner=owner)
         self.dropdown_list_locator = dropdown_list_locator
         self.dropdown_list_item_locator = dropdown_list_item_locator
         self.logger = get_logger(__name__)
@@ -20,13 +20,22 @@ class Table(_BaseControl):
     Represents HTML table.
     """
 
-    def __init__(self, driver: WebDriver, locator: Tuple[str, str], strategy: Type[_TableStrategy]) -> None:
+    def __init__(
+        self,
+        driver: WebDriver,
+        locator: Tuple[str, str],
+        strategy: Type[_TableStrategy],
+        *,
+        owner: object | None = None,
+    ) -> None:
         """
 
         :param driver: WebDriver for current browser, i.e.: webdriver.Chrome()
         :param locator: pair of By strategy and locator, i.e.: (By.CSS_SELECTOR, "input[value='admin']")
+        :param strategy: strategy of reading table headings and rows
+        :param owner: page object creating the control, logged with its actions (None - outside page objects)
         """
-        super().__init__(driver, locator)
+        super().__init__(driver, locator, owner=owner)
         self._strategy = strategy()
         self.logger = get_logger(__name__)
         self.logger.debug("Strategy set to '%s'", strategy.__name__)
@@ -1,8 +1,10 @@
 """
-Contains TestData class.
+Contains test data classes.
 """
 
-from typing import Any, Dict
+import keyword
+from types import MappingProxyType
+from typing import Any, Dict, Iterable, List, Tuple, Type
 
 
 class DataClass:
@@ -22,6 +24,8 @@ class DataClass:
 
         >> test_data_instance.product_name
         >> 'Blackberry'
+
+    Kept for compatibility - prefer immutable records created by make_records().
     """
 
     def __init__(self, data: Dict[str, Any]):
@@ -54,3 +58,125 @@ class DataClass:
 
         for key, value in zip(data.keys(), data.values()):
             self.__dict__[key] = value
+
+
+class DataRecord:
+    """
+    Base class of immutable test data records generated by make_records() - one class with __slots__ per dataset
+    schema, i.e.:
+
+    data: Dict =    {
+                      "order_basic": [
+                        {"product_name": "Blackberry", "delivery_country": "Poland", "type_len": 2},
+                        ...
+                      ]
+                    }
+
+    records: List[DataRecord] = make_records("order_basic", data["order_basic"])
+
+        >> records[0]
+        >> OrderBasicRecord(product_name='Blackberry', delivery_country='Poland', type_len=2)
+        >> records[0].product_name = "iphone X"
+        >> AttributeError: OrderBasicRecord is immutable
+
+    Nested dicts are returned as read-only mappings and lists as tuples, so records can be shared by all tests of
+    a parametrized class - copy nested values before modifying them, i.e.: dict(record.products).
+    """
+
+    __slots__: Tuple[str, ...] = ()
+
+    def __init__(self, **fields: Any) -> None:
+        """
+
+        :param fields: field values, keys have to match __slots__ of the record class
+        """
+        for name in self.__slots__:
+            object.__setattr__(self, name, _freeze(fields[name]))
+
+    def __setattr__(self, name: str, value: Any) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __delattr__(self, name: str) -> None:
+        raise AttributeError(f"{type(self).__name__} is immutable")
+
+    def __repr__(self) -> str:
+        fields = ", ".join(f"{name}={getattr(self, name)!r}" for name in self.__slots__)
+        return f"{type(self).__name__}({fields})"
+
+    def get_data(self) -> Dict[str, Any]:
+        """
+        Returns test data.
+
+        :return: dict of test data (nested values stay read-only)
+        """
+        return {name: getattr(self, name) for name in self.__slots__}
+
+
+_RECORD_TYPES: Dict[Tuple[str, Tuple[str, ...]], Type[DataRecord]] = {}
+
+
+def record_type(dataset_name: str, fields: Iterable[str]) -> Type[DataRecord]:
+    """
+    Returns record class for the dataset schema (created once per dataset name and set of fields).
+
+    :param dataset_name: name of the dataset, i.e.: "order_basic"
+    :param fields: field names, i.e.: ("product_name", "delivery_country", "type_len")
+    :return: DataRecord subclass, i.e.: OrderBasicRecord
+    """
+    key = (dataset_name, tuple(fields))
+    if key not in _RECORD_TYPES:
+        for name in key[1]:
+            if not name.isidentifier() or keyword.iskeyword(name) or name.startswith("_"):
+                raise ValueError(f"Dataset '{dataset_name}' has invalid field name: '{name}'")
+        class_name = "".join(part.capitalize() for part in dataset_name.split("_")) + "Record"
+        _RECORD_TYPES[key] = type(class_name, (DataRecord,), {"__slots__": key[1]})
+    return _RECORD_TYPES[key]
+
+
+def make_records(dataset_name: str, datasets: List[Dict[str, Any]]) -> List[DataRecord]:
+    """
+    Validates that all datasets share one schema and converts them to immutable records.
+
+    :param dataset_name: name of the dataset, i.e.: "order_basic"
+    :param datasets: list of dicts of test data from JSON
+    :return: list of records
+    """
+    if not datasets:
+        return []
+    fields = tuple(datasets[0])
+    for index, dataset in enumerate(datasets):
+        check_schema(dataset_name, index, dataset, fields)
+    cls = record_type(dataset_name, fields)
+    return [cls(**dataset) for dataset in datasets]
+
+
+def check_schema(dataset_name: str, index: int, dataset: Dict[str, Any], fields: Iterable[str]) -> None:
+    """
+    Checks if dataset has exactly the expected fields.
+
+    :param dataset_name: name of the dataset, i.e.: "order_basic"
+    :param index: index of the dataset (used in error message)
+    :param dataset: dict of test data
+    :param fields: expected field names
+    :return: None
+    """
+    if set(dataset) != set(fields):
+        raise ValueError(
+            f"Dataset '{dataset_name}' [{index}] does not match schema:\n"
+            f" FIELDS: {sorted(dataset)}\n"
+            f" EXPECTED: {sorted(fields)}\n"
+        )
+
+
+def _freeze(value: Any) -> Any:
+    """
+    Returns read-only version of JSON value.
+
+    :param value: JSON value
+    :return: MappingProxyType for dict, tuple for list, the same value otherwise
+    """
+    if isinstance(value, dict):
+        return MappingProxyType({key: _freeze(item) for key, item in value.items()})
+    if isinstance(value, list):
+        return tuple(_freeze(item) for item in value)
+    return value
@@ -0,0 +1,203 @@
+"""
+Contains DataRegistry class - central, lazy registry of test data files (see: utilities/plugins/datasets.py).
+"""
+
+from __future__ import annotations
+
+import hashlib
+import json
+import os
+from array import array
+from typing import Any, Dict, Iterator, List, NamedTuple, Tuple, Type
+
+from utilities.data_class import DataRecord, check_schema, make_records, record_type
+from utilities.pairwise import expand_dataset
+
+TEST_DATA_DIR = os.path.join(os.path.dirname(os.path.dirname(os.path.abspath(__file__))), "test_data")
+JSON_LINES_EXTENSIONS = (".jsonl", ".ndjson")
+
+
+class DatasetRef(NamedTuple):
+    """
+    Lightweight reference to a single dataset row - resolved to a record only when needed.
+    """
+
+    path: str
+    name: str
+    row: int
+    offset: int = -1  # byte offset of the row in JSON Lines file (-1 for JSON files)
+
+    @property
+    def id(self) -> str:
+        """Returns test id, i.e.: "order_basic-0"."""
+        return f"{self.name}-{self.row}"
+
+
+class DataRegistry:
+    """
+    Loads test data files lazily and caches them by content hash, i.e.:
+        - JSON file ({"dataset name": [{...}, ...], ...}) is parsed once, no matter how many modules use it - dataset
+          can also be declared with dimensions, it is expanded to a pairwise covering set (see: expand_dataset()),
+        - JSON Lines file (one dataset row per line) is only indexed (byte offsets of rows), rows are parsed one by one
+          when resolved, so huge generated datasets are never loaded into memory as a whole.
+
+    Changed file gets a new hash, so stale data is never returned.
+    """
+
+    def __init__(self, directory: str = TEST_DATA_DIR) -> None:
+        """
+
+        :param directory: directory of relative test data paths
+        """
+        self.directory = directory
+        self._hashes: Dict[Tuple[str, int, int], str] = {}
+        self._documents: Dict[str, Dict[str, Any]] = {}
+        self._offsets: Dict[str, array] = {}
+        self._rows: Dict[Tuple[str, str], List[Dict[str, Any]]] = {}
+        self._records: Dict[Tuple[str, str], List[DataRecord]] = {}
+        self._row_types: Dict[Tuple[str, str], Type[DataRecord]] = {}
+
+    def path(self, file_name: str) -> str:
+        """
+        Returns absolute path of test data file.
+
+        :param file_name: path relative to the registry directory (or absolute), i.e.: "test_green_kart_shop_e2e.json"
+        :return: absolute path
+        """
+        return os.path.abspath(os.path.join(self.directory, file_name))
+
+    def file_hash(self, path: str) -> str:
+        """
+        Returns content hash of the file (computed again only if file's size or modification time changed).
+
+        :param path: absolute path of the file
+        :return: hex digest
+        """
+        stat = os.stat(path)
+        key = (path, stat.st_mtime_ns, stat.st_size)
+        if key not in self._hashes:
+            digest = hashlib.sha1(usedforsecurity=False)
+            with open(path, "rb") as data_file:
+                for chunk in iter(lambda: data_file.read(1024 * 1024), b""):
+                    digest.update(chunk)
+            self._hashes[key] = digest.hexdigest()
+        return self._hashes[key]
+
+    def refs(self, file_name: str, name: str | None = None) -> List[DatasetRef]:
+        """
+        Returns references to all rows of the dataset.
+
+        :param file_name: test data file, i.e.: "test_green_kart_shop_e2e.json" or "orders.jsonl"
+        :param name: dataset name - key in JSON file (default for JSON Lines: file name without extension)
+        :return: list of DatasetRef
+        """
+        path = self.path(file_name)
+        if path.endswith(JSON_LINES_EXTENSIONS):
+            name = name or os.path.splitext(os.path.basename(path))[0]
+            return [DatasetRef(path, name, index, offset) for index, offset in enumerate(self._index(path))]
+        if name is None:
+            raise ValueError(f"Dataset name is required for JSON file: '{file_name}'")
+        if name not in self._document(path):
+            raise KeyError(f"Dataset '{name}' not found in '{file_name}'")
+        return [DatasetRef(path, name, index) for index in range(len(self._dataset(path, name)))]
+
+    def resolve(self, ref: DatasetRef) -> DataRecord:
+        """
+        Returns record of the referenced dataset row.
+
+        :param ref: DatasetRef returned by refs()
+        :return: immutable record
+        """
+        if ref.offset < 0:
+            key = (self.file_hash(ref.path), ref.name)
+            if key not in self._records:
+                self._records[key] = make_records(ref.name, self._dataset(ref.path, ref.name))
+            return self._records[key][ref.row]
+        cls = self._row_type(ref.path, ref.name)
+        with open(ref.path, "rb") as data_file:
+            data_file.seek(ref.offset)
+            return _row_record(cls, ref.row, json.loads(data_file.readline()))
+
+    def records(self, file_name: str, name: str | None = None) -> Iterator[DataRecord]:
+        """
+        Yields records of the dataset (JSON Lines files are streamed row by row).
+
+        :param file_name: test data file, i.e.: "orders.jsonl"
+        :param name: dataset name - key in JSON file (default for JSON Lines: file name without extension)
+        :return: generator of records
+        """
+        path = self.path(file_name)
+        if not path.endswith(JSON_LINES_EXTENSIONS):
+            for ref in self.refs(file_name, name):
+                yield self.resolve(ref)
+            return
+        cls = self._row_type(path, name or os.path.splitext(os.path.basename(path))[0])
+        with open(path, "rb") as data_file:
+            rows = (json.loads(line) for line in data_file if line.strip())
+            for index, row in enumerate(rows):
+                yield _row_record(cls, index, row)
+
+    def _document(self, path: str) -> Dict[str, Any]:
+        file_hash = self.file_hash(path)
+        if file_hash not in self._documents:
+            with open(path, encoding="utf-8") as json_file:
+                self._documents[file_hash] = json.load(json_file)
+        return self._documents[file_hash]
+
+    def _dataset(self, path: str, name: str) -> List[Dict[str, Any]]:
+        """
+        Returns rows of dataset from JSON file - dataset declared with dimensions is expanded once.
+
+        :param path: absolute path of the file
+        :param name: dataset name
+        :return: list of rows
+        """
+        key = (self.file_hash(path), name)
+        if key not in self._rows:
+            dataset = self._document(path)[name]
+            self._rows[key] = expand_dataset(dataset) if isinstance(dataset, dict) else dataset
+        return self._rows[key]
+
+    def _index(self, path: str) -> array:
+        file_hash = self.file_hash(path)
+        if file_hash not in self._offsets:
+            offsets = array("q")
+            position = 0
+            with open(path, "rb") as data_file:
+                for line in data_file:
+                    if line.strip():
+                        offsets.append(position)
+                    position += len(line)
+            self._offsets[file_hash] = offsets
+        return self._offsets[file_hash]
+
+    def _row_type(self, path: str, name: str) -> Type[DataRecord]:
+        """
+        Returns record class of JSON Lines file - schema is defined by the first row.
+
+        :param path: absolute path of the file
+        :param name: dataset name
+        :return: DataRecord subclass
+        """
+        key = (self.file_hash(path), name)
+        if key not in self._row_types:
+            with open(path, "rb") as data_file:
+                first_row = next(line for line in data_file if line.strip())
+            self._row_types[key] = record_type(name, json.loads(first_row))
+        return self._row_types[key]
+
+
+def _row_record(cls: Type[DataRecord], index: int, row: Dict[str, Any]) -> DataRecord:
+    """
+    Converts JSON Lines row to record.
+
+    :param cls: record class of the file
+    :param index: row index (used in error message)
+    :param row: parsed row
+    :return: immutable record
+    """
+    check_schema(cls.__name__, index, row, cls.__slots__)
+    return cls(**row)
+
+
+DATA_REGISTRY = DataRegistry()
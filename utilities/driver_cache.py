@@ -0,0 +1,139 @@
+"""
+Contains DriverCache class - driver and browser binaries resolved by Selenium Manager, cached once per machine.
+
+Each launch of a browser without a driver path runs Selenium Manager (a subprocess that checks browser and driver
+versions, possibly online). With the cache, the driver path is passed to the Service and the browser path to the
+options, so the launch skips Selenium Manager, i.e.:
+    >> options = webdriver.ChromeOptions()
+    >> service = webdriver.ChromeService(DRIVER_CACHE.resolve("chrome", options))
+    >> driver = webdriver.Chrome(options=options, service=service)
+
+Entries are revalidated when the browser binary changes (its size or modification time - browser update) or a binary
+disappears. When Selenium Manager fails (i.e.: offline), the previous entry is used if its binaries still exist.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+import tempfile
+from typing import Any, Dict, List, Union
+
+from selenium.webdriver.chromium.options import ChromiumOptions
+from selenium.webdriver.common.selenium_manager import SeleniumManager
+from selenium.webdriver.firefox.options import Options as FirefoxOptions
+
+from utilities.logger import get_logger
+
+CACHE_FILE = os.path.join(os.path.expanduser("~"), ".cache", "selenium", "showcase_driver_cache.json")
+# Browsers resolved by Selenium Manager (safaridriver is a part of the system)
+BROWSERS = ("chrome", "edge", "firefox")
+
+_Options = Union[ChromiumOptions, FirefoxOptions]
+
+
+def binary_stamp(path: str) -> List[int]:
+    """
+    Returns stamp of the binary - it changes when the binary is replaced (i.e.: by a browser update).
+
+    :param path: path of the binary
+    :return: [size in bytes, modification time in ns]
+    """
+    stat = os.stat(path)
+    return [stat.st_size, stat.st_mtime_ns]
+
+
+def _is_valid(entry: Dict[str, Any], check_stamp: bool = True) -> bool:
+    """
+    Checks if cached binaries still exist (and the browser has not changed).
+
+    :param entry: cache entry
+    :param check_stamp: False - check only existence of the binaries
+    :return: True if the entry can be used
+    """
+    browser_path = entry["browser_path"]
+    if not os.path.isfile(entry["driver_path"]) or (browser_path and not os.path.isfile(browser_path)):
+        return False
+    return not check_stamp or not browser_path or binary_stamp(browser_path) == entry["browser_stamp"]
+
+
+class DriverCache:
+    """
+    Driver and browser paths resolved by Selenium Manager, saved in a JSON file shared by all projects and runs.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self, path: str = CACHE_FILE) -> None:
+        """
+
+        :param path: cache file
+        """
+        self.path = path
+        self.enabled = True
+        self.logger = get_logger(__name__)
+
+    def resolve(self, browser_name: str, options: _Options) -> str | None:
+        """
+        Returns driver path and sets browser path in the options (resolved by Selenium Manager if not cached).
+
+        :param browser_name: "chrome", "edge" or "firefox" (other browsers are not cached)
+        :param options: browser options, i.e.: ChromeOptions()
+        :return: driver path, None if the cache is disabled (Selenium Manager is run by the driver)
+        """
+        if not self.enabled or browser_name not in BROWSERS:
+            return None
+        key = f"{browser_name}:{options.binary_location}"
+        entries = self._load()
+        entry = entries.get(key)
+        if entry is None or not _is_valid(entry):
+            entry = self._discover(options, entry)
+            entries[key] = entry
+            self._save(entries)
+        if entry["browser_path"]:
+            options.binary_location = entry["browser_path"]
+        return entry["driver_path"]
+
+    def _discover(self, options: _Options, previous: Dict[str, Any] | None) -> Dict[str, Any]:
+        """
+        Resolves binaries with Selenium Manager.
+
+        :param options: browser options
+        :param previous: previous cache entry (used if Selenium Manager fails and its binaries exist)
+        :return: cache entry
+        """
+        args = ["--browser", options.capabilities["browserName"]]
+        if options.binary_location:
+            args += ["--browser-path", options.binary_location]
+        try:
+            output = SeleniumManager().binary_paths(args)
+        except Exception:  # pylint: disable=broad-exception-caught
+            if previous is None or not _is_valid(previous, check_stamp=False):
+                raise
+            self.logger.warning("Selenium Manager failed - cached driver used: %s", previous, exc_info=True)
+            return previous
+        browser_path = output.get("browser_path", "")
+        entry = {
+            "driver_path": output["driver_path"],
+            "browser_path": browser_path,
+            "browser_stamp": binary_stamp(browser_path) if browser_path else [],
+        }
+        self.logger.info("Driver resolved by Selenium Manager: %s", entry)
+        return entry
+
+    def _load(self) -> Dict[str, Dict[str, Any]]:
+        try:
+            with open(self.path, encoding="utf-8") as file:
+                return json.load(file)
+        except (OSError, ValueError):
+            return {}
+
+    def _save(self, entries: Dict[str, Dict[str, Any]]) -> None:
+        # written atomically - pytest-xdist workers can resolve at the same time
+        os.makedirs(os.path.dirname(self.path), exist_ok=True)
+        with tempfile.NamedTemporaryFile("w", dir=os.path.dirname(self.path), delete=False, encoding="utf-8") as file:
+            json.dump(entries, file, indent=2)
+        os.replace(file.name, self.path)
+
+
+DRIVER_CACHE = DriverCache()
@@ -0,0 +1,153 @@
+"""
+Streaming analyzer of structured (JSON Lines) framework logs, i.e.:
+    >> python -m utilities.log_analyzer reports/logger-logs.jsonl --top 10
+
+Reads the log line by line in constant memory - latencies are aggregated in log-scale histograms (~2.5% relative
+precision), so multi-GB logs can be analyzed. Prints per-action latency percentiles and the slowest locators.
+"""
+
+from __future__ import annotations
+
+import argparse
+import heapq
+import json
+import math
+import sys
+from typing import Dict, Iterable, List, TextIO, Tuple
+
+PERCENTILES = (50.0, 90.0, 95.0, 99.0)
+# Relative width of histogram buckets
+_BUCKET_BASE = 1.05
+_LOG_BUCKET_BASE = math.log(_BUCKET_BASE)
+
+
+class LatencyHistogram:
+    """
+    Log-scale histogram of durations in [ms] - memory depends on the range of values, not on their number.
+    """
+
+    def __init__(self) -> None:
+        self.buckets: Dict[int, int] = {}
+        self.count = 0
+        self.total = 0.0
+        self.max = 0.0
+
+    def add(self, duration_ms: float) -> None:
+        """
+        Adds a duration to the histogram.
+
+        :param duration_ms: duration in [ms]
+        :return: None
+        """
+        bucket = math.floor(math.log(max(duration_ms, 0.001)) / _LOG_BUCKET_BASE)
+        self.buckets[bucket] = self.buckets.get(bucket, 0) + 1
+        self.count += 1
+        self.total += duration_ms
+        self.max = max(self.max, duration_ms)
+
+    @property
+    def mean(self) -> float:
+        """Returns mean duration in [ms]."""
+        return self.total / self.count if self.count else 0.0
+
+    def percentile(self, percent: float) -> float:
+        """
+        Returns approximate percentile (middle of the bucket the percentile falls into).
+
+        :param percent: percentile, i.e.: 95.0
+        :return: duration in [ms]
+        """
+        if not self.count:
+            return 0.0
+        rank = math.ceil(self.count * percent / 100)
+        seen = 0
+        for bucket in sorted(self.buckets):
+            seen += self.buckets[bucket]
+            if seen >= rank:
+                return min(_BUCKET_BASE ** (bucket + 0.5), self.max)
+        return self.max
+
+
+class LogAnalyzer:
+    """
+    Aggregates action durations from structured log records.
+    """
+
+    def __init__(self) -> None:
+        self.actions: Dict[str, LatencyHistogram] = {}
+        self.locators: Dict[Tuple[str, str, str], LatencyHistogram] = {}
+        self.records = 0
+        self.skipped = 0
+
+    def feed(self, lines: Iterable[str]) -> None:
+        """
+        Processes log lines, one at a time. Records without duration and malformed lines are skipped.
+
+        :param lines: iterable of JSON Lines, i.e.: opened file
+        :return: None
+        """
+        for line in lines:
+            self.records += 1
+            try:
+                record = json.loads(line)
+                duration_ms = float(record["duration_ms"])
+                action = record["action"]
+            except (ValueError, KeyError, TypeError):
+                self.skipped += 1
+                continue
+            self.actions.setdefault(action, LatencyHistogram()).add(duration_ms)
+            key = (record.get("page", "-"), record.get("locator", "-"), action)
+            self.locators.setdefault(key, LatencyHistogram()).add(duration_ms)
+
+    def slowest_locators(self, top: int) -> List[Tuple[Tuple[str, str, str], LatencyHistogram]]:
+        """
+        Returns locators with the highest total time spent in actions.
+
+        :param top: number of locators to return
+        :return: list of ((page, locator, action), LatencyHistogram)
+        """
+        return heapq.nlargest(top, self.locators.items(), key=lambda item: item[1].total)
+
+    def report(self, output: TextIO, top: int = 10) -> None:
+        """
+        Writes summary.
+
+        :param output: text stream, i.e.: sys.stdout
+        :param top: number of slowest locators to print
+        :return: None
+        """
+        output.write(f"Records: {self.records}, without action duration: {self.skipped}\n\n")
+        header = "".join(f"{f'p{p:g}':>10}" for p in PERCENTILES)
+        output.write(f"{'action':<28}{'count':>8}{'mean':>10}{header}{'max':>10}  [ms]\n")
+        for action, histogram in sorted(self.actions.items(), key=lambda item: -item[1].total):
+            values = "".join(f"{histogram.percentile(p):>10.1f}" for p in PERCENTILES)
+            output.write(f"{action:<28}{histogram.count:>8}{histogram.mean:>10.1f}{values}{histogram.max:>10.1f}\n")
+        output.write(f"\nSlowest locators (by total time):\n{'total':>10}{'count':>8}{'mean':>10}{'max':>10}  [ms]\n")
+        for (page, locator, action), histogram in self.slowest_locators(top):
+            output.write(
+                f"{histogram.total:>10.1f}{histogram.count:>8}{histogram.mean:>10.1f}{histogram.max:>10.1f}"
+                f"  {page} {action} {locator}\n"
+            )
+
+
+def main(argv: List[str] | None = None) -> None:
+    """
+    Command line entry point.
+
+    :param argv: command line arguments (default: sys.argv)
+    :return: None
+    """
+    parser = argparse.ArgumentParser(description="Summarize structured (JSON Lines) framework logs.")
+    parser.add_argument("log_files", nargs="+", help="paths to JSON Lines log files")
+    parser.add_argument("--top", type=int, default=10, help="number of slowest locators to print")
+    args = parser.parse_args(argv)
+
+    analyzer = LogAnalyzer()
+    for log_file in args.log_files:
+        with open(log_file, encoding="utf-8") as lines:
+            analyzer.feed(lines)
+    analyzer.report(sys.stdout, args.top)
+
+
+if __name__ == "__main__":
+    main()
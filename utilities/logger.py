@@ -1,34 +1,254 @@
 """
 Contains logger setup.
+
+All loggers share a single, process-wide backend: records are put on a queue by a ``QueueHandler`` and written to
+the log file by a ``QueueListener`` running in a background thread, so logging does not block the caller on disk I/O.
+
+Optionally, DEBUG records can be kept in a fixed-size in-memory ring buffer instead (see: enable_ring_buffer()) and
+written to the log file only on demand, i.e.: when a test fails.
+
+Log file can be written in structured JSON Lines format (see: enable_structured_logs()) - each record carries test
+nodeid, page class, control locator, action and its duration, ready for utilities/log_analyzer.py.
 """
 
+import atexit
+import json
 import logging
+import os
+import queue
+from collections import deque
+from functools import lru_cache
+from logging.handlers import QueueHandler, QueueListener
+from typing import Deque, Dict, List
 
 LOGGER_FILE_PATH = "reports/logger-logs.log"
+STRUCTURED_LOGGER_FILE_PATH = "reports/logger-logs.jsonl"
+LOGGING_LEVEL = logging.DEBUG
+LOGGER_FORMATTER = logging.Formatter(
+    fmt="%(asctime)s :@: %(name)s :@: %(levelname)s :@: %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
+)  # ' :@: ' - delimiter, 5 characters
 
+# File handler to move stdout to log file - file is opened on the first record written.
+_FILE_HANDLER = logging.FileHandler(LOGGER_FILE_PATH, mode="a", encoding="utf-8", delay=True)
+_FILE_HANDLER.setFormatter(LOGGER_FORMATTER)
+_FILE_HANDLER.setLevel(LOGGING_LEVEL)
 
-def get_logger(name: str | None = None) -> logging.Logger:
+_QUEUE: queue.SimpleQueue = queue.SimpleQueue()
+_QUEUE_HANDLER = QueueHandler(_QUEUE)
+_QUEUE_HANDLER.setLevel(LOGGING_LEVEL)
+_LISTENER = QueueListener(_QUEUE, _FILE_HANDLER, respect_handler_level=True)
+
+_LOGGERS: List[logging.Logger] = []
+
+# Fields added to every record in structured mode, i.e.: {"nodeid": "tests/test_x.py::TestX::test_x"}
+LOG_CONTEXT: Dict[str, str] = {}
+# Record attributes (set through ``extra``) written by JsonLinesFormatter
+STRUCTURED_FIELDS = ("nodeid", "page", "locator", "action", "duration_ms")
+
+
+def set_log_context(**fields: str) -> None:
     """
-    Function to set file handler, generate log file and return logger instance.
+    Updates fields added to every record in structured mode.
 
-    :param name: name for a logger
-    :return: the logger instance
+    :param fields: field values, i.e.: nodeid="tests/test_x.py::TestX::test_x"
+    :return: None
     """
-    _logger = logging.getLogger(name or __name__)
+    LOG_CONTEXT.update(fields)
+
+
+class JsonLinesFormatter(logging.Formatter):
+    """
+    Formats records as single-line JSON objects.
+    """
+
+    def format(self, record: logging.LogRecord) -> str:
+        data = {
+            "time": round(record.created, 6),
+            "name": record.name,
+            "level": record.levelname,
+            "message": record.getMessage(),
+        }
+        for field in STRUCTURED_FIELDS:
+            value = getattr(record, field, None)
+            if value is not None:
+                data[field] = value
+        return json.dumps(data, ensure_ascii=False)
+
+
+class _ContextFilter(logging.Filter):
+    """
+    Adds LOG_CONTEXT fields to the record (in caller's thread) unless they were set explicitly through ``extra``.
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        for field, value in LOG_CONTEXT.items():
+            if not hasattr(record, field):
+                setattr(record, field, value)
+        return True
+
+
+class RingBufferHandler(logging.Handler):
+    """
+    Keeps the last ``capacity`` DEBUG records in memory, older ones are dropped.
+    """
+
+    def __init__(self) -> None:
+        super().__init__(LOGGING_LEVEL)
+        self.enabled = False
+        self.buffer: Deque[logging.LogRecord] = deque(maxlen=0)
+        self.addFilter(lambda record: record.levelno < logging.INFO)
+
+    def enable(self, capacity: int) -> None:
+        """
+        Starts buffering records.
+
+        :param capacity: maximum number of records kept in the buffer
+        :return: None
+        """
+        self.enabled = True
+        self.buffer = deque(maxlen=capacity)
+
+    def emit(self, record: logging.LogRecord) -> None:
+        self.buffer.append(record)
+
+    def clear(self) -> None:
+        """
+        Drops all buffered records.
+
+        :return: None
+        """
+        self.buffer.clear()
+
+
+_RING_BUFFER = RingBufferHandler()
+
+
+def _start_listener() -> None:
+    if _LISTENER._thread is None:  # pylint: disable=protected-access
+        _LISTENER.start()
+
+
+def _stop_listener() -> None:
+    """
+    Stops background listener - all queued records are written before it returns.
+
+    :return: None
+    """
+    if _LISTENER._thread is not None:  # pylint: disable=protected-access
+        _LISTENER.stop()
+
+
+def flush() -> None:
+    """
+    Writes all queued records to the log file.
+
+    :return: None
+    """
+    _stop_listener()
+    _FILE_HANDLER.flush()
+    _start_listener()
+
+
+def reset_log_file() -> None:
+    """
+    Writes all queued records, then closes and removes the log file. It is reopened on the next record.
+
+    :return: None
+    """
+    _stop_listener()
+    _FILE_HANDLER.close()
+    if os.path.exists(_FILE_HANDLER.baseFilename):
+        os.remove(_FILE_HANDLER.baseFilename)
+    _start_listener()
+
+
+def enable_structured_logs(path: str = STRUCTURED_LOGGER_FILE_PATH) -> None:
+    """
+    Switches log file to structured JSON Lines format.
+
+    :param path: path to the log file
+    :return: None
+    """
+    _stop_listener()
+    _FILE_HANDLER.close()
+    _FILE_HANDLER.baseFilename = os.path.abspath(path)
+    _FILE_HANDLER.setFormatter(JsonLinesFormatter())
+    _QUEUE_HANDLER.addFilter(_ContextFilter())
+    _RING_BUFFER.addFilter(_ContextFilter())
+    _start_listener()
+
+
+def enable_ring_buffer(capacity: int) -> None:
+    """
+    Switches DEBUG records from the log file to the in-memory ring buffer. Records of INFO level and above are still
+    written to the log file.
+
+    :param capacity: maximum number of DEBUG records kept in the buffer
+    :return: None
+    """
+    if _RING_BUFFER.enabled:
+        return
+    _RING_BUFFER.enable(capacity)
+    _QUEUE_HANDLER.setLevel(logging.INFO)
+    for _logger in _LOGGERS:
+        _attach_ring_buffer(_logger)
+
+
+def _attach_ring_buffer(_logger: logging.Logger) -> None:
+    if not _RING_BUFFER.enabled:
+        return
+    # DEBUG records have to be created regardless of the root logger level to reach the buffer
+    _logger.setLevel(LOGGING_LEVEL)
+    _logger.addHandler(_RING_BUFFER)
+
+
+def clear_ring_buffer() -> None:
+    """
+    Drops all records from the ring buffer.
+
+    :return: None
+    """
+    _RING_BUFFER.clear()
+
+
+def dump_ring_buffer(title: str) -> None:
+    """
+    Writes all records from the ring buffer to the log file (after the header record) and clears the buffer.
+
+    :param title: header of dumped records, i.e.: failed test name
+    :return: None
+    """
+    if not _RING_BUFFER.buffer:
+        return
+    records = list(_RING_BUFFER.buffer)
+    _RING_BUFFER.clear()
+    header = logging.getLogger(__name__).makeRecord(
+        __name__, logging.INFO, __file__, 0, "DEBUG records (%s) of: %s", (len(records), title), None
+    )
+    _QUEUE_HANDLER.handle(header)
+    for record in records:
+        # Handler.handle() applies filters only - DEBUG records pass through the INFO level queue handler
+        _QUEUE_HANDLER.handle(record)
 
-    # Set main options
-    logging_level = logging.DEBUG
-    formatter = logging.Formatter(
-        fmt="%(asctime)s :@: %(name)s :@: %(levelname)s :@: %(message)s", datefmt="%Y-%m-%d %H:%M:%S"
-    )  # ' :@: ' - delimiter, 5 characters
 
-    # File handler to move stdout to log file
-    file_handler = logging.FileHandler(LOGGER_FILE_PATH, mode="a", encoding="utf-8")
-    file_handler.setFormatter(formatter)
-    file_handler.setLevel(logging_level)
+atexit.register(_stop_listener)
 
-    # Add handlers
-    _logger.handlers.clear()
-    _logger.addHandler(file_handler)
 
+@lru_cache(maxsize=None)
+def get_logger(name: str | None = None) -> logging.Logger:
+    """
+    Function to return logger instance attached to the shared log file backend. Cached - the backend is attached to
+    each logger only once, subsequent calls are a dictionary lookup.
+
+    :param name: name for a logger
+    :return: the logger instance
+    """
+    _logger = logging.getLogger(name or __name__)
+    _start_listener()
+    if _QUEUE_HANDLER not in _logger.handlers:
+        _logger.addHandler(_QUEUE_HANDLER)
+        _attach_ring_buffer(_logger)
+        _LOGGERS.append(_logger)
     return _logger
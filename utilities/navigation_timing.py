@@ -0,0 +1,109 @@
+"""
+Contains NavigationTimingRecorder class - Navigation Timing and Resource Timing data of page navigations
+(see: utilities/plugins/navigation_timing.py).
+"""
+
+from __future__ import annotations
+
+from statistics import median
+from typing import Any, Dict, List, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+TOP_RESOURCES = 5
+
+# Collects timing of the last document load. Resources are sorted by duration, only the largest ones are returned.
+# Returns null when the browser has no navigation entry (i.e.: about:blank, or a browser without Navigation Timing 2).
+_DOCUMENT_TIMING_SCRIPT = """
+    const [top] = arguments;
+    const nav = performance.getEntriesByType('navigation')[0];
+    if (!nav) {
+        return null;
+    }
+    const resources = performance.getEntriesByType('resource');
+    return {
+        url: window.location.href,
+        dns: nav.domainLookupEnd - nav.domainLookupStart,
+        connect: nav.connectEnd - nav.connectStart,
+        ttfb: nav.responseStart - nav.startTime,
+        dom_content_loaded: nav.domContentLoadedEventEnd - nav.startTime,
+        load: nav.loadEventEnd > 0 ? nav.loadEventEnd - nav.startTime : performance.now(),
+        transfer_size: nav.transferSize,
+        resources_count: resources.length,
+        resources: resources
+            .sort((a, b) => b.duration - a.duration)
+            .slice(0, top)
+            .map((r) => ({name: r.name, type: r.initiatorType, duration: r.duration, size: r.transferSize})),
+    };
+"""
+
+# Collects timing of SPA route change started at given performance.now() mark.
+_ROUTE_TIMING_SCRIPT = """
+    const [top, since] = arguments;
+    const resources = performance.getEntriesByType('resource').filter((r) => r.startTime >= since);
+    return {
+        url: window.location.href,
+        route_change: performance.now() - since,
+        resources_count: resources.length,
+        resources: resources
+            .sort((a, b) => b.duration - a.duration)
+            .slice(0, top)
+            .map((r) => ({name: r.name, type: r.initiatorType, duration: r.duration, size: r.transferSize})),
+    };
+"""
+
+# Timing fields aggregated in the session summary, in [ms].
+SUMMARY_FIELDS = ("dns", "connect", "ttfb", "dom_content_loaded", "load", "route_change")
+
+
+class NavigationTimingRecorder:
+    """
+    Records navigation timings of page objects and aggregates them per page class.
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.user_properties: List[Tuple[str, Any]] | None = None  # of the running test (set by the plugin)
+        self.timings: Dict[str, List[Dict[str, Any]]] = {}
+
+    def record(self, driver: WebDriver, page_name: str, route_start: float | None = None) -> None:
+        """
+        Collects timing data of the last navigation (single script call) if recording is enabled (navigation without
+        timing data is skipped).
+
+        :param driver: WebDriver for current browser, i.e.: webdriver.Chrome()
+        :param page_name: name of page object class
+        :param route_start: performance.now() mark of SPA route change (None - full document load)
+        :return: None
+        """
+        if not self.enabled:
+            return
+        if route_start is None:
+            timing = driver.execute_script(_DOCUMENT_TIMING_SCRIPT, TOP_RESOURCES)
+        else:
+            timing = driver.execute_script(_ROUTE_TIMING_SCRIPT, TOP_RESOURCES, route_start)
+        if timing is None:
+            return
+        timing["page"] = page_name
+        self.timings.setdefault(page_name, []).append(timing)
+        if self.user_properties is not None:
+            self.user_properties.append(("navigation_timing", timing))
+
+    def summary(self) -> Dict[str, Dict[str, Any]]:
+        """
+        Aggregates recorded timings per page class (medians of timing fields).
+
+        :return: dict['page_name'] = {'navigations': int, 'field': median value in [ms], ...}
+        """
+        result: Dict[str, Dict[str, Any]] = {}
+        for page_name, timings in sorted(self.timings.items()):
+            page_summary: Dict[str, Any] = {"navigations": len(timings)}
+            for field in SUMMARY_FIELDS:
+                values = [timing[field] for timing in timings if field in timing]
+                if values:
+                    page_summary[field] = round(median(values), 1)
+            result[page_name] = page_summary
+        return result
+
+
+NAVIGATION_TIMING = NavigationTimingRecorder()
@@ -0,0 +1,98 @@
+"""
+Contains PageAffinity class - hands the browser over between consecutive test classes that use the same page
+(see: utilities/plugins/page_affinity.py).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Tuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utilities.logger import get_logger
+
+
+class PageAffinity:
+    """
+    Keeps the driver of a read-only test class (parked) for the next test class that uses the same page, so the next
+    class neither starts a new browser nor loads the page again, i.e.:
+        >> driver = PAGE_AFFINITY.take() or webdriver.Chrome()  # in browser_instance fixture setup
+        >> if not PAGE_AFFINITY.park(driver):                   # in browser_instance fixture teardown
+        >>     driver.quit()
+    """
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.scope = ""  # nodeid of the running test class
+        self.successor = ""  # nodeid of the next test class, if the running one hands its driver over
+        self.visited: Dict[str, str] = {}  # dict['test class nodeid'] = name of the first page object it went to
+        self.logger = get_logger(__name__)
+        self._parked: Tuple[WebDriver, str] | None = None  # (driver, nodeid of the test class it is parked for)
+        self._loaded_url: str | None = None
+
+    def start(self, scope: str, successor: str = "") -> None:
+        """
+        Sets the running test class. Parked driver is quitted if the class is not the one it was parked for.
+
+        :param scope: nodeid of the test class (or module for tests outside classes)
+        :param successor: nodeid of the next test class if the driver is handed over to it, empty string otherwise
+        :return: None
+        """
+        if self._parked is not None and scope not in (self.scope, self._parked[1]):
+            self.release()
+        self.scope = scope
+        self.successor = successor
+
+    def visit(self, page) -> bool:
+        """
+        Records navigation of the running test class to the page (see: BasePage.go_to()).
+
+        :param page: page object, i.e.: AutomationPracticePage(driver)
+        :return: True if the page is already loaded in the handed over driver (navigation can be skipped)
+        """
+        if not self.enabled:
+            return False
+        self.visited.setdefault(self.scope, type(page).__name__)
+        loaded, self._loaded_url = self._loaded_url, None  # only the first navigation of the class can be skipped
+        return loaded is not None and loaded == page.url
+
+    def park(self, driver: WebDriver) -> bool:
+        """
+        Keeps the driver for the next test class, if the running one hands it over.
+
+        :param driver: WebDriver of the running test class
+        :return: True if parked (must not be quitted), False otherwise
+        """
+        if not self.enabled or not self.successor:
+            return False
+        self.release()
+        self._parked = (driver, self.successor)
+        self._loaded_url = driver.current_url
+        self.logger.info("WebDriver parked for '%s'.", self.successor)
+        return True
+
+    def take(self) -> WebDriver | None:
+        """
+        Returns driver parked for the running test class.
+
+        :return: WebDriver or None if there is no parked driver
+        """
+        if self._parked is None:
+            self._loaded_url = None
+            return None
+        driver, self._parked = self._parked[0], None
+        return driver
+
+    def release(self) -> None:
+        """
+        Quits parked driver (not taken by the class it was parked for).
+
+        :return: None
+        """
+        if self._parked is not None:
+            self.logger.info("WebDriver parked for '%s' quitted.", self._parked[1])
+            self._parked[0].quit()
+        self._parked, self._loaded_url = None, None
+
+
+PAGE_AFFINITY = PageAffinity()
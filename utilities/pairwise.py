@@ -0,0 +1,145 @@
+"""
+Contains covering_array() function - pairwise (t-wise) expansion of test data dimensions, i.e.:
+
+    >> covering_array({"product_name": ["Blackberry", "iphone X", "Nokia Edge"],
+    >>                 "delivery_country": ["Poland", "India"],
+    >>                 "type_len": [2, 3, -1]})
+
+returns 9 rows (instead of 18 of the full cartesian product) in which every pair of values of any two dimensions occurs
+at least once. Datasets in test_data/ JSON files can be declared the same way (see: expand_dataset()).
+"""
+
+from __future__ import annotations
+
+import itertools
+from typing import Any, Dict, Iterable, List, Mapping, Sequence, Set, Tuple
+
+# dimension index -> value index
+_Assignment = Dict[int, int]
+
+
+def covering_array(
+    dimensions: Mapping[str, Sequence[Any]],
+    strength: int = 2,
+    forbidden: Iterable[Mapping[str, Any]] = (),
+) -> List[Dict[str, Any]]:
+    """
+    Returns rows covering every combination of values of any ``strength`` dimensions (greedy, deterministic).
+
+    Value of a dimension can be a dict - its items are merged into the row instead of the dimension name, so values
+    that belong together (i.e.: product name and its price) are never split.
+
+    :param dimensions: dict['dimension name'] = list of values
+    :param strength: number of dimensions whose combinations have to be covered (2 - pairwise)
+    :param forbidden: combinations of row fields that must not occur, i.e.: [{"type_len": 3, "delivery_country": "USA"}]
+    :return: list of rows, i.e.: [{"product_name": "Blackberry", "delivery_country": "Poland", "type_len": 2}, ...]
+    """
+    values = [list(dimension_values) for dimension_values in dimensions.values()]
+    if not 1 <= strength <= len(values):
+        raise ValueError(f"Strength has to be between 1 and {len(values)} (number of dimensions), got: {strength}")
+    if not all(values):
+        raise ValueError(f"Every dimension requires at least one value: {list(dimensions)}")
+    forbidden = [dict(combination) for combination in forbidden]
+    names = list(dimensions)
+
+    def allowed(assignment: _Assignment) -> bool:
+        row = _merge(names, values, assignment)
+        return not any(
+            all(field in row and row[field] == value for field, value in combination.items())
+            for combination in forbidden
+        )
+
+    uncovered: Dict[Tuple[int, ...], Set[Tuple[int, ...]]] = {
+        dims: {
+            combo
+            for combo in itertools.product(*(range(len(values[dim])) for dim in dims))
+            if allowed(dict(zip(dims, combo)))
+        }
+        for dims in itertools.combinations(range(len(values)), strength)
+    }
+
+    def gain(assignment: _Assignment, dim: int, value: int) -> int:
+        others = sorted(assigned for assigned in assignment if assigned != dim)
+        count = 0
+        for subset in itertools.combinations(others, strength - 1):
+            dims = tuple(sorted((*subset, dim)))
+            combo = tuple(value if each == dim else assignment[each] for each in dims)
+            count += combo in uncovered[dims]
+        return count
+
+    def complete(assignment: _Assignment, free: List[int]) -> _Assignment | None:
+        # depth-first - values of a dimension are tried in order of gain, so the first completion is the greedy one
+        if not free:
+            return assignment
+        dim, rest = free[0], free[1:]
+        gains = {
+            value: gain(assignment, dim, value)
+            for value in range(len(values[dim]))
+            if allowed({**assignment, dim: value})
+        }
+        for value in sorted(gains, key=lambda each: -gains[each]):
+            completed = complete({**assignment, dim: value}, rest)
+            if completed is not None:
+                return completed
+        return None
+
+    rows = []
+    while any(uncovered.values()):
+        # start with a combination of the dimensions with the most combinations left
+        seed_dims = max(uncovered, key=lambda dims: len(uncovered[dims]))
+        seed = min(uncovered[seed_dims])
+        assignment = complete(dict(zip(seed_dims, seed)), [dim for dim in range(len(values)) if dim not in seed_dims])
+        if assignment is None:
+            # no row contains the combination without a forbidden one
+            uncovered[seed_dims].discard(seed)
+            continue
+        for dims in uncovered:
+            uncovered[dims].discard(tuple(assignment[dim] for dim in dims))
+        rows.append(_merge(names, values, assignment))
+    return rows
+
+
+def expand_dataset(spec: Mapping[str, Any]) -> List[Dict[str, Any]]:
+    """
+    Expands dataset declared in test data file as dimensions, i.e.:
+
+        "order_pairwise": {
+            "fixed": {"product_quantity": 1.0},
+            "dimensions": {
+                "product": [{"product_name": "Blackberry", "product_price": 50000.0}, ...],
+                "delivery_country": ["Poland", "India"],
+                "type_len": [2, 3, -1]
+            },
+            "strength": 2,
+            "forbidden": [{"type_len": 2, "delivery_country": "India"}]
+        }
+
+    :param spec: dataset specification - "dimensions" are required, other keys are optional
+    :return: list of rows (fixed fields included)
+    """
+    if not isinstance(spec.get("dimensions"), dict):
+        raise TypeError(
+            f"Received unexpected value type:\n TYPE: {type(spec.get('dimensions'))}\n EXPECTED: <class 'dict'>\n"
+        )
+    fixed = spec.get("fixed", {})
+    rows = covering_array(spec["dimensions"], spec.get("strength", 2), spec.get("forbidden", ()))
+    return [{**fixed, **row} for row in rows]
+
+
+def _merge(names: List[str], values: List[List[Any]], assignment: _Assignment) -> Dict[str, Any]:
+    """
+    Converts assignment to row - dict values are merged into the row.
+
+    :param names: dimension names
+    :param values: values of dimensions
+    :param assignment: dict[dimension index] = value index
+    :return: (partial) row
+    """
+    row: Dict[str, Any] = {}
+    for dim in sorted(assignment):
+        value = values[dim][assignment[dim]]
+        if isinstance(value, dict):
+            row.update(value)
+        else:
+            row[names[dim]] = value
+    return row
@@ -0,0 +1,67 @@
+"""
+Pytest plugin attaching ``browser_instance`` to browser sessions kept alive by the local browser daemon, i.e.:
+    >> python -m utilities.browser_daemon --sessions 2     # in a separate terminal, once
+    >> pytest --browser-daemon -k TestLabel
+    >> pytest --browser-daemon --browser-daemon-url http://127.0.0.1:5000 -n 2
+
+Test classes lease a running session instead of launching a browser (seconds of start-up) and hand it back after the
+class - the daemon resets the browser state (see: utilities/browser_daemon.py).
+"""
+
+import urllib.error
+
+import pytest
+
+from utilities.browser_daemon import BROWSER_DAEMON, DEFAULT_URL
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--browser-daemon",
+        action="store_true",
+        default=False,
+        help="lease browser sessions from the browser daemon instead of launching them",
+    )
+    parser.addoption(
+        "--browser-daemon-url",
+        action="store",
+        default=DEFAULT_URL,
+        metavar="URL",
+        help=f"URL of the browser daemon (default: {DEFAULT_URL})",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Connect to the browser daemon, if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    if not config.getoption("--browser-daemon"):
+        return
+    BROWSER_DAEMON.url = config.getoption("--browser-daemon-url")
+    for option in ("--concurrent-tabs", "--user-contexts"):
+        if config.getoption(option):
+            raise pytest.UsageError(f"--browser-daemon cannot be used with {option}")
+    try:
+        status = BROWSER_DAEMON.status()
+    except (urllib.error.URLError, OSError, ValueError) as error:
+        raise pytest.UsageError(
+            f"Browser daemon is not running at {BROWSER_DAEMON.url} ({error}), start it with:\n"
+            "    python -m utilities.browser_daemon"
+        ) from error
+    browser_name = config.getoption("--browser-name")
+    if status["browser_name"] != browser_name:
+        raise pytest.UsageError(
+            f"Browser daemon runs {status['browser_name']}, not {browser_name} - restart it with:\n"
+            f"    python -m utilities.browser_daemon --browser-name {browser_name}"
+        )
+    if not hasattr(config, "workerinput") and len(status["sessions"]) < config.getoption("numprocesses", 0, skip=True):
+        raise pytest.UsageError(f"Browser daemon has fewer sessions than pytest-xdist workers: {status}")
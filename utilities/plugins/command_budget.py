@@ -0,0 +1,81 @@
+"""
+Pytest plugin failing tests that exceed their WebDriver command (round trip) budget, i.e.:
+    >> @pytest.mark.max_webdriver_commands(50)
+    >> def test_web_table_get_body(self):
+
+Page object methods declare their own budget with the command_budget() decorator, i.e.:
+    >> @command_budget(2)
+    >> def get_products(self):
+
+Budgets are checked whenever WebDriver commands are traced - tracing is turned on automatically when any collected
+test carries the marker (and with --trace-webdriver). Failure message contains the breakdown of executed commands by
+command type and issuing method, so an extra per-row find_element is easy to spot.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Generator
+
+import pytest
+
+from utilities.command_budget import COMMAND_BUDGET
+from utilities.webdriver_tracer import COMMAND_TRACER
+
+MARKER = "max_webdriver_commands"
+
+
+def pytest_configure(config) -> None:
+    """
+    Register the budget marker.
+
+    :param config: pytest config object
+    :return: None
+    """
+    config.addinivalue_line("markers", f"{MARKER}(n): fail the test if it executes more than n WebDriver commands.")
+
+
+def pytest_collection_modifyitems(items) -> None:
+    """
+    Turn tracing on if any collected test declares its budget.
+
+    :param items: list of collected test items
+    :return: None
+    """
+    if COMMAND_TRACER.active or any(item.get_closest_marker(MARKER) for item in items):
+        COMMAND_TRACER.activate(COMMAND_BUDGET.on_command)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_call(item) -> Generator[None]:
+    """
+    Count commands executed by the test function (setup and teardown are not counted).
+
+    :param item: test item
+    :return: None
+    """
+    marker = item.get_closest_marker(MARKER)
+    if marker is None or not COMMAND_TRACER.active:
+        yield
+        return
+    scope = COMMAND_BUDGET.open(item.nodeid, int(marker.args[0]))
+    try:
+        yield
+    finally:
+        COMMAND_BUDGET.close(scope)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_makereport(item, call) -> Generator[None, Any, None]:  # pylint: disable=unused-argument
+    """
+    Fail passed test phase if any budget was exceeded during it.
+
+    :param item: test item
+    :param call: call info of the test phase
+    :return: None
+    """
+    outcome = yield
+    violations = COMMAND_BUDGET.pop_violations()
+    report = outcome.get_result()
+    if violations and report.passed:
+        report.outcome = "failed"
+        report.longrepr = "\n\n".join(scope.breakdown() for scope in violations)
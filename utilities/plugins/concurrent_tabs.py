@@ -0,0 +1,141 @@
+"""
+Pytest plugin running independent data sets concurrently in tabs of one shared browser, i.e.:
+    >> pytest -n 4 --concurrent-tabs tests/test_angular_practice_shop_e2e.py
+
+One browser (Chrome or Edge) is launched with remote debugging for the whole run. Each test class attaches its own
+WebDriver session to it and drives a new tab (closed after the class) instead of launching a new browser, so
+pytest-xdist workers run in parallel with the memory of a single browser process.
+
+Each parameter set of a test class (i.e.: each row of a class scoped ``dataset``) is a separate unit of work for
+pytest-xdist, so data sets of one class run concurrently on different workers (tests of the same data set are still
+run in order by one worker - see: ``step_chain`` marker).
+
+Tabs share the profile of the shared browser - cookies, localStorage, IndexedDB and cache are common to all test
+classes running at the same time (and left to the following ones), only sessionStorage is kept per tab. Suites of
+this repository keep their state in page memory (i.e.: shop carts), so their tabs do not interfere. A test class
+relying on its own cookies or storage (i.e.: a logged-in user) has to be marked and is rejected in this mode:
+    >> @pytest.mark.browser_storage
+    >> class TestAccount:
+"""
+
+from __future__ import annotations
+
+import pytest
+
+from utilities.concurrent_tabs import CONCURRENT_TABS
+from utilities.plugins.durations import ParameterSetScheduling, scope_of
+
+WORKER_INPUT = "concurrent_tabs_address"
+MARKER = "browser_storage"
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--concurrent-tabs",
+        action="store_true",
+        default=False,
+        help="run test classes in tabs of one shared browser (chrome, edge) and distribute their parameter sets "
+        "separately to pytest-xdist workers",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Register the storage marker and hooks that launch the shared browser and distribute parameter sets, if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    config.addinivalue_line(
+        "markers",
+        f"{MARKER}: the test relies on cookies or storage of its own browser (rejected with --concurrent-tabs).",
+    )
+    if not config.getoption("--concurrent-tabs"):
+        return
+    browser_name = config.getoption("--browser-name")
+    if browser_name not in CONCURRENT_TABS.SUPPORTED_BROWSERS:
+        raise pytest.UsageError(f"--concurrent-tabs supports only: {', '.join(CONCURRENT_TABS.SUPPORTED_BROWSERS)}")
+    if hasattr(config, "workerinput"):
+        CONCURRENT_TABS.address = config.workerinput[WORKER_INPUT]
+        return
+    config.pluginmanager.register(_ConcurrentTabsHooks(browser_name), "concurrent_tabs_hooks")
+
+
+def pytest_collection_modifyitems(config, items) -> None:
+    """
+    Reject tests relying on their own cookies or storage - tabs share them (collected by pytest-xdist workers).
+
+    :param config: pytest config object
+    :param items: list of collected test items
+    :return: None
+    """
+    if not config.getoption("--concurrent-tabs"):
+        return
+    rejected = sorted({scope_of(item.nodeid) for item in items if item.get_closest_marker(MARKER)})
+    if rejected:
+        raise pytest.UsageError(
+            f"--concurrent-tabs shares cookies and storage between tabs, deselect tests marked {MARKER}: "
+            + ", ".join(rejected)
+        )
+
+
+class _ConcurrentTabsHooks:
+    """
+    Hooks active only with --concurrent-tabs (in pytest-xdist controller or a run without workers).
+    """
+
+    def __init__(self, browser_name: str) -> None:
+        """
+
+        :param browser_name: "chrome" or "edge"
+        """
+        self.browser_name = browser_name
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_sessionstart(self) -> None:
+        """
+        Launch the shared browser (before pytest-xdist starts workers).
+
+        :return: None
+        """
+        CONCURRENT_TABS.launch(self.browser_name)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_configure_node(self, node) -> None:
+        """
+        Pass address of the shared browser to pytest-xdist worker.
+
+        :param node: pytest-xdist worker controller
+        :return: None
+        """
+        node.workerinput[WORKER_INPUT] = CONCURRENT_TABS.address
+
+    @pytest.hookimpl(optionalhook=True, tryfirst=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        """
+        Distribute parameter sets of test classes as whole units (before the scheduler of --longest-first).
+
+        :param config: pytest config object
+        :param log: pytest-xdist logger
+        :return: scheduler or None (default scheduler of --dist mode)
+        """
+        if config.getvalue("dist") not in ("load", "loadscope"):
+            return None
+        if config.getoption("--longest-first"):
+            config.option.loadscopereorder = False  # keep the order of collection instead of the number of tests
+        return ParameterSetScheduling(config, log)
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_sessionfinish(self) -> None:
+        """
+        Quit the shared browser.
+
+        :return: None
+        """
+        CONCURRENT_TABS.shutdown()
@@ -0,0 +1,65 @@
+"""
+Pytest plugin parametrizing tests with datasets from test_data/ directory, i.e.:
+    >> @pytest.mark.dataset("test_green_kart_shop_e2e.json", "order_basic")
+    >> class TestGreenKartShopOrderBasic:
+    >>     def test_go_to_page(self, test_data):
+
+Files are loaded through DATA_REGISTRY on first use (not at import of test modules) and cached by content hash. Tests
+are parametrized with lightweight references only - the record is resolved by the ``test_data`` fixture, so JSON
+Lines files with thousands of rows are never loaded into memory as a whole.
+
+Dataset of JSON file can be declared with dimensions instead of rows - it is expanded to a pairwise (t-wise) covering
+set (see: utilities/pairwise.py), so adding a dimension does not multiply the number of browser-bound runs.
+
+By default the parameters are class scoped (all tests of the class share one record), use scope="function" to change.
+"""
+
+import pytest
+
+from utilities.data_class import DataRecord
+from utilities.data_registry import DATA_REGISTRY
+
+MARKER = "dataset"
+
+
+def pytest_configure(config) -> None:
+    """
+    Register the dataset marker.
+
+    :param config: pytest config object
+    :return: None
+    """
+    config.addinivalue_line(
+        "markers",
+        f"{MARKER}(file_name, name=None, scope='class'): parametrize 'test_data' fixture with dataset rows.",
+    )
+
+
+def pytest_generate_tests(metafunc) -> None:
+    """
+    Parametrize ``test_data`` fixture with references to dataset rows.
+
+    :param metafunc: test function metadata
+    :return: None
+    """
+    marker = metafunc.definition.get_closest_marker(MARKER)
+    if marker is None or "test_data" not in metafunc.fixturenames:
+        return
+    file_name, *name = marker.args
+    refs = DATA_REGISTRY.refs(file_name, name[0] if name else marker.kwargs.get("name"))
+    metafunc.parametrize(
+        "test_data", refs, indirect=True, scope=marker.kwargs.get("scope", "class"), ids=[ref.id for ref in refs]
+    )
+
+
+@pytest.fixture(scope="class")
+def test_data(request) -> DataRecord:
+    """
+    Record of the dataset row the test is parametrized with (see: ``dataset`` marker).
+
+    :param request: the ``request`` fixture (see: class FixtureRequest in Selenium)
+    :return: immutable record
+    """
+    if not hasattr(request, "param"):
+        pytest.fail(f"'test_data' fixture requires @pytest.mark.{MARKER}(...) on {request.node.nodeid}", pytrace=False)
+    return DATA_REGISTRY.resolve(request.param)
@@ -0,0 +1,34 @@
+"""
+Pytest plugin controlling the cache of driver and browser binaries resolved by Selenium Manager, i.e.:
+    >> pytest --no-driver-cache      # run Selenium Manager on each browser launch
+
+By default, browsers are launched with driver path from the cache (see: utilities/driver_cache.py) - Selenium Manager
+runs only when the browser changes (i.e.: after an update), so launches are faster and work offline.
+"""
+
+from utilities.driver_cache import DRIVER_CACHE
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--no-driver-cache",
+        action="store_true",
+        default=False,
+        help=f"resolve driver with Selenium Manager on each browser launch instead of the cache ({DRIVER_CACHE.path})",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Disable the driver cache, if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    DRIVER_CACHE.enabled = not config.getoption("--no-driver-cache")
@@ -0,0 +1,299 @@
+"""
+Pytest plugin recording durations of tests into SQLite database and scheduling the longest test classes first, i.e.:
+    >> pytest --durations-db reports/durations.sqlite
+    >> pytest --durations-db reports/durations.sqlite --longest-first -n 4
+
+Duration of each test phase (setup, call, teardown) is saved for every run. Per-test and per-class totals are available
+as views, i.e.:
+    >> sqlite3 reports/durations.sqlite "SELECT scope, AVG(total) FROM class_durations GROUP BY scope"
+
+With --longest-first test classes (or modules for tests outside classes) are reordered by their expected duration
+(sum of average durations of their tests in the last runs), tests of a class keep their order. With pytest-xdist
+classes are distributed as whole units in that order to the first free worker (longest processing time scheduling),
+so the longest class does not start at the end of the run.
+"""
+
+from __future__ import annotations
+
+import os
+import sqlite3
+import statistics
+import time
+from typing import Dict, List, Tuple
+
+import pytest
+from xdist.scheduler import LoadScopeScheduling  # type: ignore[import-untyped]
+
+HISTORY_RUNS = 5
+KEEP_RUNS = 100
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS runs (
+    id INTEGER PRIMARY KEY AUTOINCREMENT,
+    started REAL NOT NULL,
+    workers INTEGER NOT NULL
+);
+CREATE TABLE IF NOT EXISTS durations (
+    run_id INTEGER NOT NULL REFERENCES runs(id) ON DELETE CASCADE,
+    nodeid TEXT NOT NULL,
+    scope TEXT NOT NULL,
+    phase TEXT NOT NULL,
+    duration REAL NOT NULL,
+    outcome TEXT NOT NULL,
+    PRIMARY KEY (run_id, nodeid, phase)
+);
+CREATE INDEX IF NOT EXISTS durations_nodeid ON durations(nodeid, run_id);
+CREATE VIEW IF NOT EXISTS test_durations AS
+    SELECT run_id, nodeid, scope, SUM(duration) AS total FROM durations GROUP BY run_id, nodeid;
+CREATE VIEW IF NOT EXISTS class_durations AS
+    SELECT run_id, scope, SUM(duration) AS total, COUNT(DISTINCT nodeid) AS tests FROM durations
+    GROUP BY run_id, scope;
+"""
+
+
+def scope_of(nodeid: str) -> str:
+    """
+    Returns scope of the test - test class or module for tests outside classes (the same as pytest-xdist loadscope).
+
+    :param nodeid: test nodeid, i.e.: "tests/test_page.py::TestPage::test_go_to[order_basic-0]"
+    :return: scope nodeid, i.e.: "tests/test_page.py::TestPage"
+    """
+    return nodeid.rsplit("::", 1)[0]
+
+
+def chain_scope(nodeid: str) -> str:
+    """
+    Returns scope of the test with its parameter set - each parameter set of a class (i.e.: each dataset row) is
+    a separate scenario (see: ``step_chain`` marker).
+
+    :param nodeid: test nodeid, i.e.: "tests/test_shop.py::TestOrder::test_setup[order_basic-0]"
+    :return: scope nodeid, i.e.: "tests/test_shop.py::TestOrder[order_basic-0]"
+    """
+    scope, name = nodeid.rsplit("::", 1)
+    _, bracket, params = name.partition("[")
+    return f"{scope}{bracket}{params}"
+
+
+class ParameterSetScheduling(LoadScopeScheduling):
+    """
+    pytest-xdist scheduler distributing each parameter set of a test class (see: chain_scope()) as a whole unit.
+    """
+
+    # pylint: disable=abstract-method
+
+    def _split_scope(self, nodeid: str) -> str:
+        return chain_scope(nodeid)
+
+
+class DurationsDB:
+    """
+    SQLite database of test durations.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+
+        :param path: database file (created if it does not exist)
+        """
+        self.path = path
+        directory = os.path.dirname(path)
+        if directory:
+            os.makedirs(directory, exist_ok=True)
+        self.connection = sqlite3.connect(path)
+        self.connection.execute("PRAGMA foreign_keys = ON")
+        self.connection.executescript(_SCHEMA)
+
+    def save_run(self, workers: int, durations: List[Tuple[str, str, float, str]]) -> int:
+        """
+        Saves durations of a run and removes runs older than KEEP_RUNS.
+
+        :param workers: number of pytest-xdist workers (0 without pytest-xdist)
+        :param durations: list of (nodeid, phase, duration in [s], outcome)
+        :return: id of the run
+        """
+        with self.connection:
+            cursor = self.connection.execute(
+                "INSERT INTO runs (started, workers) VALUES (?, ?)", (time.time(), workers)
+            )
+            run_id: int = cursor.lastrowid  # type: ignore[assignment]
+            self.connection.executemany(
+                "INSERT OR REPLACE INTO durations VALUES (?, ?, ?, ?, ?, ?)",
+                [
+                    (run_id, nodeid, scope_of(nodeid), phase, duration, outcome)
+                    for nodeid, phase, duration, outcome in durations
+                ],
+            )
+            self.connection.execute("DELETE FROM runs WHERE id <= ?", (run_id - KEEP_RUNS,))
+        return run_id
+
+    def estimates(self, last_runs: int = HISTORY_RUNS) -> Dict[str, float]:
+        """
+        Returns expected durations of tests - average of their last runs.
+
+        :param last_runs: number of the last runs of each test taken into account
+        :return: dict['test nodeid'] = duration in [s]
+        """
+        rows = self.connection.execute(
+            """
+            SELECT nodeid, AVG(total) FROM (
+                SELECT nodeid, total, ROW_NUMBER() OVER (PARTITION BY nodeid ORDER BY run_id DESC) AS age
+                FROM test_durations
+            ) WHERE age <= ? GROUP BY nodeid
+            """,
+            (last_runs,),
+        )
+        return dict(rows.fetchall())
+
+    def close(self) -> None:
+        """
+        Closes the database.
+
+        :return: None
+        """
+        self.connection.close()
+
+
+def longest_first(items: List[pytest.Item], estimates: Dict[str, float]) -> List[pytest.Item]:
+    """
+    Orders test scopes by expected duration (longest first) - tests of the same scope keep their order.
+
+    :param items: test items
+    :param estimates: dict['test nodeid'] = expected duration in [s]
+    :return: reordered test items
+    """
+    default = statistics.median(estimates.values()) if estimates else 0.0  # tests without history
+    scopes: Dict[str, List[pytest.Item]] = {}
+    for item in items:
+        scopes.setdefault(scope_of(item.nodeid), []).append(item)
+    ordered = sorted(scopes.values(), key=lambda scope: -sum(estimates.get(item.nodeid, default) for item in scope))
+    return [item for scope in ordered for item in scope]
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--durations-db",
+        action="store",
+        default=None,
+        metavar="PATH",
+        help="record durations of test phases into SQLite database, i.e.: reports/durations.sqlite",
+    )
+    parser.addoption(
+        "--longest-first",
+        action="store_true",
+        default=False,
+        help="run test classes with the longest recorded durations first (requires --durations-db)",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Register hooks that record durations and reorder tests, if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    path = config.getoption("--durations-db")
+    if path is None:
+        if config.getoption("--longest-first"):
+            raise pytest.UsageError("--longest-first requires --durations-db")
+        return
+    hooks = _DurationsHooks(path, config.getoption("--longest-first"), record=not hasattr(config, "workerinput"))
+    config.pluginmanager.register(hooks, "durations_hooks")
+
+
+class _DurationsHooks:
+    """
+    Hooks active only with --durations-db.
+    """
+
+    def __init__(self, path: str, reorder: bool, record: bool) -> None:
+        """
+
+        :param path: database file
+        :param reorder: True - run the longest test classes first
+        :param record: True - save durations (False for pytest-xdist workers, the controller receives their reports)
+        """
+        self.path = path
+        self.reorder = reorder
+        self.record = record
+        self.durations: List[Tuple[str, str, float, str]] = []
+        self.run_id = 0
+
+    @pytest.hookimpl(trylast=True)
+    def pytest_collection_modifyitems(self, items) -> None:
+        """
+        Reorder test classes by expected duration (after fixture-based reordering of pytest).
+
+        :param items: list of test items
+        :return: None
+        """
+        if not self.reorder:
+            return
+        database = DurationsDB(self.path)
+        try:
+            estimates = database.estimates()
+        finally:
+            database.close()
+        items[:] = longest_first(items, estimates)
+
+    @pytest.hookimpl(optionalhook=True)
+    def pytest_xdist_make_scheduler(self, config, log):
+        """
+        Distribute test classes as whole units in collection order (longest first) to the first free worker.
+
+        :param config: pytest config object
+        :param log: pytest-xdist logger
+        :return: scheduler or None (default scheduler of --dist mode)
+        """
+        if not self.reorder or config.getvalue("dist") not in ("load", "loadscope"):
+            return None
+        config.option.loadscopereorder = False  # keep the order of collection instead of the number of tests
+        return LoadScopeScheduling(config, log)
+
+    def pytest_runtest_logreport(self, report) -> None:
+        """
+        Collect duration of the test phase.
+
+        :param report: test phase report
+        :return: None
+        """
+        if self.record:
+            self.durations.append((report.nodeid, report.when, report.duration, report.outcome))
+
+    def pytest_sessionfinish(self, session) -> None:
+        """
+        Save durations of the run.
+
+        :param session: pytest session object
+        :return: None
+        """
+        if not self.durations:
+            return
+        database = DurationsDB(self.path)
+        try:
+            self.run_id = database.save_run(getattr(session.config.option, "numprocesses", None) or 0, self.durations)
+        finally:
+            database.close()
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        """
+        Print the slowest test classes of the run.
+
+        :param terminalreporter: terminal reporter object
+        :return: None
+        """
+        if not self.run_id:
+            return
+        totals: Dict[str, float] = {}
+        for nodeid, _, duration, _ in self.durations:
+            totals[scope_of(nodeid)] = totals.get(scope_of(nodeid), 0.0) + duration
+        terminalreporter.write_sep("=", "slowest test classes")
+        for scope, total in sorted(totals.items(), key=lambda item: -item[1])[:10]:
+            terminalreporter.write_line(f"{total:>10.2f}s  {scope}")
+        terminalreporter.write_line(f"Durations saved: {self.path} (run {self.run_id})")
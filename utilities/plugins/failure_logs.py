@@ -0,0 +1,81 @@
+"""
+Pytest plugin keeping DEBUG logs of each test in an in-memory ring buffer, i.e.:
+    >> pytest --debug-logs-on-failure
+
+DEBUG records are written to the log file only when the test fails or errors (in any phase), so passing tests write
+almost no log output and failures still have full context. Records of INFO level and above are written as usual.
+"""
+
+from typing import Any, Generator
+
+import pytest
+
+from utilities.logger import clear_ring_buffer, dump_ring_buffer, enable_ring_buffer
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--debug-logs-on-failure",
+        action="store_true",
+        default=False,
+        help="keep DEBUG logs in memory and write them to the log file only for failed tests",
+    )
+    parser.addoption(
+        "--debug-logs-buffer-size",
+        action="store",
+        type=int,
+        default=2000,
+        help="number of DEBUG records kept in memory per test (used with --debug-logs-on-failure)",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Enable the ring buffer and register hooks that manage it.
+
+    :param config: pytest config object
+    :return: None
+    """
+    if not config.getoption("--debug-logs-on-failure"):
+        return
+    enable_ring_buffer(config.getoption("--debug-logs-buffer-size"))
+    # pytest's own log file would still write every DEBUG record of passing tests to disk
+    config.option.log_file_level = "INFO"
+    config.pluginmanager.register(_FailureLogsHooks(), "failure_logs_hooks")
+
+
+class _FailureLogsHooks:
+    """
+    Hooks active only with --debug-logs-on-failure.
+    """
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item) -> Generator[None]:  # pylint: disable=unused-argument
+        """
+        Start each test with an empty buffer.
+
+        :param item: test item
+        :return: None
+        """
+        clear_ring_buffer()
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call) -> Generator[None, Any, None]:  # pylint: disable=unused-argument
+        """
+        Write buffered DEBUG records if test phase failed.
+
+        :param item: test item
+        :param call: call info of the test phase
+        :return: None
+        """
+        outcome = yield
+        report = outcome.get_result()
+        if report.failed:
+            dump_ring_buffer(f"{item.nodeid} ({report.when})")
@@ -0,0 +1,309 @@
+"""
+Pytest plugin retrying failed test classes on a fresh driver and quarantining flaky test classes, i.e.:
+    >> pytest --retry-classes 2       # blocking lane - quarantined classes are deselected
+    >> pytest --quarantine-lane       # non-blocking lane - only quarantined classes, failures are reported as xfail
+
+A parameter set of a test class (i.e.: a dataset row, or the whole class if it is not parametrized) with a failed test
+is run again as a whole - class scoped fixtures are torn down after each parameter set, so the retry starts with a new
+browser. Only reports of the last attempt are logged.
+
+Each run of a test is counted in flake statistics (pytest cache, .pytest_cache has to be kept between runs) - a test
+is flaky when it failed in an attempt and passed in the retry. A test with flake rate above --flake-threshold (after
+at least MIN_RUNS runs) or marked with @pytest.mark.quarantine(reason) quarantines its whole test class (or module for
+tests outside classes) - a step of a ``step_chain`` scenario is never run without the other steps.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Generator, List, Tuple
+
+import pytest
+from _pytest.runner import runtestprotocol
+
+from utilities.page_affinity import PAGE_AFFINITY
+from utilities.plugins.durations import chain_scope, scope_of
+from utilities.plugins.step_chain import STEP_CHAINS
+
+CACHE_KEY = "flaky/stats"
+USER_PROPERTY = "retry"
+MARKER = "quarantine"
+MIN_RUNS = 5
+
+_Attempt = List[Tuple[pytest.Item, List[pytest.TestReport]]]
+
+
+def flake_rate(stats: Dict[str, int]) -> float:
+    """
+    Returns flake rate of a test.
+
+    :param stats: flake statistics of the test, i.e.: {"runs": 10, "flaky": 2, "failed": 1}
+    :return: ratio of flaky runs
+    """
+    return stats.get("flaky", 0) / stats["runs"] if stats.get("runs") else 0.0
+
+
+def quarantine_reason(item: pytest.Item, stats: Dict[str, Dict[str, int]], threshold: float) -> str | None:
+    """
+    Returns the reason why the test is quarantined.
+
+    :param item: test item
+    :param stats: dict['test nodeid'] = flake statistics
+    :param threshold: maximum flake rate of not quarantined test
+    :return: reason, None if the test is not quarantined
+    """
+    marker = item.get_closest_marker(MARKER)
+    if marker is not None:
+        return f"quarantined: {marker.args[0] if marker.args else 'marked'}"
+    test_stats = stats.get(item.nodeid, {})
+    if test_stats.get("runs", 0) >= MIN_RUNS and flake_rate(test_stats) > threshold:
+        return f"quarantined: {item.name} flake rate {flake_rate(test_stats):.0%} in {test_stats['runs']} runs"
+    return None
+
+
+def _failed(attempt: _Attempt) -> List[str]:
+    """
+    Returns failed tests of the attempt.
+
+    :param attempt: list of (test item, its reports)
+    :return: list of nodeids
+    """
+    return [item.nodeid for item, reports in attempt if any(report.failed for report in reports)]
+
+
+def _run(item: pytest.Item, nextitem: pytest.Item | None) -> List[pytest.TestReport]:
+    """
+    Runs the test without logging its reports. The class is torn down after the last test of the parameter set, but
+    session scoped fixtures are kept for a retry (they are torn down at the end of the session).
+
+    :param item: test item
+    :param nextitem: next test item of the parameter set (None for its last test)
+    :return: reports of setup, call and teardown
+    """
+    return runtestprotocol(item, log=False, nextitem=nextitem or item.session)  # type: ignore[arg-type]
+
+
+def _last(item: pytest.Item, nextitem: pytest.Item | None) -> bool:
+    """
+    Checks if the test is the last one of its parameter set.
+
+    :param item: test item
+    :param nextitem: next test item (None for the last test)
+    :return: True if the parameter set ends with the test
+    """
+    return nextitem is None or chain_scope(nextitem.nodeid) != chain_scope(item.nodeid)
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--retry-classes",
+        action="store",
+        type=int,
+        default=0,
+        help="run a parameter set of a test class with a failed test again (with a new browser), at most given "
+        "number of times; test classes with a quarantined test are deselected",
+    )
+    parser.addoption(
+        "--quarantine-lane",
+        action="store_true",
+        default=False,
+        help="run only test classes with a quarantined test, their failures are reported as xfail (non-blocking)",
+    )
+    parser.addoption(
+        "--flake-threshold",
+        action="store",
+        type=float,
+        default=0.2,
+        help="quarantine tests with higher flake rate (ratio of runs passed only after retry)",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Register the quarantine marker and hooks that retry test classes, if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    config.addinivalue_line(
+        "markers",
+        f"{MARKER}(reason): run the test only in the non-blocking quarantine lane (see: --quarantine-lane).",
+    )
+    retries = config.getoption("--retry-classes")
+    lane = config.getoption("--quarantine-lane")
+    if not retries and not lane:
+        return
+    if getattr(config, "cache", None) is None:
+        raise pytest.UsageError("--retry-classes and --quarantine-lane require pytest cache (cacheprovider plugin)")
+    config.pluginmanager.register(
+        _FlakyHooks(config.cache, retries, lane, config.getoption("--flake-threshold")), "flaky_hooks"
+    )
+
+
+class _FlakyHooks:
+    """
+    Hooks active only with --retry-classes or --quarantine-lane.
+    """
+
+    # pylint: disable=too-many-instance-attributes
+
+    def __init__(self, cache, retries: int, lane: bool, threshold: float) -> None:
+        """
+
+        :param cache: pytest cache object
+        :param retries: maximum number of retries of a test class
+        :param lane: True - run only quarantined test classes, False - deselect them
+        :param threshold: maximum flake rate of not quarantined test
+        """
+        self.cache = cache
+        self.retries = retries
+        self.lane = lane
+        self.threshold = threshold
+        self.quarantined: Dict[str, str] = {}  # dict['test class nodeid'] = reason
+        self.attempt: _Attempt = []
+        self.retrying = False
+        self.stats: Dict[str, Dict[str, int]] = {}
+
+    def pytest_collection_modifyitems(self, config, items) -> None:
+        """
+        Deselect test classes with a quarantined test (or all other tests in the quarantine lane).
+
+        :param config: pytest config object
+        :param items: list of test items
+        :return: None
+        """
+        stats = self.cache.get(CACHE_KEY, {})
+        for item in items:
+            reason = quarantine_reason(item, stats, self.threshold)
+            if reason is not None:
+                self.quarantined.setdefault(scope_of(item.nodeid), reason)
+        selected = [item for item in items if (scope_of(item.nodeid) in self.quarantined) == self.lane]
+        if len(selected) < len(items):
+            selected_ids = {id(item) for item in selected}
+            config.hook.pytest_deselected(items=[item for item in items if id(item) not in selected_ids])
+            items[:] = selected
+
+    @pytest.hookimpl(tryfirst=True)
+    def pytest_runtest_protocol(self, item, nextitem) -> bool:
+        """
+        Run the test without logging - its reports are kept in the attempt of the parameter set.
+
+        :param item: test item
+        :param nextitem: next test item (None for the last test)
+        :return: True (the test has been run)
+        """
+        self.attempt.append((item, _run(item, None if _last(item, nextitem) else nextitem)))
+        return True
+
+    @pytest.hookimpl(hookwrapper=True, tryfirst=True, specname="pytest_runtest_protocol")
+    def pytest_runtest_protocol_retry(self, item, nextitem) -> Generator[None]:
+        """
+        After the last test of the parameter set (and hook wrappers of other plugins around it), run the parameter set
+        again if a test failed, then log the last attempt.
+
+        :param item: test item
+        :param nextitem: next test item (None for the last test)
+        :return: None
+        """
+        yield
+        if self.retrying or not _last(item, nextitem):
+            return
+        flaky = set()
+        for _ in range(self.retries):
+            failed = _failed(self.attempt)
+            if not failed:
+                break
+            flaky.update(failed)
+            self._retry()
+        self._log(flaky)
+
+    def _retry(self) -> None:
+        """
+        Runs all tests of the parameter set again (on a new browser). Each test runs through its own
+        pytest_runtest_protocol call, so per-test hook wrappers of other plugins attribute its data to it.
+
+        :return: None
+        """
+        items = [item for item, _ in self.attempt]
+        PAGE_AFFINITY.release()  # driver of the failed attempt could be parked for the next class
+        STEP_CHAINS.reset(items[0])
+        self.attempt = []
+        self.retrying = True
+        try:
+            for item, next_item in zip(items, [*items[1:], None]):
+                item.ihook.pytest_runtest_protocol(item=item, nextitem=next_item)
+        finally:
+            self.retrying = False
+
+    def _log(self, flaky: set) -> None:
+        """
+        Logs reports of the last attempt with retry information (received by pytest-xdist controller as well).
+
+        :param flaky: nodeids of tests failed in previous attempts
+        :return: None
+        """
+        attempt, self.attempt = self.attempt, []
+        for item, reports in attempt:
+            failed = any(report.failed for report in reports)
+            reason = self.quarantined.get(scope_of(item.nodeid))
+            item.ihook.pytest_runtest_logstart(nodeid=item.nodeid, location=item.location)
+            for report in reports:
+                if reason is not None and self.lane and report.failed and report.when in ("setup", "call"):
+                    report.outcome = "skipped"
+                    report.wasxfail = reason  # type: ignore[attr-defined]
+                if report.when == "teardown":
+                    report.user_properties.append(
+                        (USER_PROPERTY, {"failed": failed, "flaky": item.nodeid in flaky and not failed})
+                    )
+                item.ihook.pytest_runtest_logreport(report=report)
+            item.ihook.pytest_runtest_logfinish(nodeid=item.nodeid, location=item.location)
+
+    def pytest_runtest_logreport(self, report) -> None:
+        """
+        Collect flake statistics of the test.
+
+        :param report: test phase report
+        :return: None
+        """
+        for name, value in report.user_properties:
+            if name == USER_PROPERTY:
+                stats = self.stats.setdefault(report.nodeid, {"runs": 0, "flaky": 0, "failed": 0})
+                stats["runs"] += 1
+                stats["flaky"] += value["flaky"]
+                stats["failed"] += value["failed"]
+
+    def pytest_sessionfinish(self, session) -> None:
+        """
+        Update flake statistics (only by the process that received all reports).
+
+        :param session: pytest session object
+        :return: None
+        """
+        if not self.stats or hasattr(session.config, "workerinput"):
+            return
+        stats: Dict[str, Any] = self.cache.get(CACHE_KEY, {})
+        for nodeid, test_stats in self.stats.items():
+            previous = stats.get(nodeid, {})
+            stats[nodeid] = {key: previous.get(key, 0) + value for key, value in test_stats.items()}
+        self.cache.set(CACHE_KEY, stats)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        """
+        Print flaky tests and quarantined test classes.
+
+        :param terminalreporter: terminal reporter object
+        :return: None
+        """
+        flaky = [nodeid for nodeid, stats in self.stats.items() if stats["flaky"]]
+        if not flaky and not self.quarantined:
+            return
+        terminalreporter.write_sep("=", "flaky tests")
+        for nodeid in flaky:
+            terminalreporter.write_line(f"passed after retry: {nodeid}")
+        for scope, reason in self.quarantined.items():
+            terminalreporter.write_line(f"{'run' if self.lane else 'deselected'} ({reason}): {scope}")
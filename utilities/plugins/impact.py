@@ -0,0 +1,323 @@
+"""
+Pytest plugin selecting only tests affected by changed files (test impact analysis), i.e.:
+    >> pytest --record-impact                 # full run on the main branch - records the impact map
+    >> pytest --changed-since origin/main     # pre-merge run - only tests affected by the changes
+
+With --record-impact framework modules (page objects with their locator classes, control objects and other utilities)
+executed by tests are recorded with sys.monitoring and saved in pytest cache (.pytest_cache has to be kept between
+runs). The map is recorded per test class and parameter set (scenario of ``step_chain`` steps) - modules executed by
+class fixtures and by any of its tests are credited to all of them. Code outside the framework is disabled after its
+first call, so the overhead is negligible.
+
+With --changed-since the changed files (``git diff`` against the reference, uncommitted and untracked files included)
+select whole test classes (parameter sets) that:
+    - executed a changed framework module,
+    - are defined in a changed test module or use a changed dataset file (see: ``dataset`` marker),
+    - have no record in the impact map (i.e.: new tests).
+Changes of plugins, conftest.py and pytest/project configuration select all tests.
+"""
+
+from __future__ import annotations
+
+import functools
+import os
+import subprocess
+import sys
+from types import CodeType
+from typing import Any, Dict, Generator, Iterable, List, Set
+
+import pytest
+
+from utilities.data_registry import DATA_REGISTRY
+from utilities.plugins.datasets import MARKER as DATASET_MARKER
+from utilities.plugins.durations import chain_scope
+
+CACHE_KEY = "impact/scopes"
+USER_PROPERTY = "impact"
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_FRAMEWORK_DIRS = ("pages/", "utilities/")
+_GLOBAL_FILES = ("conftest.py", "pytest.ini", "pyproject.toml", "requirements.txt", "utilities/plugins/")
+# Free sys.monitoring tool ids (timeline takes the first free one of 3 and 4)
+_TOOL_IDS = (5, 4)
+
+
+@functools.lru_cache(maxsize=None)
+def framework_module(filename: str) -> str | None:
+    """
+    Returns path of framework module relative to the project root (plugins are not recorded - they affect all tests).
+
+    :param filename: absolute path of the source file
+    :return: relative path, i.e.: "pages/green_kart_pages/green_kart_cart_page.py", None for other files
+    """
+    if not filename.startswith(_ROOT):
+        return None
+    path = os.path.relpath(filename, _ROOT).replace(os.sep, "/")
+    if path.startswith(_FRAMEWORK_DIRS) and not path.startswith(_GLOBAL_FILES):
+        return path
+    return None
+
+
+def changed_files(ref: str) -> Set[str]:
+    """
+    Returns files changed since the git reference (uncommitted and untracked files included).
+
+    :param ref: git reference, i.e.: "origin/main", "HEAD~3"
+    :return: set of paths relative to the project root
+    """
+    commands = (
+        ["git", "diff", "--name-only", "--relative", ref, "--"],
+        ["git", "ls-files", "--others", "--exclude-standard"],
+    )
+    files: Set[str] = set()
+    for command in commands:
+        result = subprocess.run(command, cwd=_ROOT, capture_output=True, text=True, check=False)
+        if result.returncode != 0:
+            raise pytest.UsageError(f"--changed-since: '{' '.join(command)}' failed:\n{result.stderr}")
+        files.update(line.strip() for line in result.stdout.splitlines() if line.strip())
+    return files
+
+
+def affected(items: List[pytest.Item], changed: Set[str], impact_map: Dict[str, List[str]]) -> List[pytest.Item]:
+    """
+    Returns tests affected by changed files - all tests of a class (parameter set) are selected together, so steps
+    of a scenario are never run without the previous ones.
+
+    :param items: test items
+    :param changed: changed files (relative to the project root)
+    :param impact_map: dict['test class nodeid with parameter set'] = list of executed framework modules
+    :return: affected test items
+    """
+    if any(path.startswith(_GLOBAL_FILES) for path in changed):
+        return list(items)
+    scopes = {
+        chain_scope(item.nodeid)
+        for item in items
+        if chain_scope(item.nodeid) not in impact_map or changed.intersection(_sources(item, impact_map))
+    }
+    return [item for item in items if chain_scope(item.nodeid) in scopes]
+
+
+def _sources(item: pytest.Item, impact_map: Dict[str, List[str]]) -> Iterable[str]:
+    """
+    Returns files the test depends on - framework modules executed by its class, test module and dataset files.
+
+    :param item: test item
+    :param impact_map: dict['test class nodeid with parameter set'] = list of executed framework modules
+    :return: paths relative to the project root
+    """
+    yield from impact_map.get(chain_scope(item.nodeid), ())
+    yield item.nodeid.split("::", 1)[0]
+    for marker in item.iter_markers(DATASET_MARKER):
+        yield os.path.relpath(DATA_REGISTRY.path(marker.args[0]), _ROOT).replace(os.sep, "/")
+
+
+class ImpactRecorder:
+    """
+    Records framework modules executed by a test.
+    """
+
+    # pylint does not know members of sys.monitoring either
+    # pylint: disable=no-member
+
+    def __init__(self) -> None:
+        self.modules: Set[str] = set()
+        self._tool_id: int | None = None
+        self._seen: Set[CodeType] = set()  # framework code objects already called in the running test
+
+    def start(self) -> None:
+        """
+        Starts recording.
+
+        :return: None
+        """
+        free_ids = [tool_id for tool_id in _TOOL_IDS if sys.monitoring.get_tool(tool_id) is None]
+        if not free_ids:
+            raise RuntimeError(f"No free sys.monitoring tool id (checked: {_TOOL_IDS})")
+        self._tool_id = free_ids[0]
+        sys.monitoring.use_tool_id(self._tool_id, "impact")
+        sys.monitoring.register_callback(self._tool_id, sys.monitoring.events.PY_START, self._on_start)
+        sys.monitoring.set_events(self._tool_id, sys.monitoring.events.PY_START)
+
+    def stop(self) -> None:
+        """
+        Stops recording.
+
+        :return: None
+        """
+        tool_id, self._tool_id = self._tool_id, None
+        if tool_id is not None:
+            sys.monitoring.set_events(tool_id, sys.monitoring.events.NO_EVENTS)
+            sys.monitoring.free_tool_id(tool_id)
+
+    def reset(self) -> Set[str]:
+        """
+        Starts recording of the next test.
+
+        :return: modules recorded since the previous reset
+        """
+        modules, self.modules = self.modules, set()
+        self._seen = set()
+        return modules
+
+    def _on_start(self, code: CodeType, offset: int) -> Any:  # pylint: disable=unused-argument
+        if code in self._seen:
+            return None
+        module = framework_module(code.co_filename)
+        if module is None:
+            # never re-enabled - sys.monitoring.restart_events() would re-enable code disabled by other tools too
+            return sys.monitoring.DISABLE
+        self._seen.add(code)
+        self.modules.add(module)
+        return None
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--record-impact",
+        action="store_true",
+        default=False,
+        help="record framework modules executed by each test into pytest cache (impact map for --changed-since)",
+    )
+    parser.addoption(
+        "--changed-since",
+        action="store",
+        default=None,
+        metavar="REF",
+        help="run only tests affected by files changed since the git reference, i.e.: origin/main",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Register hooks that record the impact map or select affected tests, if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    record = config.getoption("--record-impact")
+    ref = config.getoption("--changed-since")
+    if not record and ref is None:
+        return
+    if getattr(config, "cache", None) is None:
+        raise pytest.UsageError("--record-impact and --changed-since require pytest cache (cacheprovider plugin)")
+    config.pluginmanager.register(_ImpactHooks(config.cache, record, ref), "impact_hooks")
+
+
+class _ImpactHooks:
+    """
+    Hooks active only with --record-impact or --changed-since.
+    """
+
+    def __init__(self, cache, record: bool, ref: str | None) -> None:
+        """
+
+        :param cache: pytest cache object
+        :param record: True - record the impact map
+        :param ref: git reference of --changed-since, None - select all tests
+        """
+        self.cache = cache
+        self.ref = ref
+        self.recorder = ImpactRecorder() if record else None
+        self.recorded: Dict[str, List[str]] = {}
+        self.selected = ""
+
+    def pytest_collection_modifyitems(self, config, items) -> None:
+        """
+        Deselect tests not affected by files changed since --changed-since reference.
+
+        :param config: pytest config object
+        :param items: list of test items
+        :return: None
+        """
+        if self.ref is None:
+            return
+        changed = changed_files(self.ref)
+        selected = affected(items, changed, self.cache.get(CACHE_KEY, {}))
+        selected_ids = {id(item) for item in selected}
+        deselected = [item for item in items if id(item) not in selected_ids]
+        if deselected:
+            config.hook.pytest_deselected(items=deselected)
+            items[:] = selected
+        total = len(selected) + len(deselected)
+        self.selected = f"{len(selected)} of {total} tests affected (changed files: {len(changed)})"
+
+    def pytest_sessionstart(self) -> None:
+        """
+        Start recording.
+
+        :return: None
+        """
+        if self.recorder is not None:
+            self.recorder.start()
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item) -> Generator[None]:  # pylint: disable=unused-argument
+        """
+        Record modules executed by the test (setup and teardown included).
+
+        :param item: test item
+        :return: None
+        """
+        if self.recorder is not None:
+            self.recorder.reset()
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call) -> Generator[None]:
+        """
+        Attach recorded modules to the teardown report, so pytest-xdist workers send them to the controller.
+
+        :param item: test item
+        :param call: call info of the test phase
+        :return: None
+        """
+        if self.recorder is not None and call.when == "teardown":
+            item.user_properties.append((USER_PROPERTY, sorted(self.recorder.reset())))
+        yield
+
+    def pytest_runtest_logreport(self, report) -> None:
+        """
+        Collect recorded modules of the test into its class (parameter set).
+
+        :param report: test phase report
+        :return: None
+        """
+        for name, modules in report.user_properties:
+            if name == USER_PROPERTY:
+                scope = self.recorded.setdefault(chain_scope(report.nodeid), [])
+                scope.extend(module for module in modules if module not in scope)
+
+    def pytest_sessionfinish(self, session) -> None:
+        """
+        Stop recording and update the impact map (only by the process that received all reports).
+
+        :param session: pytest session object
+        :return: None
+        """
+        if self.recorder is not None:
+            self.recorder.stop()
+        if self.recorded and not hasattr(session.config, "workerinput"):
+            # merged with the previous record - a partial run (i.e.: -k) must not drop modules of skipped tests
+            impact_map = self.cache.get(CACHE_KEY, {})
+            for scope, modules in self.recorded.items():
+                impact_map[scope] = sorted({*impact_map.get(scope, ()), *modules})
+            self.cache.set(CACHE_KEY, impact_map)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        """
+        Print selection and recording summary.
+
+        :param terminalreporter: terminal reporter object
+        :return: None
+        """
+        if self.selected:
+            terminalreporter.write_line(f"Changed since {self.ref}: {self.selected}")
+        if self.recorded:
+            terminalreporter.write_line(f"Impact map updated: {len(self.recorded)} test classes")
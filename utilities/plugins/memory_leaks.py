@@ -0,0 +1,235 @@
+"""
+Pytest plugin detecting memory growth across test classes, i.e.:
+    >> pytest --memory-leaks --memory-leak-threshold 5
+
+Python memory is traced with tracemalloc - snapshots are taken before the first test of each class and after teardown
+of its last test (class scoped fixtures included). Browser memory is read with Chrome DevTools Protocol
+(Performance.getMetrics) after setup of the first test and before teardown of the last one (Chromium browsers only).
+
+Classes are listed in the session summary with top allocation sites that grew. Teardown of the last test of the class
+fails when Python memory or browser JS heap grew more than the threshold.
+"""
+
+from __future__ import annotations
+
+import gc
+import os
+import tracemalloc
+from typing import Any, Dict, Generator, List, NamedTuple
+
+import pytest
+from selenium.common import WebDriverException
+from selenium.webdriver.chromium.webdriver import ChromiumDriver
+
+MIB = 1024 * 1024
+TOP_SITES = 10
+BROWSER_METRICS = ("JSHeapUsedSize", "JSHeapTotalSize", "Nodes", "JSEventListeners", "Documents")
+
+_PLUGINS_DIR = os.path.dirname(os.path.abspath(__file__))
+# Allocations of tracemalloc itself, imports, pytest bookkeeping (reports, stats) and framework plugins are expected
+_FILTERS = (
+    tracemalloc.Filter(False, tracemalloc.__file__),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap>"),
+    tracemalloc.Filter(False, "<frozen importlib._bootstrap_external>"),
+    tracemalloc.Filter(False, "<unknown>"),
+    tracemalloc.Filter(False, os.path.join("*", "_pytest", "*")),
+    tracemalloc.Filter(False, os.path.join("*", "pluggy", "*")),
+    tracemalloc.Filter(False, os.path.join(_PLUGINS_DIR, "*")),
+)
+
+
+class ClassMemory(NamedTuple):
+    """
+    Memory growth of a test class.
+    """
+
+    nodeid: str
+    python_growth: int
+    top_sites: List[tracemalloc.StatisticDiff]
+    browser_growth: Dict[str, float]
+
+
+def browser_metrics(item: pytest.Item) -> Dict[str, float]:
+    """
+    Reads browser memory metrics of the driver used by the test (Chromium browsers only).
+
+    :param item: test item
+    :return: dict['metric name'] = value, empty dict if not available
+    """
+    driver = getattr(item.funcargs.get("browser_instance"), "driver", None)  # type: ignore[attr-defined]
+    if not isinstance(driver, ChromiumDriver):  # remote WebDriver defines execute_cdp_cmd() for every browser
+        return {}
+    try:
+        driver.execute_cdp_cmd("Performance.enable", {})
+        metrics = driver.execute_cdp_cmd("Performance.getMetrics", {})["metrics"]
+    except WebDriverException:
+        return {}
+    return {metric["name"]: metric["value"] for metric in metrics if metric["name"] in BROWSER_METRICS}
+
+
+def _group(item: pytest.Item) -> str:
+    """
+    Returns nodeid of test class (or module for tests outside classes) of the test.
+
+    :param item: test item
+    :return: nodeid
+    """
+    parent = item.getparent(pytest.Class) or item.getparent(pytest.Module)
+    return parent.nodeid if parent is not None else item.nodeid
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--memory-leaks",
+        action="store_true",
+        default=False,
+        help="trace Python (tracemalloc) and browser (Performance.getMetrics) memory growth across test classes",
+    )
+    parser.addoption(
+        "--memory-leak-threshold",
+        action="store",
+        type=float,
+        default=10.0,
+        help="fail test class if Python memory or browser JS heap grew more than given value in [MiB]",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Start tracing and register hooks that take snapshots, if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    if not config.getoption("--memory-leaks"):
+        return
+    tracemalloc.start()
+    config.pluginmanager.register(_MemoryLeakHooks(config.getoption("--memory-leak-threshold")), "memory_leaks_hooks")
+
+
+class _MemoryLeakHooks:
+    """
+    Hooks active only with --memory-leaks.
+    """
+
+    def __init__(self, threshold_mib: float) -> None:
+        """
+
+        :param threshold_mib: allowed memory growth of test class in [MiB]
+        """
+        self.threshold = threshold_mib * MIB
+        self.group = ""
+        self.last_in_group = False
+        self.snapshot: tracemalloc.Snapshot | None = None
+        self.browser_before: Dict[str, float] = {}
+        self.browser_after: Dict[str, float] = {}
+        self.results: List[ClassMemory] = []
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem) -> Generator[None]:
+        """
+        Take Python memory snapshot before the first test of the class.
+
+        :param item: test item
+        :param nextitem: next test item (None for the last test)
+        :return: None
+        """
+        group = _group(item)
+        if group != self.group:
+            self.group = group
+            self.browser_before, self.browser_after = {}, {}
+            gc.collect()
+            self.snapshot = tracemalloc.take_snapshot()
+        self.last_in_group = nextitem is None or _group(nextitem) != group
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_teardown(self, item) -> Generator[None]:
+        """
+        Read browser metrics before teardown of the last test of the class (the browser is still open).
+
+        :param item: test item
+        :return: None
+        """
+        if self.last_in_group:
+            self.browser_after = browser_metrics(item)
+        yield
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_makereport(self, item, call) -> Generator[None, Any, None]:
+        """
+        Read browser metrics after setup of the first test and compare memory after teardown of the last one.
+
+        :param item: test item
+        :param call: call info of the test phase
+        :return: None
+        """
+        outcome = yield
+        report = outcome.get_result()
+        if call.when == "setup" and not self.browser_before:
+            self.browser_before = browser_metrics(item)
+        if call.when != "teardown" or not self.last_in_group:
+            return
+        result = self._compare()
+        self.results.append(result)
+        if report.passed and self._exceeded(result):
+            report.outcome = "failed"
+            report.longrepr = "\n".join(_describe(result))
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        """
+        Print memory growth of test classes.
+
+        :param terminalreporter: terminal reporter object
+        :return: None
+        """
+        terminalreporter.write_sep("=", f"memory growth of test classes (threshold: {self.threshold / MIB:.1f} MiB)")
+        for result in sorted(self.results, key=lambda result: -result.python_growth):
+            for line in _describe(result):
+                terminalreporter.write_line(line)
+
+    def _compare(self) -> ClassMemory:
+        gc.collect()
+        stats = (
+            tracemalloc.take_snapshot()
+            .filter_traces(_FILTERS)
+            .compare_to(
+                self.snapshot.filter_traces(_FILTERS),  # type: ignore[union-attr]
+                "lineno",
+            )
+        )
+        grown = [stat for stat in stats if stat.size_diff > 0][:TOP_SITES]
+        browser_growth = {
+            name: value - self.browser_before[name]
+            for name, value in self.browser_after.items()
+            if name in self.browser_before
+        }
+        return ClassMemory(self.group, sum(stat.size_diff for stat in stats), grown, browser_growth)
+
+    def _exceeded(self, result: ClassMemory) -> bool:
+        return result.python_growth > self.threshold or result.browser_growth.get("JSHeapUsedSize", 0) > self.threshold
+
+
+def _describe(result: ClassMemory) -> List[str]:
+    """
+    Describes memory growth of test class.
+
+    :param result: memory growth of test class
+    :return: list of lines
+    """
+    lines = [f"{result.nodeid}: Python memory grew by {result.python_growth / MIB:.2f} MiB"]
+    if result.browser_growth:
+        browser = ", ".join(f"{name} {value:+,.0f}" for name, value in result.browser_growth.items())
+        lines.append(f"    browser: {browser}")
+    for stat in result.top_sites:
+        frame = stat.traceback[0]
+        lines.append(
+            f"    {stat.size_diff / 1024:>10.1f} KiB {stat.count_diff:>+8} blocks  {frame.filename}:{frame.lineno}"
+        )
+    return lines
@@ -0,0 +1,81 @@
+"""
+Pytest plugin recording Navigation Timing and Resource Timing data for every page navigation, i.e.:
+    >> pytest --navigation-timing
+
+Each BasePage.go_to() (full document load or SPA route change) is attached to the running test as a user property
+("navigation_timing") and aggregated per page class in a session summary. The summary is also saved as JSON, so load
+budgets of pages can be compared between runs.
+"""
+
+from __future__ import annotations
+
+import json
+import os
+from typing import Generator
+
+import pytest
+
+from utilities.navigation_timing import NAVIGATION_TIMING, SUMMARY_FIELDS
+
+NAVIGATION_TIMING_FILE_PATH = "reports/navigation-timing.json"
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--navigation-timing",
+        action="store_true",
+        default=False,
+        help="record Navigation Timing and Resource Timing data for every page navigation",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Enable recording if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    NAVIGATION_TIMING.enabled = config.getoption("--navigation-timing")
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item) -> Generator[None]:
+    """
+    Attach navigations to the running test (including its setup and teardown).
+
+    :param item: test item
+    :return: None
+    """
+    NAVIGATION_TIMING.user_properties = item.user_properties
+    yield
+    NAVIGATION_TIMING.user_properties = None
+
+
+def pytest_terminal_summary(terminalreporter) -> None:
+    """
+    Print and save navigation timings aggregated per page class.
+
+    :param terminalreporter: terminal reporter object
+    :return: None
+    """
+    if not NAVIGATION_TIMING.enabled or not NAVIGATION_TIMING.timings:
+        return
+    summary = NAVIGATION_TIMING.summary()
+    terminalreporter.write_sep("=", "navigation timing (median values in [ms])")
+    header = "".join(f"{field:>20}" for field in ("navigations",) + SUMMARY_FIELDS)
+    terminalreporter.write_line(f"{'page':<30}{header}")
+    for page_name, page_summary in summary.items():
+        row = "".join(f"{page_summary.get(field, '-'):>20}" for field in ("navigations",) + SUMMARY_FIELDS)
+        terminalreporter.write_line(f"{page_name:<30}{row}")
+
+    os.makedirs(os.path.dirname(NAVIGATION_TIMING_FILE_PATH), exist_ok=True)
+    with open(NAVIGATION_TIMING_FILE_PATH, "w", encoding="utf-8") as timing_file:
+        json.dump({"summary": summary, "navigations": NAVIGATION_TIMING.timings}, timing_file, indent=2)
+    terminalreporter.write_line(f"Navigation timings saved: {NAVIGATION_TIMING_FILE_PATH}")
@@ -0,0 +1,140 @@
+"""
+Pytest plugin ordering test classes by the page they use and reusing the browser between them, i.e.:
+    >> pytest --page-affinity
+
+    >> @pytest.mark.page(AutomationPracticePage, read_only=True)
+    >> class TestLabel:
+
+(``read_only`` has to be passed explicitly - pytest applies a marker called with a single class argument to the class)
+
+Test classes using the same page (declared by the ``page`` marker or recorded by BasePage.go_to() in previous runs)
+are run one after another, read-only ones first. Read-only class does not change the state of the page, so its driver
+is handed over to the next class on the same page - the next class neither starts a new browser nor loads the page
+again (its first go_to() of the already loaded page is skipped).
+"""
+
+from __future__ import annotations
+
+from typing import Dict, Generator, List, Tuple
+
+import pytest
+
+from utilities.page_affinity import PAGE_AFFINITY
+from utilities.plugins.durations import scope_of
+
+MARKER = "page"
+CACHE_KEY = "page_affinity/pages"
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--page-affinity",
+        action="store_true",
+        default=False,
+        help="group test classes by page and reuse the browser after read-only classes (see: 'page' marker)",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Register the page marker and hooks that order tests and hand drivers over, if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    config.addinivalue_line(
+        "markers",
+        f"{MARKER}(page, read_only): page object class (or URL) the test class uses; read-only classes hand "
+        "their browser over to the next class on the same page (see: --page-affinity).",
+    )
+    PAGE_AFFINITY.enabled = config.getoption("--page-affinity")
+    if PAGE_AFFINITY.enabled:
+        cache = getattr(config, "cache", None)
+        recorded = cache.get(CACHE_KEY, {}) if cache is not None else {}
+        config.pluginmanager.register(_PageAffinityHooks(recorded), "page_affinity_hooks")
+
+
+class _PageAffinityHooks:
+    """
+    Hooks active only with --page-affinity.
+    """
+
+    def __init__(self, recorded: Dict[str, str]) -> None:
+        """
+
+        :param recorded: dict['test class nodeid'] = page object name recorded in previous runs
+        """
+        self.recorded = recorded
+
+    def page_of(self, item: pytest.Item) -> Tuple[str | None, bool]:
+        """
+        Returns page used by the test - declared by the marker or recorded in previous runs.
+
+        :param item: test item
+        :return: (page object name or URL - None if unknown, True if the test is read-only)
+        """
+        marker = item.get_closest_marker(MARKER)
+        if marker is None:
+            return self.recorded.get(scope_of(item.nodeid)), False
+        page = marker.args[0]
+        return page if isinstance(page, str) else page.__name__, marker.kwargs.get("read_only", False)
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_collection_modifyitems(self, items) -> Generator[None]:
+        """
+        Group test classes by page, read-only ones first (after all other reordering, i.e.: --longest-first, so
+        each group starts at the position of its first class).
+
+        :param items: list of test items
+        :return: None
+        """
+        yield
+        scopes: Dict[str, List[pytest.Item]] = {}
+        for item in items:
+            scopes.setdefault(scope_of(item.nodeid), []).append(item)
+        groups: Dict[str, List[List[pytest.Item]]] = {}
+        for scope, scope_items in scopes.items():
+            page, _ = self.page_of(scope_items[0])
+            groups.setdefault(scope if page is None else page, []).append(scope_items)
+        items[:] = [
+            item
+            for group in groups.values()
+            for scope_items in sorted(group, key=lambda scope_items: not all(self.page_of(i)[1] for i in scope_items))
+            for item in scope_items
+        ]
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item, nextitem) -> Generator[None]:
+        """
+        Decide if the driver of the test class is handed over to the next test class.
+
+        :param item: test item
+        :param nextitem: next test item (None for the last test)
+        :return: None
+        """
+        scope = scope_of(item.nodeid)
+        successor = ""
+        if nextitem is not None and scope_of(nextitem.nodeid) != scope:
+            page, read_only = self.page_of(item)
+            if read_only and page is not None and self.page_of(nextitem)[0] == page:
+                successor = scope_of(nextitem.nodeid)
+        PAGE_AFFINITY.start(scope, successor)
+        yield
+
+    def pytest_sessionfinish(self, session) -> None:
+        """
+        Quit parked driver and save pages visited by test classes for the next runs.
+
+        :param session: pytest session object
+        :return: None
+        """
+        PAGE_AFFINITY.release()
+        cache = getattr(session.config, "cache", None)
+        if cache is not None and PAGE_AFFINITY.visited:
+            cache.set(CACHE_KEY, {**cache.get(CACHE_KEY, {}), **PAGE_AFFINITY.visited})
@@ -0,0 +1,140 @@
+"""
+Pytest plugin profiling the Python side of each test with cProfile, i.e.:
+    >> pytest --profile-tests
+
+Each test (setup, call and teardown) is saved as a separate pstats file in reports/profiles/, i.e. to inspect with:
+    >> python -m pstats reports/profiles/<test>.pstats
+    >> snakeviz reports/profiles/session.pstats
+
+At the end of the session all files are merged into session.pstats and framework functions (pages/ and utilities/)
+are ranked by cumulative time.
+"""
+
+from __future__ import annotations
+
+import cProfile
+import glob
+import hashlib
+import os
+import pstats
+import re
+from typing import Generator, List, Tuple
+
+import pytest
+
+PROFILES_DIR = "reports/profiles"
+SESSION_PROFILE = "session.pstats"
+TOP_FUNCTIONS = 25
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+_FRAMEWORK_DIRS = (os.path.join(_ROOT, "pages", ""), os.path.join(_ROOT, "utilities", ""))
+_EXCLUDED = os.path.join(_ROOT, "utilities", "plugins", "")
+
+
+def profile_path(directory: str, nodeid: str) -> str:
+    """
+    Returns path of pstats file for the test.
+
+    :param directory: profiles directory
+    :param nodeid: test nodeid
+    :return: file path, i.e.: "reports/profiles/tests_test_page.py_TestPage_test_go_to-1a2b3c4d.pstats"
+    """
+    name = re.sub(r"[^\w.-]+", "_", nodeid)[-150:]
+    digest = hashlib.md5(nodeid.encode("utf-8"), usedforsecurity=False).hexdigest()[:8]
+    return os.path.join(directory, f"{name}-{digest}.pstats")
+
+
+def rank_framework_functions(stats: pstats.Stats, top: int) -> List[Tuple[str, int, float, float]]:
+    """
+    Ranks framework functions by cumulative time.
+
+    :param stats: profiling statistics
+    :param top: number of functions to return
+    :return: list of (function, number of calls, total time, cumulative time), times in [s]
+    """
+    functions = []
+    for (filename, line, name), (_, calls, total, cumulative, _) in stats.stats.items():  # type: ignore[attr-defined]
+        if filename.startswith(_FRAMEWORK_DIRS) and not filename.startswith(_EXCLUDED):
+            location = f"{os.path.relpath(filename, _ROOT)}:{line}({name})"
+            functions.append((location, calls, total, cumulative))
+    return sorted(functions, key=lambda function: -function[3])[:top]
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--profile-tests",
+        action="store_true",
+        default=False,
+        help=f"profile each test with cProfile and save pstats files to {PROFILES_DIR}",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Prepare profiles directory and register hooks that profile tests, if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    if not config.getoption("--profile-tests"):
+        return
+    if not hasattr(config, "workerinput"):  # profiles of the previous session (pytest-xdist workers share the dir)
+        os.makedirs(PROFILES_DIR, exist_ok=True)
+        for path in glob.glob(os.path.join(PROFILES_DIR, "*.pstats")):
+            os.remove(path)
+    if hasattr(config, "workerinput") or not getattr(config.option, "numprocesses", None):
+        config.pluginmanager.register(_ProfilingHooks(), "profiling_hooks")
+
+
+class _ProfilingHooks:
+    """
+    Hooks active only with --profile-tests (in the process that runs tests).
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item) -> Generator[None]:
+        """
+        Profile the test (including its setup and teardown).
+
+        :param item: test item
+        :return: None
+        """
+        profiler = cProfile.Profile()
+        profiler.enable()
+        try:
+            yield
+        finally:
+            profiler.disable()
+            profiler.dump_stats(profile_path(PROFILES_DIR, item.nodeid))
+
+
+def pytest_terminal_summary(terminalreporter, config) -> None:
+    """
+    Merge profiles of all tests and print framework functions with the highest cumulative time.
+
+    :param terminalreporter: terminal reporter object
+    :param config: pytest config object
+    :return: None
+    """
+    if not config.getoption("--profile-tests"):
+        return
+    paths = glob.glob(os.path.join(PROFILES_DIR, "*.pstats"))
+    paths = [path for path in paths if os.path.basename(path) != SESSION_PROFILE]
+    if not paths:
+        return
+    stats = pstats.Stats(*paths)
+    stats.dump_stats(os.path.join(PROFILES_DIR, SESSION_PROFILE))
+
+    terminalreporter.write_sep("=", f"framework functions by cumulative time ({len(paths)} tests)")
+    terminalreporter.write_line(f"{'ncalls':>10}{'tottime':>12}{'cumtime':>12}  function")
+    for location, calls, total, cumulative in rank_framework_functions(stats, TOP_FUNCTIONS):
+        terminalreporter.write_line(f"{calls:>10}{total:>12.3f}{cumulative:>12.3f}  {location}")
+    terminalreporter.write_line(f"Profiles saved: {PROFILES_DIR}")
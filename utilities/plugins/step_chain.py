@@ -0,0 +1,113 @@
+"""
+Pytest plugin skipping the remaining steps of a test class as soon as one step fails, i.e.:
+    >> @pytest.mark.step_chain
+    >> class TestGreenKartShopOrderBasic:
+    >>     def test_go_to_page(self, test_data):
+    >>     def test_add_product_to_cart(self, test_data):
+
+Tests of the class are steps of one scenario - a step depending on a failed one would only wait for implicit and
+explicit timeouts of elements that never appear. Remaining steps are skipped before their setup, with the failed step
+as the reason. Each parameter set of a parametrized class (i.e.: each dataset row) is a separate chain.
+"""
+
+from __future__ import annotations
+
+from typing import Any, Dict, Generator, Tuple
+
+import pytest
+
+MARKER = "step_chain"
+
+
+class StepChains:
+    """
+    Failed steps of step chains.
+    """
+
+    def __init__(self) -> None:
+        self.failed: Dict[Tuple[str, Tuple[int, ...]], str] = {}
+
+    @staticmethod
+    def chain_of(item: pytest.Item) -> Tuple[str, Tuple[int, ...]]:
+        """
+        Returns chain of the step - test class and parameter set.
+
+        :param item: test item
+        :return: (test class nodeid, indices of parameters)
+        """
+        indices = tuple(item.callspec.indices.values()) if hasattr(item, "callspec") else ()
+        return item.nodeid.rsplit("::", 1)[0], indices
+
+    def record(self, item: pytest.Item) -> None:
+        """
+        Records failed step (only the first failure of the chain is kept).
+
+        :param item: test item
+        :return: None
+        """
+        self.failed.setdefault(self.chain_of(item), item.name)
+
+    def reset(self, item: pytest.Item) -> None:
+        """
+        Forgets failed step of the chain of the test (i.e.: before the chain is run again).
+
+        :param item: test item
+        :return: None
+        """
+        self.failed.pop(self.chain_of(item), None)
+
+    def failed_step(self, item: pytest.Item) -> str | None:
+        """
+        Returns failed step of the chain of the test.
+
+        :param item: test item
+        :return: name of the failed step, None if no step of the chain failed
+        """
+        return self.failed.get(self.chain_of(item))
+
+
+STEP_CHAINS = StepChains()
+
+
+def pytest_configure(config) -> None:
+    """
+    Register the step_chain marker.
+
+    :param config: pytest config object
+    :return: None
+    """
+    config.addinivalue_line(
+        "markers",
+        f"{MARKER}: tests of the class are ordered steps - the remaining ones are skipped when a step fails.",
+    )
+
+
+@pytest.hookimpl(tryfirst=True)
+def pytest_runtest_setup(item) -> None:
+    """
+    Skip the step if a previous step of its chain failed (before setup of fixtures).
+
+    :param item: test item
+    :return: None
+    """
+    if item.get_closest_marker(MARKER) is None:
+        return
+    failed_step = STEP_CHAINS.failed_step(item)
+    if failed_step is not None:
+        pytest.skip(f"dependent failure: previous step '{failed_step}' failed")
+
+
+@pytest.hookimpl(hookwrapper=True, tryfirst=True)
+def pytest_runtest_makereport(item, call) -> Generator[None, Any, None]:
+    """
+    Record failed step (setup or call phase - failed teardown does not break the scenario). The outermost wrapper, so
+    failures set by other plugins (i.e.: exceeded command budget) are seen as well.
+
+    :param item: test item
+    :param call: call info of the test phase
+    :return: None
+    """
+    outcome = yield
+    report = outcome.get_result()
+    if report.failed and call.when in ("setup", "call") and item.get_closest_marker(MARKER) is not None:
+        STEP_CHAINS.record(item)
@@ -0,0 +1,58 @@
+"""
+Pytest plugin switching the framework log file to structured JSON Lines format, i.e.:
+    >> pytest --structured-logs
+
+Each record carries nodeid of the running test. Control actions carry locator, action name, its duration and the page
+object owning the control. Use utilities/log_analyzer.py to summarize the log:
+    >> python -m utilities.log_analyzer reports/logger-logs.jsonl
+"""
+
+from typing import Generator
+
+import pytest
+
+from utilities.logger import LOG_CONTEXT, STRUCTURED_LOGGER_FILE_PATH, enable_structured_logs, set_log_context
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--structured-logs",
+        action="store_true",
+        default=False,
+        help=f"write framework logs in JSON Lines format to {STRUCTURED_LOGGER_FILE_PATH}",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Switch the log file format if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    if config.getoption("--structured-logs"):
+        enable_structured_logs()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item) -> Generator[None]:
+    """
+    Correlate records with the running test (including its setup and teardown).
+
+    :param item: test item
+    :return: None
+    """
+    if not item.config.getoption("--structured-logs"):
+        yield
+        return
+    set_log_context(nodeid=item.nodeid)
+    try:
+        yield
+    finally:
+        LOG_CONTEXT.clear()
@@ -0,0 +1,317 @@
+"""
+Pytest plugin exporting a session timeline in Chrome trace-event format, i.e.:
+    >> pytest --trace-out reports/timeline.json
+
+Open the file in https://ui.perfetto.dev or chrome://tracing. Nested spans show test phases, fixture setup, page object
+methods, control actions, explicit waits (WebDriverWait.until) and individual WebDriver commands.
+
+Python spans are recorded with sys.monitoring - code outside pages/ and utilities/ is disabled after its first call, so
+the overhead of other code (pytest, Selenium internals) is negligible.
+"""
+
+from __future__ import annotations
+
+import functools
+import inspect
+import json
+import os
+import sys
+import threading
+import time
+from types import CodeType
+from typing import Any, Dict, Generator, List, Tuple
+
+import pytest
+
+from utilities.webdriver_tracer import COMMAND_TRACER, CommandEvent
+
+_ROOT = os.path.dirname(os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+# Source directories (checked in order) and categories of their spans
+_CATEGORIES = (
+    (os.path.join(_ROOT, "pages", ""), "page"),
+    (os.path.join(_ROOT, "utilities", "control_objects", ""), "control"),
+    (os.path.join(_ROOT, "utilities", ""), "framework"),
+)
+_EXCLUDED = (os.path.join(_ROOT, "utilities", "plugins", ""), os.path.join(_ROOT, "utilities", "logger.py"))
+_SELENIUM_WAIT = os.path.join("selenium", "webdriver", "support", "wait.py")
+_SELENIUM_WAIT_METHODS = ("until", "until_not")
+# Free sys.monitoring tool ids (cProfile uses PROFILER_ID, coverage uses COVERAGE_ID)
+_TOOL_IDS = (3, 4)
+# pylint does not know code flags of inspect module
+_OPTIMIZED_FLAG = inspect.CO_OPTIMIZED  # pylint: disable=no-member
+_SKIPPED_FLAGS = inspect.CO_GENERATOR | inspect.CO_COROUTINE | inspect.CO_ASYNC_GENERATOR  # pylint: disable=no-member
+
+
+@functools.lru_cache(maxsize=None)
+def _categorize(code: CodeType) -> str | None:
+    """
+    Decides if calls of the code object are recorded.
+
+    Module and class bodies, generators (their spans would be split by each yield), comprehensions, lambdas, local
+    functions (decorator wrappers) and dunder methods other than __init__ are skipped.
+
+    :param code: code object
+    :return: span category or None if not recorded
+    """
+    if not code.co_flags & _OPTIMIZED_FLAG or code.co_flags & _SKIPPED_FLAGS:
+        return None
+    name = code.co_name
+    if name.startswith("<") or "<locals>" in code.co_qualname or (name.startswith("__") and name != "__init__"):
+        return None
+    if code.co_filename.endswith(_SELENIUM_WAIT):
+        return "wait" if code.co_name in _SELENIUM_WAIT_METHODS else None
+    if code.co_filename.startswith(_EXCLUDED):
+        return None
+    for directory, category in _CATEGORIES:
+        if code.co_filename.startswith(directory):
+            return category
+    return None
+
+
+class TimelineRecorder:
+    """
+    Collects complete ("X") trace events of the thread running the tests. Calls in other threads (i.e.: log queue
+    listener, Selenium and urllib3 threads) are ignored, so their starts and returns are never paired with the ones of
+    the tests.
+    """
+
+    # pylint does not know members of sys.monitoring either
+    # pylint: disable=no-member,too-many-instance-attributes
+
+    def __init__(self) -> None:
+        self.events: List[Dict[str, Any]] = []
+        self._stack: List[Tuple[CodeType, float]] = []
+        self._origin = time.perf_counter()
+        self._wall_origin = time.time()
+        self._pid = os.getpid()
+        self._thread = threading.get_ident()
+        self._tid = threading.get_native_id()
+        self._tool_id: int | None = None
+
+    def span(self, name: str, category: str, start: float, duration: float, **args: Any) -> None:
+        """
+        Adds a span.
+
+        :param name: span name, i.e.: "_BaseControl.click"
+        :param category: span category, i.e.: "control"
+        :param start: time.perf_counter() value at the beginning of the span
+        :param duration: span duration in [s]
+        :param args: additional data shown with the span
+        :return: None
+        """
+        event = {
+            "name": name,
+            "cat": category,
+            "ph": "X",
+            "ts": round((start - self._origin) * 1e6, 3),
+            "dur": round(duration * 1e6, 3),
+            "pid": self._pid,
+            "tid": self._tid,
+        }
+        if args:
+            event["args"] = args
+        self.events.append(event)
+
+    def to_perf_counter(self, timestamp: float) -> float:
+        """
+        Converts time.time() value to time.perf_counter() value.
+
+        :param timestamp: time.time() value
+        :return: time.perf_counter() value
+        """
+        return timestamp - self._wall_origin + self._origin
+
+    def on_command(self, event: CommandEvent) -> None:
+        """
+        Listener of CommandTracer - adds span of WebDriver command.
+
+        :param event: recorded WebDriver command
+        :return: None
+        """
+        self.span(event.command, "webdriver", event.start, event.duration, issuer=event.issuer)
+
+    def start(self) -> None:
+        """
+        Starts recording Python spans.
+
+        :return: None
+        """
+        free_ids = [tool_id for tool_id in _TOOL_IDS if sys.monitoring.get_tool(tool_id) is None]
+        if not free_ids:
+            raise RuntimeError(f"No free sys.monitoring tool id (checked: {_TOOL_IDS})")
+        self._tool_id = free_ids[0]
+        self._thread = threading.get_ident()
+        self._tid = threading.get_native_id()
+        sys.monitoring.use_tool_id(self._tool_id, "timeline")
+        sys.monitoring.register_callback(self._tool_id, sys.monitoring.events.PY_START, self._on_start)
+        sys.monitoring.register_callback(self._tool_id, sys.monitoring.events.PY_RETURN, self._on_return)
+        sys.monitoring.register_callback(self._tool_id, sys.monitoring.events.PY_UNWIND, self._on_unwind)
+        sys.monitoring.set_events(
+            self._tool_id,
+            sys.monitoring.events.PY_START | sys.monitoring.events.PY_RETURN | sys.monitoring.events.PY_UNWIND,
+        )
+
+    def stop(self) -> None:
+        """
+        Stops recording Python spans.
+
+        :return: None
+        """
+        if self._tool_id is None:
+            return
+        sys.monitoring.set_events(self._tool_id, sys.monitoring.events.NO_EVENTS)
+        sys.monitoring.free_tool_id(self._tool_id)
+        self._tool_id = None
+
+    def save(self, path: str) -> None:
+        """
+        Writes trace-event JSON file.
+
+        :param path: output file path
+        :return: None
+        """
+        metadata = [
+            {"name": "process_name", "ph": "M", "pid": self._pid, "args": {"name": "pytest"}},
+            {"name": "thread_name", "ph": "M", "pid": self._pid, "tid": self._tid, "args": {"name": "tests"}},
+        ]
+        os.makedirs(os.path.dirname(path) or ".", exist_ok=True)
+        with open(path, "w", encoding="utf-8") as trace_file:
+            json.dump({"traceEvents": metadata + self.events, "displayTimeUnit": "ms"}, trace_file)
+
+    # pylint: disable=unused-argument
+
+    def _on_start(self, code: CodeType, instruction_offset: int) -> object:
+        if _categorize(code) is None:
+            return sys.monitoring.DISABLE
+        # DISABLE would switch the code object off in all threads
+        if threading.get_ident() != self._thread:
+            return None
+        self._stack.append((code, time.perf_counter()))
+        return None
+
+    def _on_return(self, code: CodeType, instruction_offset: int, retval: object) -> object:
+        category = _categorize(code)
+        if category is None:
+            return sys.monitoring.DISABLE
+        if threading.get_ident() == self._thread:
+            self._close(code, category)
+        return None
+
+    def _on_unwind(self, code: CodeType, instruction_offset: int, exception: BaseException) -> None:
+        # PY_UNWIND cannot be disabled per code object
+        category = _categorize(code)
+        if category is not None and threading.get_ident() == self._thread:
+            self._close(code, category)
+
+    def _close(self, code: CodeType, category: str) -> None:
+        end = time.perf_counter()
+        while self._stack:
+            started, start = self._stack.pop()
+            if started is code:
+                self.span(code.co_qualname, category, start, end - start)
+                return
+
+
+TIMELINE = TimelineRecorder()
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--trace-out",
+        action="store",
+        default=None,
+        help="write session timeline (Chrome trace-event JSON) to given path, i.e.: reports/timeline.json",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Start recording and register hooks that add spans, if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    path = config.getoption("--trace-out")
+    if not path:
+        return
+    if hasattr(config, "workerinput"):  # pytest-xdist worker writes its own file
+        root, extension = os.path.splitext(path)
+        path = f"{root}-{config.workerinput['workerid']}{extension}"
+    elif getattr(config.option, "numprocesses", None):  # pytest-xdist controller runs no tests
+        return
+    COMMAND_TRACER.activate(TIMELINE.on_command)
+    TIMELINE.start()
+    config.pluginmanager.register(_TimelineHooks(path), "timeline_hooks")
+
+
+class _TimelineHooks:
+    """
+    Hooks active only with --trace-out.
+    """
+
+    def __init__(self, path: str) -> None:
+        """
+
+        :param path: output file path
+        """
+        self.path = path
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_fixture_setup(self, fixturedef) -> Generator[None]:
+        """
+        Add span of fixture setup.
+
+        :param fixturedef: fixture definition
+        :return: None
+        """
+        start = time.perf_counter()
+        yield
+        TIMELINE.span(
+            f"fixture {fixturedef.argname}", "fixture", start, time.perf_counter() - start, scope=fixturedef.scope
+        )
+
+    @pytest.hookimpl(hookwrapper=True)
+    def pytest_runtest_protocol(self, item) -> Generator[None]:
+        """
+        Add span of the whole test (including its setup and teardown).
+
+        :param item: test item
+        :return: None
+        """
+        start = time.perf_counter()
+        yield
+        TIMELINE.span(item.nodeid, "test", start, time.perf_counter() - start)
+
+    def pytest_runtest_logreport(self, report) -> None:
+        """
+        Add span of test phase.
+
+        :param report: test phase report
+        :return: None
+        """
+        start = TIMELINE.to_perf_counter(report.start)
+        TIMELINE.span(report.when, "test", start, report.stop - report.start, outcome=report.outcome)
+
+    def pytest_sessionfinish(self) -> None:
+        """
+        Stop recording and write the timeline.
+
+        :return: None
+        """
+        TIMELINE.stop()
+        TIMELINE.save(self.path)
+
+    def pytest_terminal_summary(self, terminalreporter) -> None:
+        """
+        Print path of the timeline.
+
+        :param terminalreporter: terminal reporter object
+        :return: None
+        """
+        terminalreporter.write_line(f"Timeline saved: {self.path}")
@@ -0,0 +1,55 @@
+"""
+Pytest plugin isolating test classes in WebDriver BiDi user contexts of one long-lived browser, i.e.:
+    >> pytest --user-contexts
+
+Instead of launching a new browser for each test class, ``browser_instance`` creates a new user context (isolated
+cookies and storage) with its own tab and removes it after the class - it takes milliseconds instead of seconds of
+the browser start-up. The browser is launched on first use and quitted at the end of the session (once per
+pytest-xdist worker).
+"""
+
+import pytest
+
+from utilities.user_contexts import USER_CONTEXTS
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--user-contexts",
+        action="store_true",
+        default=False,
+        help="isolate test classes in WebDriver BiDi user contexts of one long-lived browser (chrome, edge, firefox)",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Enable user contexts, if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    USER_CONTEXTS.enabled = config.getoption("--user-contexts")
+    if not USER_CONTEXTS.enabled:
+        return
+    if config.getoption("--browser-name") not in USER_CONTEXTS.SUPPORTED_BROWSERS:
+        raise pytest.UsageError(f"--user-contexts supports only: {', '.join(USER_CONTEXTS.SUPPORTED_BROWSERS)}")
+    # both hand over the whole browser instead of an isolated context
+    for option in ("--page-affinity", "--concurrent-tabs"):
+        if config.getoption(option):
+            raise pytest.UsageError(f"--user-contexts cannot be used with {option}")
+
+
+def pytest_sessionfinish() -> None:
+    """
+    Quit the long-lived browser.
+
+    :return: None
+    """
+    USER_CONTEXTS.shutdown()
@@ -0,0 +1,82 @@
+"""
+Pytest plugin tracing WebDriver commands (HTTP round trips to the driver), i.e.:
+    >> pytest --trace-webdriver
+
+Each command is recorded with its name, duration and the page/control method that issued it. At the end of the
+session totals per test, per command type and per issuing method are printed.
+
+Other plugins subscribe to recorded commands through ``COMMAND_TRACER.listeners`` (see: utilities/webdriver_tracer.py).
+"""
+
+from __future__ import annotations
+
+from typing import Any, Generator
+
+import pytest
+
+from utilities.webdriver_tracer import COMMAND_TRACER, SESSION_NODEID
+
+
+def pytest_addoption(parser) -> None:
+    """
+    Add command line options to pytest.
+
+    :param parser: parser for command line arguments and ini-file values.
+    :return: None
+    """
+    parser.addoption(
+        "--trace-webdriver",
+        action="store_true",
+        default=False,
+        help="record WebDriver commands and print totals per test, command type and issuing method",
+    )
+
+
+def pytest_configure(config) -> None:
+    """
+    Activate tracing if requested.
+
+    :param config: pytest config object
+    :return: None
+    """
+    if config.getoption("--trace-webdriver"):
+        COMMAND_TRACER.activate()
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_fixture_setup(fixturedef) -> Generator[None, Any, None]:
+    """
+    Instrument WebDriver created by ``browser_instance`` fixture.
+
+    :param fixturedef: fixture definition
+    :return: None
+    """
+    outcome = yield
+    if fixturedef.argname == "browser_instance" and outcome.excinfo is None:
+        COMMAND_TRACER.instrument(outcome.get_result().driver)
+
+
+@pytest.hookimpl(hookwrapper=True)
+def pytest_runtest_protocol(item) -> Generator[None]:
+    """
+    Attribute commands to the running test (including its setup and teardown).
+
+    :param item: test item
+    :return: None
+    """
+    COMMAND_TRACER.nodeid = item.nodeid
+    yield
+    COMMAND_TRACER.nodeid = SESSION_NODEID
+
+
+def pytest_terminal_summary(terminalreporter, config) -> None:
+    """
+    Print recorded WebDriver commands.
+
+    :param terminalreporter: terminal reporter object
+    :param config: pytest config object
+    :return: None
+    """
+    if config.getoption("--trace-webdriver") and COMMAND_TRACER.per_test:
+        terminalreporter.write_sep("=", "WebDriver command trace")
+        COMMAND_TRACER.report(terminalreporter)
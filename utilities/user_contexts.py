@@ -0,0 +1,109 @@
+"""
+Contains UserContexts class - isolates test classes in WebDriver BiDi user contexts of one long-lived browser
+(see: utilities/plugins/user_contexts.py).
+"""
+
+from __future__ import annotations
+
+from selenium import webdriver
+from selenium.common import WebDriverException
+from selenium.webdriver.remote.webdriver import WebDriver
+
+from utilities.browsers import chrome_options, launch_chrome, launch_edge, launch_firefox
+from utilities.logger import get_logger
+
+
+def _launch(browser_name: str) -> WebDriver:
+    """
+    Launches the long-lived browser with WebDriver BiDi enabled.
+
+    :param browser_name: "chrome", "edge" or "firefox"
+    :return: WebDriver
+    """
+    if browser_name == "firefox":
+        firefox_options = webdriver.FirefoxOptions()
+        firefox_options.enable_bidi = True
+        return launch_firefox(firefox_options)
+    if browser_name == "edge":
+        edge_options = webdriver.EdgeOptions()
+        edge_options.enable_bidi = True
+        return launch_edge(edge_options)
+    options = chrome_options()
+    options.enable_bidi = True
+    return launch_chrome(options)
+
+
+class UserContexts:
+    """
+    Keeps one browser for the whole session and gives each test class a new user context (separate cookies, storage
+    and cache - like a new browser profile) with its own tab, i.e.:
+        >> driver = USER_CONTEXTS.open("chrome")  # in browser_instance fixture setup
+        >> USER_CONTEXTS.close()                  # in browser_instance fixture teardown - state of the class is dropped
+    """
+
+    SUPPORTED_BROWSERS = ("chrome", "edge", "firefox")
+
+    def __init__(self) -> None:
+        self.enabled = False
+        self.logger = get_logger(__name__)
+        self._driver: WebDriver | None = None
+        self._home = ""  # window handle in the default user context - keeps the browser open between classes
+        self._context: str | None = None  # user context of the running test class
+
+    def open(self, browser_name: str) -> WebDriver:
+        """
+        Creates a new user context with a tab and switches the driver to it (the browser is launched on first use and
+        relaunched if it does not respond, i.e.: after a crash).
+
+        :param browser_name: "chrome", "edge" or "firefox"
+        :return: WebDriver of the long-lived browser
+        """
+        if self._driver is not None:
+            try:
+                return self._open_context(self._driver)
+            except WebDriverException:
+                self.logger.warning("Long-lived browser does not respond - relaunched.", exc_info=True)
+                self.shutdown()
+        self._driver = _launch(browser_name)
+        self._home = self._driver.current_window_handle
+        self.logger.info("Long-lived browser launched for user contexts.")
+        return self._open_context(self._driver)
+
+    def _open_context(self, driver: WebDriver) -> WebDriver:
+        self._context = driver.browser.create_user_context()
+        tab = driver.browsing_context.create(type="tab", user_context=self._context)
+        driver.switch_to.window(tab)  # id of top-level browsing context is its window handle
+        return driver
+
+    def close(self) -> None:
+        """
+        Removes user context of the running test class (its tabs are closed as well).
+
+        :return: None
+        """
+        if self._driver is None or self._context is None:
+            return
+        context, self._context = self._context, None
+        try:
+            self._driver.browser.remove_user_context(context)
+        finally:
+            self._driver.switch_to.window(self._home)
+
+    def shutdown(self) -> None:
+        """
+        Quits the long-lived browser.
+
+        :return: None
+        """
+        driver, self._driver, self._context = self._driver, None, None
+        if driver is None:
+            return
+        try:
+            driver.quit()
+        except WebDriverException:
+            self.logger.warning("Long-lived browser cannot be quitted.", exc_info=True)
+        else:
+            self.logger.info("Long-lived browser quitted.")
+
+
+USER_CONTEXTS = UserContexts()
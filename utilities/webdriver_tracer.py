@@ -0,0 +1,150 @@
+"""
+Contains CommandTracer class - records WebDriver commands (HTTP round trips to the driver) of instrumented drivers
+(see: utilities/plugins/webdriver_tracer.py).
+
+Other plugins subscribe to recorded commands through ``COMMAND_TRACER.listeners`` (see: CommandTracer.activate()).
+"""
+
+from __future__ import annotations
+
+import sys
+import time
+from typing import Any, Callable, Dict, List, NamedTuple
+
+from selenium.webdriver.remote.webdriver import WebDriver
+
+SESSION_NODEID = "<session>"
+TOP_ENTRIES = 15
+
+
+class CommandEvent(NamedTuple):
+    """
+    Single WebDriver command.
+    """
+
+    nodeid: str
+    command: str
+    issuer: str
+    start: float
+    duration: float
+
+
+class _Totals:
+    """
+    Number of commands and their total duration in [s].
+    """
+
+    # pylint: disable=too-few-public-methods
+
+    def __init__(self) -> None:
+        self.count = 0
+        self.duration = 0.0
+
+    def add(self, duration: float) -> None:
+        """
+        Adds a command to the totals.
+
+        :param duration: command duration in [s]
+        :return: None
+        """
+        self.count += 1
+        self.duration += duration
+
+
+class CommandTracer:
+    """
+    Wraps WebDriver.execute() of instrumented drivers and records executed commands.
+    """
+
+    def __init__(self) -> None:
+        self.active = False
+        self.nodeid = SESSION_NODEID
+        self.listeners: List[Callable[[CommandEvent], None]] = []
+        self.per_test: Dict[str, _Totals] = {}
+        self.per_command: Dict[str, _Totals] = {}
+        self.per_issuer: Dict[str, _Totals] = {}
+
+    def activate(self, listener: Callable[[CommandEvent], None] | None = None) -> None:
+        """
+        Turns tracing on for drivers instrumented from now on.
+
+        :param listener: optional callable receiving every recorded CommandEvent
+        :return: None
+        """
+        self.active = True
+        if listener is not None:
+            self.listeners.append(listener)
+
+    def instrument(self, driver: WebDriver) -> WebDriver:
+        """
+        Wraps driver's command execution if tracing is active (no-op otherwise).
+
+        :param driver: WebDriver for current browser, i.e.: webdriver.Chrome()
+        :return: the same driver
+        """
+        if not self.active or "execute" in vars(driver):
+            return driver
+        execute = driver.execute
+
+        def traced_execute(driver_command: str, params: Dict[str, Any] | None = None) -> Dict[str, Any]:
+            start = time.perf_counter()
+            try:
+                return execute(driver_command, params)
+            finally:
+                self.record(driver_command, start, time.perf_counter() - start)
+
+        setattr(driver, "execute", traced_execute)
+        return driver
+
+    def record(self, command: str, start: float, duration: float) -> None:
+        """
+        Records executed command.
+
+        :param command: WebDriver command name, i.e.: "findElement"
+        :param start: time.perf_counter() value at the beginning of the command
+        :param duration: command duration in [s]
+        :return: None
+        """
+        event = CommandEvent(self.nodeid, command, self._find_issuer(), start, duration)
+        self.per_test.setdefault(event.nodeid, _Totals()).add(duration)
+        self.per_command.setdefault(event.command, _Totals()).add(duration)
+        self.per_issuer.setdefault(event.issuer, _Totals()).add(duration)
+        for listener in self.listeners:
+            listener(event)
+
+    @staticmethod
+    def _find_issuer() -> str:
+        """
+        Finds the innermost caller outside Selenium and this module - page/control method or test function.
+
+        :return: qualified name of the issuing function, i.e.: "_BaseControl.__init__"
+        """
+        frame = sys._getframe(2)  # pylint: disable=protected-access
+        while frame is not None:
+            module = frame.f_globals.get("__name__", "")
+            if not module.startswith("selenium") and module != __name__:
+                return frame.f_code.co_qualname
+            frame = frame.f_back  # type: ignore[assignment]
+        return "<unknown>"
+
+    def report(self, terminalreporter) -> None:
+        """
+        Prints totals per test, per command type and per issuing method.
+
+        :param terminalreporter: terminal reporter object
+        :return: None
+        """
+        for title, totals in (
+            ("per test", self.per_test),
+            ("per command type", self.per_command),
+            ("per issuing method", self.per_issuer),
+        ):
+            terminalreporter.write_sep("-", f"WebDriver commands {title}")
+            terminalreporter.write_line(f"{'commands':>10}{'time [s]':>12}{'mean [ms]':>12}  name")
+            ranked = sorted(totals.items(), key=lambda item: -item[1].duration)
+            for name, total in ranked if title == "per test" else ranked[:TOP_ENTRIES]:
+                mean_ms = total.duration / total.count * 1000
+                terminalreporter.write_line(f"{total.count:>10}{total.duration:>12.2f}{mean_ms:>12.1f}  {name}")
+
+
+COMMAND_TRACER = CommandTracer()